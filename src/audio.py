@@ -1,12 +1,197 @@
 import json
-from typing import List, Optional, Any
+import math
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 # 사운드 관련 설정 및 경로 임포트
 from config.sound import SoundType, SoundConfig  # 사운드 타입 및 상수 정의
 from config.paths import ASSETS_DIR  # 에셋 디렉토리 경로
+from config.app.constants import APP_FPS
 
 import pyxel as px
 
+# 음악 파일 이름 패턴 (`MusicRegistry.preload`가 미리 읽는 파일)
+MUSIC_FILE_PATTERN = "music_*.json"
+
+# 음악에 쓰는 사운드 채널/슬롯 수 (SoundType.RESERVED_MUSIC_0~3)
+NUM_MUSIC_CHANNELS = 4
+
+# pyxel 사운드의 1초당 틱 수 (Sound.speed는 음표 하나의 틱 수)
+TICKS_PER_SECOND = 120
+TICKS_PER_FRAME = TICKS_PER_SECOND / APP_FPS
+
+
+class Music:
+    """
+    파싱해 둔 음악 한 곡
+
+    채널별 사운드 데이터(`px.Sound.set` 인자)를 가지고 있으며, 처음 재생할 때
+    채널별 `px.Sound` 객체를 한 번만 만들어 둡니다. 예전처럼 리스트로 다룰 수 있도록
+    `len()`, 반복, 인덱싱을 지원합니다.
+
+    ### 속성
+    - `file`: 음악 파일명
+    - `data`: 채널별 사운드 데이터 (JSON 그대로)
+    """
+
+    __slots__ = ("file", "data", "_sounds", "_length_ticks")
+
+    def __init__(self, file: Optional[str], data: List[List[Any]]) -> None:
+        self.file = file
+        self.data = data
+        self._sounds: Optional[Tuple[Any, ...]] = None
+        self._length_ticks: Optional[int] = None
+
+    def __reduce__(self):
+        # 파일에서 읽은 곡은 이름만 저장하고 `music_registry`에서 다시 찾습니다. (스냅샷 등)
+        if self.file is not None:
+            return _registered_music, (self.file,)
+        return Music, (None, self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def sounds(self) -> Tuple[Any, ...]:
+        """
+        채널별 `px.Sound` 객체를 반환합니다. (처음 호출할 때 한 번만 만듦)
+
+        pyxel 객체를 만들므로 메인 스레드에서 호출해야 합니다.
+        """
+        if self._sounds is None:
+            sounds = []
+            for sound_data in self.data:
+                sound = px.Sound()
+                sound.set(*sound_data)
+                sounds.append(sound)
+            self._sounds = tuple(sounds)
+        return self._sounds
+
+    def length_ticks(self) -> int:
+        """
+        첫 채널(재생 여부를 판단하는 채널)의 길이를 틱 단위로 반환합니다.
+
+        `px.Sound`를 만들지 않고 JSON 데이터(음표 수 x 속도)로 계산하므로
+        `NullAudio`처럼 pyxel 오디오를 쓰지 않는 경로에서도 부담 없이 호출할 수 있습니다.
+        """
+        if self._length_ticks is None:
+            if self.data:
+                notes, _, _, _, speed = self.data[0]
+                self._length_ticks = count_notes(notes) * speed
+            else:
+                self._length_ticks = 0
+        return self._length_ticks
+
+
+def count_notes(notes: Union[str, List[int]]) -> int:
+    """
+    `px.Sound.set`에 넘기는 음표 데이터의 음표 수를 셉니다.
+
+    음표 문자열은 음표마다 음이름(a~g, 뒤에 #/-와 옥타브 숫자) 또는 쉼표(r) 하나로
+    시작하므로, 그 글자 수가 곧 음표 수입니다. (공백은 무시)
+
+    ### 파라미터
+    - `notes`: 음표 문자열 또는 음표 번호 목록
+
+    ### 반환값
+    - 음표 수
+    """
+    if not isinstance(notes, str):
+        return len(notes)
+    return sum(1 for char in notes.lower() if char in "abcdefgr")
+
+
+class MusicRegistry:
+    """
+    음악 파일 저장소
+
+    음악 파일(JSON)을 파일당 한 번만 읽고 파싱해 `Music`으로 보관합니다.
+    상태가 바뀔 때마다 파일을 다시 열지 않도록 `AudioManager.load_music`이 이 저장소를
+    사용합니다. `preload_async()`로 시작할 때 백그라운드 스레드에서 모든 음악을 미리
+    읽어 둘 수 있습니다.
+
+    ### 속성
+    - `music_dir`: 음악 파일 디렉토리
+    """
+
+    def __init__(self, music_dir: Union[str, Path] = ASSETS_DIR) -> None:
+        self.music_dir = Path(music_dir)
+        self._music: Dict[str, Music] = {}
+        self._lock = threading.Lock()
+        self._preload_thread: Optional[threading.Thread] = None
+
+    def get(self, file: str) -> Music:
+        """
+        음악을 반환합니다. 처음 요청한 파일이면 읽어서 파싱합니다.
+
+        ### 파라미터
+        - `file` (`str`): 음악 파일명 (확장자 포함)
+
+        ### 반환값
+        - (`Music`): 파싱된 음악
+        """
+        music = self._music.get(file)
+        if music is not None:
+            return music
+        with open(self.music_dir / file, "rt") as fin:
+            data = json.loads(fin.read())
+        with self._lock:
+            # 다른 스레드가 먼저 읽었으면 그 결과를 씁니다.
+            return self._music.setdefault(file, Music(file, data))
+
+    def preload(self, files: Optional[Iterable[str]] = None) -> None:
+        """
+        음악 파일을 미리 읽어 둡니다.
+
+        ### 파라미터
+        - `files` (`Optional[Iterable[str]]`): 읽을 파일명 목록 (기본값: `MUSIC_FILE_PATTERN`에 맞는 모든 파일)
+        """
+        if files is None:
+            files = sorted(path.name for path in self.music_dir.glob(MUSIC_FILE_PATTERN))
+        for file in files:
+            self.get(file)
+
+    def preload_async(self, files: Optional[Iterable[str]] = None) -> threading.Thread:
+        """
+        백그라운드 스레드에서 `preload()`를 실행합니다. (스레드가 없는 웹 환경에서는 쓰지 마세요)
+
+        ### 반환값
+        - (`threading.Thread`): 미리 읽기 스레드 (데몬)
+        """
+        if self._preload_thread is None or not self._preload_thread.is_alive():
+            self._preload_thread = threading.Thread(
+                target=self.preload, args=(files,), name="music-preload", daemon=True
+            )
+            self._preload_thread.start()
+        return self._preload_thread
+
+    def clear(self) -> None:
+        """보관한 음악을 모두 버립니다."""
+        with self._lock:
+            self._music.clear()
+        _channel_music[:] = [None] * NUM_MUSIC_CHANNELS
+
+
+# 프로세스 전체에서 공유하는 음악 저장소
+music_registry = MusicRegistry()
+
+
+
+def _registered_music(file: str) -> Music:
+    """pickle로 저장한 `Music`을 `music_registry`의 같은 곡으로 되돌립니다."""
+    return music_registry.get(file)
+
+
+# 음악 채널별로 현재 px.sounds 슬롯에 들어 있는 곡.
+# 같은 곡을 다시 재생할 때는 슬롯을 다시 설정하지 않습니다.
+_channel_music: List[Optional[Music]] = [None] * NUM_MUSIC_CHANNELS
+
 
 class AudioManager:
     """
@@ -38,31 +223,38 @@ class AudioManager:
         # 현재 게인값 초기화
         self.gain = SoundConfig.SOUND_CHANNEL_GAIN_DEFAULT
 
-    def load_music(self, file: str) -> List[List[Any]]:
+    def attach(self, game) -> None:
         """
-        JSON 파일로부터 음악 데이터를 로드합니다.
+        오디오 백엔드를 사용할 게임을 연결합니다. (`Game`이 생성될 때 호출)
+
+        pyxel 오디오는 실제 재생 상태를 쓰므로 아무것도 하지 않습니다.
+
+        ### 파라미터
+        - `game`: 게임 객체
+        """
+
+    def load_music(self, file: str) -> Music:
+        """
+        음악 데이터를 로드합니다.
+
+        `music_registry`에 파싱해 둔 결과를 돌려주므로, 파일은 처음 한 번만 읽습니다.
 
         ### 파라미터
         - `file` (`str`): 로드할 음악 파일명 (확장자 포함)
 
         ### 반환값
-        - (`List[List[Any]]`): 로드된 음악 데이터
+        - (`Music`): 로드된 음악 데이터
 
         ### 사용 예시
         ```python
         music_data = audio_manager.load_music("title_music.json")
         ```
         """
-        with open(
-            ASSETS_DIR / file, "rt"
-        ) as fin:  # 지정된 경로의 파일을 텍스트 모드로 읽기 위해 오픈
-            return json.loads(
-                fin.read()
-            )  # 파일 내용을 읽어 JSON 데이터로 파싱하여 반환
+        return music_registry.get(file)
 
     def play_music(
         self,
-        music: List[List[Any]],
+        music: Union[Music, List[List[Any]]],
         doLoop: bool = True,
         num_channels: int = 4,
         theTick: Optional[int] = None,
@@ -70,8 +262,11 @@ class AudioManager:
         """
         음악을 재생합니다.
 
+        `Music`이면 채널에 이미 같은 곡이 들어 있을 때 사운드를 다시 설정하지 않고
+        미리 만들어 둔 `px.Sound`를 바꿔 끼웁니다.
+
         ### 파라미터
-        - `music` (`List[List[Any]]`): 재생할 음악 데이터
+        - `music` (`Union[Music, List[List[Any]]]`): 재생할 음악 데이터
         - `doLoop` (`bool`): 루프 재생 여부 (기본값: `True`)
         - `num_channels` (`int`): 사용 채널 수 (기본값: 4)
         - `theTick` (`Optional[int]`): 시작 틱 (기본값: `None`)
@@ -81,8 +276,19 @@ class AudioManager:
         audio_manager.play_music(music_data, doLoop=True, num_channels=3)
         ```
         """
-        for ch, sound in enumerate(music):  # 음악 데이터 내 각 사운드에 대해 반복
-            px.sounds[ch].set(*sound)  # type: ignore  # 사운드 설정
+        is_cached = isinstance(music, Music)
+        sounds = music.sounds() if is_cached else music
+        for ch, sound in enumerate(sounds):  # 음악 데이터 내 각 사운드에 대해 반복
+            if is_cached:
+                if _channel_music[ch] is not music:  # 곡이 바뀐 채널만 설정
+                    px.sounds[ch] = sound
+                    _channel_music[ch] = music
+            else:
+                # 공유 중인 Music의 Sound를 덮어쓰지 않도록 새 Sound를 만듦
+                new_sound = px.Sound()
+                new_sound.set(*sound)  # type: ignore  # 사운드 설정
+                px.sounds[ch] = new_sound
+                _channel_music[ch] = None
             px.play(ch, ch, tick=theTick, loop=doLoop)  # 사운드 재생
             if ch == num_channels - 1:  # 지정된 채널 수까지만 재생
                 break
@@ -211,3 +417,111 @@ class AudioManager:
         """
         # 사운드 채널의 사운드 재생을 중지
         px.stop(SoundConfig.SOUND_CHANNEL)
+
+
+class NullAudio(AudioManager):
+    """
+    소리를 내지 않는 오디오 백엔드
+
+    pyxel 오디오 API를 전혀 호출하지 않으므로 헤드리스 실행과 학습에서 오디오 비용이
+    들지 않습니다. 음악 재생 여부(`is_music_playing`)는 실제 재생 대신 곡 길이와
+    게임 프레임(`Game.frame_count`)으로 계산하므로, 음악이 끝나기를 기다리는 로직
+    (스테이지 클리어 등)이 벽시계 시간과 관계없이 항상 같은 프레임에 진행됩니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._game = None
+        # 음악이 끝나는 프레임 (None: 재생 중 아님, inf: 반복 재생)
+        self._music_end_frame: Optional[float] = None
+
+    def attach(self, game) -> None:
+        self._game = game
+
+    def _frame(self) -> int:
+        return self._game.frame_count if self._game is not None else 0
+
+    def play_music(
+        self,
+        music: Union[Music, List[List[Any]]],
+        doLoop: bool = True,
+        num_channels: int = 4,
+        theTick: Optional[int] = None,
+    ) -> None:
+        if doLoop:
+            self._music_end_frame = math.inf
+            return
+        if not isinstance(music, Music):
+            music = Music(None, music)
+        remaining = max(0, music.length_ticks() - (theTick or 0))
+        self._music_end_frame = self._frame() + math.ceil(remaining / TICKS_PER_FRAME)
+
+    def reset_music_gain(self, num_channels: int = 4) -> None:
+        pass
+
+    def fade_out_music(self, num_channels: int = 4) -> float:
+        # AudioManager.fade_out_music와 같은 게인 계산 (채널 게인 설정만 생략)
+        if self.gain > 0:
+            self.gain = max(0, self.gain - 0.001)
+            if self.gain == 0:
+                self.stop_music(num_channels)
+        return self.gain
+
+    def stop_music(self, num_channels: int = 4) -> None:
+        self._music_end_frame = None
+
+    def is_music_playing(self) -> bool:
+        end = self._music_end_frame
+        return end is not None and self._frame() < end
+
+    def play_sound(
+        self, sound: SoundType, doLoop: bool = False, priority: bool = False
+    ) -> None:
+        pass
+
+    def stop_sound(self) -> None:
+        pass
+
+
+class RecordingAudio(NullAudio):
+    """
+    오디오 이벤트를 기록하는 오디오 백엔드
+
+    `NullAudio`처럼 소리를 내지 않으면서, 음악/효과음 요청을 게임 프레임과 함께
+    `events`에 기록합니다. 테스트나 리플레이에서 소리 타이밍을 확인할 때 사용합니다.
+
+    ### 속성
+    - `events`: `(프레임, 이벤트 이름, 인자 튜플)` 목록
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: List[Tuple[int, str, Tuple[Any, ...]]] = []
+
+    def _record(self, name: str, *args: Any) -> None:
+        self.events.append((self._frame(), name, args))
+
+    def play_music(
+        self,
+        music: Union[Music, List[List[Any]]],
+        doLoop: bool = True,
+        num_channels: int = 4,
+        theTick: Optional[int] = None,
+    ) -> None:
+        self._record("play_music", getattr(music, "file", None), doLoop, theTick)
+        super().play_music(music, doLoop, num_channels, theTick)
+
+    def reset_music_gain(self, num_channels: int = 4) -> None:
+        self._record("reset_music_gain")
+
+    def stop_music(self, num_channels: int = 4) -> None:
+        self._record("stop_music")
+        super().stop_music(num_channels)
+
+    def play_sound(
+        self, sound: SoundType, doLoop: bool = False, priority: bool = False
+    ) -> None:
+        self._record("play_sound", sound, priority)
+
+    def stop_sound(self) -> None:
+        self._record("stop_sound")
@@ -0,0 +1,393 @@
+from array import array
+from typing import Iterator, Optional
+
+import pyxel as px
+
+try:
+    import numpy as np
+except ImportError:  # 웹 빌드 등 NumPy가 없는 환경에서는 array 모듈 배열과 Python 반복을 씁니다.
+    np = None
+
+from components.entity_types import EntityType
+from components.enemy_shot import ENEMY_SHOT_SIZE, ENEMY_SHOT_U, ENEMY_SHOT_V
+from config.app.constants import APP_WIDTH, APP_HEIGHT
+from config.enemy.enemy_config import EnemyConfig
+
+# 적 설정 인스턴스 생성
+enemy_config = EnemyConfig()
+
+# 풀의 초기 크기. 가득 차면 두 배씩 늘립니다.
+DEFAULT_BULLET_CAPACITY = 256
+
+# 발사체 속성 배열 이름 → (NumPy dtype, array 모듈 타입 코드) (스냅샷 저장 순서)
+# 두 경로의 원소 크기가 같으므로 스냅샷 바이트는 NumPy 유무와 관계없이 호환됩니다.
+_POOL_ARRAYS = {
+    "x": ("float64", "d"),
+    "y": ("float64", "d"),
+    "vx": ("float64", "d"),
+    "vy": ("float64", "d"),
+    "delay": ("int32", "i"),
+    "damage": ("int32", "i"),
+    "alive": ("bool", "b"),
+}
+
+
+class EnemyShotRef:
+    """
+    `BulletPool`의 한 슬롯을 `EnemyShot`처럼 다루기 위한 참조 객체.
+
+    기존 코드(충돌 처리, 데이터 수집 라벨러 등)가 읽는 속성만 제공하며, 값은 풀의
+    배열에서 직접 읽고 씁니다. 풀이 압축(update)되면 인덱스가 바뀌므로 프레임을
+    넘겨 보관하지 마세요.
+
+    속성:
+        pool (BulletPool): 소속 풀
+        index (int): 풀 내 슬롯 인덱스
+    """
+
+    __slots__ = ("pool", "index")
+
+    type = EntityType.ENEMY_SHOT
+    w = ENEMY_SHOT_SIZE
+    h = ENEMY_SHOT_SIZE
+
+    def __init__(self, pool: "BulletPool", index: int) -> None:
+        self.pool = pool
+        self.index = index
+
+    @property
+    def x(self) -> float:
+        return float(self.pool.x[self.index])
+
+    @property
+    def y(self) -> float:
+        return float(self.pool.y[self.index])
+
+    @property
+    def dx(self) -> float:
+        return float(self.pool.vx[self.index])
+
+    @property
+    def dy(self) -> float:
+        return float(self.pool.vy[self.index])
+
+    @property
+    def delay(self) -> int:
+        return int(self.pool.delay[self.index])
+
+    @property
+    def damage(self) -> int:
+        return int(self.pool.damage[self.index])
+
+    @property
+    def remove(self) -> bool:
+        return not self.pool.alive[self.index]
+
+    @remove.setter
+    def remove(self, value: bool) -> None:
+        self.pool.alive[self.index] = not value
+
+    def collided_with(self, other) -> None:
+        """
+        충돌 처리. (`EnemyShot.collided_with`와 같음)
+
+        매개변수:
+            other: 충돌한 객체
+        """
+        if other.type == EntityType.PLAYER:
+            other.take_damage(self.damage)  # 플레이어에게 데미지 주기
+            self.remove = True  # 발사체 제거
+
+
+class BulletPool:
+    """
+    적 발사체를 NumPy 배열(구조체 배열 대신 배열 구조체)로 저장하는 풀.
+
+    NumPy가 없으면(웹 빌드) 같은 배열을 `array.array`로 만들고 이동/충돌을 Python
+    반복으로 처리합니다. 두 경로의 결과는 같습니다.
+
+    `EnemyShot` 객체를 발사체마다 만드는 대신 위치/속도/지연/데미지/생존 여부를
+    미리 할당한 배열에 저장하고, 이동과 화면 밖 제거를 배열 연산으로 한 번에
+    처리합니다. `EnemyShot` 목록과 같은 규칙으로 동작합니다:
+
+    - 지연 중인 발사체는 지연만 줄이고 움직이지 않습니다.
+    - 충돌로 제거된 발사체는 그 프레임에는 그대로 그려지고 다음 `update()`에서 빠집니다.
+    - 배경 충돌은 기본적으로 검사하지 않습니다. (`collide_background=True`로 켤 수 있음)
+
+    `len()`, 반복, 인덱싱, `append()`, `clear()`를 지원하므로 `trigger_bomb`이나
+    데이터 수집 라벨러처럼 목록을 기대하는 코드에서 그대로 쓸 수 있습니다.
+    반복 시에는 슬롯마다 `EnemyShotRef`를 돌려줍니다.
+
+    속성:
+        game_state: 게임 상태 객체
+        collide_background (bool): 배경 타일과 충돌한 발사체를 제거할지 여부
+        x, y (np.ndarray): 위치 좌표 (float64, NumPy가 없으면 `array('d')`)
+        vx, vy (np.ndarray): 이동 속도 (float64, `array('d')`)
+        delay (np.ndarray): 발사 지연 시간 (int32, `array('i')`)
+        damage (np.ndarray): 플레이어에게 주는 데미지 (int32, `array('i')`)
+        alive (np.ndarray): 생존 여부 (bool, `array('b')`)
+        count (int): 사용 중인 슬롯 수 (앞쪽부터 채움)
+    """
+
+    def __init__(
+        self,
+        game_state,
+        capacity: int = DEFAULT_BULLET_CAPACITY,
+        collide_background: bool = False,
+    ) -> None:
+        """
+        발사체 풀 초기화.
+
+        매개변수:
+            game_state: 게임 상태 객체
+            capacity (int): 초기 슬롯 수
+            collide_background (bool): 배경 충돌 검사 여부 (기본값: False)
+        """
+        self.game_state = game_state
+        self.collide_background = collide_background
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        for name, (dtype, typecode) in _POOL_ARRAYS.items():
+            if np is not None:
+                arr = np.zeros(capacity, dtype=dtype)
+            else:
+                arr = array(typecode, bytes(capacity * array(typecode).itemsize))
+            setattr(self, name, arr)
+
+    def _grow(self) -> None:
+        """슬롯 수를 두 배로 늘립니다."""
+        n = self.count
+        old = (self.x, self.y, self.vx, self.vy, self.delay, self.damage, self.alive)
+        self._allocate(len(self.x) * 2)
+        new = (self.x, self.y, self.vx, self.vy, self.delay, self.damage, self.alive)
+        for src, dst in zip(old, new):
+            dst[:n] = src[:n]
+
+    def __getstate__(self) -> dict:
+        """
+        스냅샷용 상태. 사용 중인 슬롯만 원시 바이트로 저장합니다.
+        (배열 객체를 그대로 pickle하는 것보다 몇 배 빠릅니다.)
+        """
+        n = self.count
+        state = self.__dict__.copy()
+        for name in _POOL_ARRAYS:
+            state[name] = state[name][:n].tobytes()
+        state["_capacity"] = self.capacity
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        capacity = state.pop("_capacity")
+        saved = {name: state.pop(name) for name in _POOL_ARRAYS}
+        self.__dict__.update(state)
+        self._allocate(capacity)
+        n = self.count
+        for name, data in saved.items():
+            arr = getattr(self, name)
+            if np is not None:
+                arr[:n] = np.frombuffer(data, dtype=arr.dtype)
+            else:
+                values = array(arr.typecode)
+                values.frombytes(data)
+                arr[:n] = values
+
+    @property
+    def capacity(self) -> int:
+        return len(self.x)
+
+    @property
+    def size(self) -> int:
+        """발사체 한 변의 크기 (픽셀)"""
+        return ENEMY_SHOT_SIZE
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        dx: float,
+        dy: float,
+        delay: int = 0,
+        damage: Optional[int] = None,
+    ) -> int:
+        """
+        발사체를 하나 추가합니다.
+
+        매개변수:
+            x, y (float): 초기 위치 좌표
+            dx, dy (float): 이동 속도
+            delay (int): 발사 지연 시간
+            damage (Optional[int]): 데미지 (None이면 `enemy_config.shot_damage`)
+
+        반환값:
+            int: 추가된 슬롯 인덱스
+        """
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = dx
+        self.vy[i] = dy
+        self.delay[i] = delay
+        self.damage[i] = enemy_config.shot_damage if damage is None else damage
+        self.alive[i] = True
+        self.count = i + 1
+        return i
+
+    def append(self, shot) -> None:
+        """`EnemyShot` 객체의 값을 복사해 추가합니다. (목록 호환용)"""
+        i = self.spawn(shot.x, shot.y, shot.dx, shot.dy, shot.delay, shot.damage)
+        self.alive[i] = not shot.remove
+
+    def clear(self) -> None:
+        """모든 발사체를 제거합니다."""
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> EnemyShotRef:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("BulletPool index out of range")
+        return EnemyShotRef(self, index)
+
+    def __iter__(self) -> Iterator[EnemyShotRef]:
+        for i in range(self.count):
+            yield EnemyShotRef(self, i)
+
+    def update(self) -> None:
+        """
+        모든 발사체를 한 프레임 진행하고, 제거된 발사체를 배열 앞쪽으로 압축합니다.
+
+        압축은 남은 발사체의 순서를 유지하므로 그리기/충돌 처리 순서가 목록과 같습니다.
+        """
+        n = self.count
+        if n == 0:
+            return
+        if np is None:
+            self._update_python(n)
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        delay = self.delay[:n]
+        alive = self.alive[:n]
+
+        delayed = delay > 0
+        np.subtract(delay, 1, out=delay, where=delayed)
+        moving = ~delayed
+        x += np.where(moving, self.vx[:n], 0.0)
+        y += np.where(moving, self.vy[:n], 0.0)
+
+        # 화면 밖으로 나가면 제거
+        size = ENEMY_SHOT_SIZE
+        out = (x < -size) | (x > APP_WIDTH) | (y < -size) | (y > APP_HEIGHT)
+        alive &= ~(moving & out)
+
+        if self.collide_background:
+            alive &= ~(moving & self._hits_background(x, y))
+
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        if k == n:
+            return
+        for arr in (self.x, self.y, self.vx, self.vy, self.delay, self.damage):
+            arr[:k] = arr[keep]
+        self.alive[:k] = True
+        self.count = k
+
+    def _update_python(self, n: int) -> None:
+        """NumPy가 없을 때의 `update()`. (같은 규칙을 발사체마다 반복)"""
+        x, y, vx, vy, delay, alive = self.x, self.y, self.vx, self.vy, self.delay, self.alive
+        size = ENEMY_SHOT_SIZE
+        half = size / 2
+        background = self.game_state.background if self.collide_background else None
+        for i in range(n):
+            if delay[i] > 0:
+                delay[i] -= 1
+                continue
+            xi = x[i] + vx[i]
+            yi = y[i] + vy[i]
+            x[i] = xi
+            y[i] = yi
+            # 화면 밖으로 나가면 제거
+            if xi < -size or xi > APP_WIDTH or yi < -size or yi > APP_HEIGHT:
+                alive[i] = False
+            elif background is not None and background.is_point_colliding(
+                xi + half, yi + half
+            ):
+                alive[i] = False
+
+        keep = [i for i in range(n) if alive[i]]
+        k = len(keep)
+        if k == n:
+            return
+        for arr in (self.x, self.y, self.vx, self.vy, self.delay, self.damage):
+            arr[:k] = array(arr.typecode, [arr[i] for i in keep])
+        alive[:k] = array("b", [True]) * k
+        self.count = k
+
+    def _hits_background(self, x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        """
+        발사체 중심이 배경의 단단한 타일 위에 있는지 확인합니다.
+
+        `StageBackground.points_colliding`으로 스테이지의 충돌 맵을 한 번에 조회합니다.
+        """
+        half = ENEMY_SHOT_SIZE / 2
+        return self.game_state.background.points_colliding(x + half, y + half)
+
+    def draw(self) -> None:
+        """모든 발사체를 그립니다. (지연 중이거나 이번 프레임에 제거된 발사체 포함)"""
+        n = self.count
+        if n == 0:
+            return
+        blt = px.blt
+        size = ENEMY_SHOT_SIZE
+        for x, y in zip(self.x[:n].tolist(), self.y[:n].tolist()):
+            blt(x, y, 0, ENEMY_SHOT_U, ENEMY_SHOT_V, size, size, 0)
+
+    def collide_sprite(self, spr) -> None:
+        """
+        단일 스프라이트와 모든 발사체의 충돌을 처리합니다.
+
+        `sprite_collide_list(spr, enemy_shots)`와 같은 순서와 규칙으로
+        `collided_with`를 호출하며, 겹침 판정은 배열 연산으로 한 번에 수행합니다.
+
+        매개변수:
+            spr: 충돌을 검사할 스프라이트 (보통 플레이어)
+        """
+        n = self.count
+        if spr.remove or n == 0:
+            return
+        sx, sy = spr.x, spr.y
+        size = ENEMY_SHOT_SIZE
+        if np is None:
+            x, y, alive = self.x, self.y, self.alive
+            for i in range(n):
+                if not alive[i]:
+                    continue
+                xi = x[i]
+                yi = y[i]
+                if sx < xi + size and sx + spr.w > xi and sy < yi + size and sy + spr.h > yi:
+                    shot = EnemyShotRef(self, i)
+                    spr.collided_with(shot)
+                    shot.collided_with(spr)
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        mask = (
+            self.alive[:n]
+            & (sx < x + size)
+            & (sx + spr.w > x)
+            & (sy < y + size)
+            & (sy + spr.h > y)
+        )
+        alive = self.alive
+        for i in np.flatnonzero(mask).tolist():
+            if not alive[i]:
+                continue
+            shot = EnemyShotRef(self, i)
+            spr.collided_with(shot)
+            shot.collided_with(spr)
@@ -4,10 +4,8 @@ from components.sprite import Sprite
 from components.entity_types import EntityType
 from config.enemy.enemy_config import EnemyConfig
 from config.score.score_config import ENEMY_SCORE_NORMAL
-from components.enemy_shot import EnemyShot
 import powerup
 from config.sound import SoundType
-from audio import AudioManager
 
 # 적 설정 인스턴스 생성
 enemy_config = EnemyConfig()
@@ -19,9 +17,6 @@ INVINCIBLE_START_FRAMES: int = 15
 # 적 기본 데미지
 ENEMY_DAMAGE: int = 1
 
-# 오디오 매니저 인스턴스 생성
-audio_manager = AudioManager()
-
 class Enemy(Sprite):
     """
     적 객체를 나타내는 기본 클래스.
@@ -38,6 +33,8 @@ class Enemy(Sprite):
         remove (bool): 제거 여부
     """
 
+    __slots__ = ("type", "hp", "damage", "score", "lifetime", "hit_frames")
+
     type: EntityType
     x: int
     y: int
@@ -106,10 +103,10 @@ class Enemy(Sprite):
         self.hp = max(0, self.hp - dmg)  # 체력 감소
         if self.hp == 0:
             self.destroy()  # 체력이 0이면 제거 처리
-            audio_manager.play_sound(SoundType.ENEMY_EXPLOSION)
+            self.game_state.game.audio.play_sound(SoundType.ENEMY_EXPLOSION)
         else:
             self.hit_frames = enemy_config.hit_invincibility_frames  # 무적 프레임 설정
-            audio_manager.play_sound(SoundType.BLIP)  # 피격 사운드 재생
+            self.game_state.game.audio.play_sound(SoundType.BLIP)  # 피격 사운드 재생
 
     def hit_with_bomb(self) -> None:
         """폭탄에 의한 피격 처리."""
@@ -147,15 +144,13 @@ class Enemy(Sprite):
             delay (int): 발사 지연 시간
             offset_x, offset_y (int): 발사 위치 오프셋
         """
-        s = EnemyShot(
-            self.game_state,
+        self.game_state.spawn_enemy_shot(
             self.x + (self.w / 2) + offset_x,
             self.y + (self.h / 2) + offset_y,
             px.cos(degrees) * speed,
             px.sin(degrees) * speed,
             delay,
-        )
-        self.game_state.add_enemy_shot(s)  # 게임 상태에 총알 추가
+        )  # 게임 상태의 발사체 풀에 총알 추가
 
     def shoot_at_player(self, speed: float, delay: int = 0) -> None:
         """
@@ -7,6 +7,11 @@ from config.enemy.enemy_config import EnemyConfig
 # 적 설정 인스턴스 생성
 enemy_config = EnemyConfig()
 
+# 적 발사체 크기와 텍스처 좌표 (BulletPool과 공유)
+ENEMY_SHOT_SIZE = 8
+ENEMY_SHOT_U = 32
+ENEMY_SHOT_V = 0
+
 
 class EnemyShot(Sprite):
     """
@@ -20,6 +25,8 @@ class EnemyShot(Sprite):
         damage (int): 플레이어에게 주는 데미지
     """
 
+    __slots__ = ("type", "dx", "dy", "delay", "damage")
+
     type: EntityType
     x: int
     y: int
@@ -46,10 +53,10 @@ class EnemyShot(Sprite):
         self.dy = dy
         self.delay = delay
         self.damage = enemy_config.shot_damage
-        self.w = 8
-        self.h = 8
-        self.u = 32
-        self.v = 0
+        self.w = ENEMY_SHOT_SIZE
+        self.h = ENEMY_SHOT_SIZE
+        self.u = ENEMY_SHOT_U
+        self.v = ENEMY_SHOT_V
 
     def update(self) -> None:
         """적 발사체 상태 업데이트."""
@@ -37,6 +37,11 @@ class Player(Sprite):
         current_hp (int): 현재 체력
     """
 
+    __slots__ = (
+        "type", "game_vars", "input", "max_hp", "current_hp", "invincibility_frames",
+        "forced_invincible", "shot_delay",
+    )
+
     game_vars: object
     input: object
     type: EntityType
@@ -84,6 +89,9 @@ class Player(Sprite):
             return
         
         self.current_hp -= damage
+        listener = self.game_state.game.reward_listener
+        if listener is not None:
+            listener.on_damage(damage)
         if self.current_hp <= 0:
             self.kill()
         else:
@@ -91,9 +99,10 @@ class Player(Sprite):
 
     def explode(self) -> None:
         """플레이어 폭발 효과 처리."""
+        rng = self.game_state.game.rng
         for i in range(12):
             self.game_state.add_explosion(
-                self.x + px.rndi(-12, 12), self.y - 4 + px.rndi(-6, 6), i * 8
+                self.x + rng.randint(-12, 12), self.y - 4 + rng.randint(-6, 6), i * 8
             )
 
     def is_invincible(self) -> bool:
@@ -207,7 +216,7 @@ class Player(Sprite):
 
     def draw(self) -> None:
         """플레이어 그리기."""
-        if self.is_invincible() and px.frame_count % 2 == 0:
+        if self.is_invincible() and self.game_state.game.frame_count % 2 == 0:
             return  # 무적 상태일 때 깜빡임 효과
         px.blt(self.x, self.y, 0, 0, 4, self.w, self.h, 0)
 
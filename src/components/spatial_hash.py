@@ -0,0 +1,112 @@
+from typing import Dict, List, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sprite import Sprite
+
+# 격자 셀 크기 (픽셀). 타일(8px) 2칸 크기로, 총알(8px)과 일반 적(16px)이
+# 대부분 1~4개 셀에만 걸치도록 맞춘 값입니다.
+SPATIAL_HASH_CELL_SIZE = 16
+
+# 셀 좌표 (cx, cy)를 정수 키 하나로 합칠 때 쓰는 배수.
+# 화면 밖 여유를 포함해도 |cy| < 2048 이므로 키가 겹치지 않습니다.
+CELL_KEY_STRIDE = 4096
+
+
+class SpatialHash:
+    """
+    ## 균일 격자 공간 해시
+
+    스프라이트 목록을 셀 단위 격자에 등록해 두고, 사각형과 겹칠 수 있는 후보만
+    빠르게 찾습니다. 충돌 검사 전 단계(broadphase)로 사용하며, 실제 겹침 판정은
+    호출하는 쪽에서 `rect_overlap`으로 수행합니다.
+
+    ### 속성
+    | 속성명 | 타입 | 설명 | 기본값 |
+    |--------|------|------|--------|
+    | `cell_size` | `int` | 셀 크기 (픽셀) | `SPATIAL_HASH_CELL_SIZE` |
+    | `cells` | `Dict[int, List[int]]` | 셀 키 → 등록된 인덱스 목록 | `{}` |
+    """
+
+    cell_size: int  # 셀 크기 (픽셀)
+    cells: Dict[int, List[int]]  # 셀 키 → 인덱스 목록 (오름차순)
+
+    def __init__(self, cell_size: int = SPATIAL_HASH_CELL_SIZE) -> None:
+        """
+        공간 해시를 초기화합니다.
+
+        ### 파라미터
+        - `cell_size` (`int`): 셀 크기 (픽셀)
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self) -> None:
+        """등록된 항목을 모두 지웁니다."""
+        self.cells.clear()
+
+    def insert(self, index: int, x: float, y: float, w: float, h: float) -> None:
+        """
+        사각형이 걸치는 모든 셀에 인덱스를 등록합니다.
+
+        ### 파라미터
+        - `index` (`int`): 등록할 인덱스
+        - `x`, `y`, `w`, `h` (`float`): 사각형 위치와 크기
+        """
+        cs = self.cell_size
+        cells = self.cells
+        x0 = int(x // cs)
+        x1 = int((x + w) // cs)
+        y0 = int(y // cs)
+        y1 = int((y + h) // cs)
+        for cx in range(x0, x1 + 1):
+            base = cx * CELL_KEY_STRIDE
+            for key in range(base + y0, base + y1 + 1):
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [index]
+                else:
+                    bucket.append(index)
+
+    def build(self, sprites: Sequence["Sprite"]) -> None:
+        """
+        스프라이트 목록으로 격자를 새로 만듭니다.
+
+        제거 표시된 스프라이트는 등록하지 않습니다. 인덱스는 목록 순서대로 등록되므로
+        각 셀의 인덱스 목록은 항상 오름차순입니다.
+
+        ### 파라미터
+        - `sprites` (`Sequence[Sprite]`): 등록할 스프라이트 목록
+        """
+        self.cells.clear()
+        for i, s in enumerate(sprites):
+            if not s.remove:
+                self.insert(i, s.x, s.y, s.w, s.h)
+
+    def query(self, x: float, y: float, w: float, h: float) -> List[int]:
+        """
+        사각형과 같은 셀에 걸친 항목의 인덱스를 찾습니다.
+
+        ### 파라미터
+        - `x`, `y`, `w`, `h` (`float`): 검사할 사각형 위치와 크기
+
+        ### 반환값
+        - (`List[int]`): 중복 없는 후보 인덱스 (오름차순)
+        """
+        cs = self.cell_size
+        cells = self.cells
+        x0 = int(x // cs)
+        x1 = int((x + w) // cs)
+        y0 = int(y // cs)
+        y1 = int((y + h) // cs)
+        if x0 == x1 and y0 == y1:
+            # 한 셀에만 걸친 경우: 셀 목록이 이미 오름차순이므로 그대로 반환
+            return cells.get(x0 * CELL_KEY_STRIDE + y0, [])
+
+        found = set()
+        for cx in range(x0, x1 + 1):
+            base = cx * CELL_KEY_STRIDE
+            for key in range(base + y0, base + y1 + 1):
+                bucket = cells.get(key)
+                if bucket is not None:
+                    found.update(bucket)
+        return sorted(found)
@@ -1,14 +1,46 @@
+import itertools
 from abc import ABC, abstractmethod
-from itertools import filterfalse
-from typing import List, TypeVar, TYPE_CHECKING
+from typing import ClassVar, Dict, List, Type, TypeVar, TYPE_CHECKING
 
 import pyxel as px
 
+try:
+    import numpy as np
+except ImportError:  # 웹 빌드 등 NumPy가 없는 환경에서는 벡터화 경로를 쓰지 않습니다.
+    np = None
+
+from .spatial_hash import CELL_KEY_STRIDE, SpatialHash
+
 if TYPE_CHECKING:
     from .sprite import Sprite
 
 T = TypeVar('T', bound='Sprite')
 
+# 두 목록이 모두 이 길이 이상이면 공간 해시로 후보 쌍만 검사합니다.
+# 격자 조회 비용은 스프라이트당 겹침 판정 20~25회 정도라서, 작은 쪽 목록이
+# 이보다 짧으면 전체 쌍 검사가 더 빠릅니다.
+SPATIAL_HASH_MIN_SIZE = 80
+
+# NumPy가 있고 쌍 개수가 VECTORIZED_MIN_PAIRS 이상, 작은 쪽 목록 길이가
+# VECTORIZED_MIN_LIST 이상이면 겹침 마스크를 한 번에 계산합니다.
+# 좌표를 배열로 모으는 비용이 스프라이트당 겹침 판정 5회 정도라서, 큰 쪽 목록의
+# 각 스프라이트가 여러 번 비교될 때만 이득입니다. 같은 이유로 단일 스프라이트와
+# 목록 간 충돌(collide_list)은 항상 순수 Python 반복이 더 빠릅니다.
+VECTORIZED_MIN_PAIRS = 256
+VECTORIZED_MIN_LIST = 8
+
+# lists_collide가 매 호출마다 다시 채워 쓰는 격자
+_broadphase = SpatialHash()
+
+# 클래스별로 보관할 반환된 인스턴스의 최대 개수
+SPRITE_POOL_MAX_FREE = 256
+
+# 풀링 클래스(`pooled = True`) → 재사용 대기 중인 인스턴스 목록
+_free_lists: Dict[type, list] = {}
+
+# 스프라이트 일련번호 발급기. `__init__`마다(풀에서 재사용할 때 포함) 새 번호를 받습니다.
+_serials = itertools.count(1)
+
 def rect_overlap(
     x1: int, y1: int, w1: int, h1: int, x2: int, y2: int, w2: int, h2: int
 ) -> bool:
@@ -52,8 +84,16 @@ class Sprite(ABC):
     | `v` | `int` | 텍스처 v좌표 | 0 |
     | `flip_x` | `bool` | x축 뒤집기 여부 | `False` |
     | `flip_y` | `bool` | y축 뒤집기 여부 | `False` |
+    | `serial` | `int` | 등장할 때마다 새로 받는 일련번호 (프로세스 안에서 고유) | - |
     """
 
+    # 스프라이트는 매 프레임 대량으로 생성/제거되므로 인스턴스 __dict__ 대신 슬롯을
+    # 사용합니다. 하위 클래스도 새로 추가하는 속성만 __slots__에 선언해야 합니다.
+    __slots__ = (
+        "game_state", "x", "y", "w", "h", "remove", "colour", "u", "v", "flip_x",
+        "flip_y", "serial",
+    )
+
     game_state: object  # 게임 상태 객체
     x: int  # 스프라이트 x좌표
     y: int  # 스프라이트 y좌표
@@ -65,6 +105,11 @@ class Sprite(ABC):
     v: int  # 텍스처 v좌표
     flip_x: bool  # x축 뒤집기 여부
     flip_y: bool  # y축 뒤집기 여부
+    serial: int  # 일련번호 (객체 재사용이나 id() 재사용과 관계없이 등장마다 다름)
+
+    # True이면 `release()`된 인스턴스를 `acquire()`에서 재사용합니다.
+    # 자주 생성/제거되는 하위 클래스에서 켭니다.
+    pooled: ClassVar[bool] = False
 
     def __init__(self, game_state: object) -> None:
         """
@@ -89,6 +134,43 @@ class Sprite(ABC):
         self.flip_x = False  # 초기 x축 뒤집기 여부
         self.flip_y = False  # 초기 y축 뒤집기 여부
 
+        self.serial = next(_serials)
+
+    @classmethod
+    def acquire(cls: Type[T], *args, **kwargs) -> T:
+        """
+        인스턴스를 생성하거나, 풀링 클래스면 반환된 인스턴스를 재사용합니다.
+
+        재사용할 때는 같은 인자로 `__init__`을 다시 호출하므로 새로 만든 인스턴스와
+        상태가 같습니다.
+
+        ### 파라미터
+        - `*args`, `**kwargs`: 생성자 인자
+
+        ### 반환값
+        - (`Sprite`): 초기화된 인스턴스
+        """
+        free = _free_lists.get(cls)
+        if free:
+            obj = free.pop()
+            obj.__init__(*args, **kwargs)
+            return obj
+        return cls(*args, **kwargs)
+
+    def release(self) -> None:
+        """
+        더 이상 쓰지 않는 인스턴스를 풀에 반환합니다. (풀링 클래스가 아니면 무시)
+
+        `update_list`가 제거 표시된 스프라이트를 목록에서 뺄 때 호출하므로,
+        반환 후에는 인스턴스를 참조하지 않아야 합니다.
+        """
+        cls = type(self)
+        if not cls.pooled:
+            return
+        free = _free_lists.setdefault(cls, [])
+        if len(free) < SPRITE_POOL_MAX_FREE:
+            free.append(self)
+
     @abstractmethod
     def collided_with(self, other: "Sprite") -> None:
         """
@@ -126,10 +208,16 @@ class Sprite(ABC):
         # 목록 내 모든 스프라이트의 상태를 업데이트
         for s in the_list:
             s.update()  # 각 스프라이트의 update 메서드 호출
-        # 제거 표시된 스프라이트들을 목록에서 제거
-        the_list[:] = filterfalse(
-            lambda s: s.remove, the_list
-        )  # remove가 True인 스프라이트 필터링
+        # 제거 표시된 스프라이트들을 풀에 반환하고, 남은 스프라이트를 제자리에서
+        # 앞쪽으로 모음 (새 목록을 만들지 않음)
+        j = 0
+        for s in the_list:
+            if s.remove:
+                s.release()
+            else:
+                the_list[j] = s
+                j += 1
+        del the_list[j:]
 
     def draw_list(the_list: List[T]) -> None:
         """
@@ -146,25 +234,141 @@ class Sprite(ABC):
         """
         두 스프라이트 목록 간의 충돌을 처리합니다.
 
+        NumPy가 있고 목록이 충분히 크면(`VECTORIZED_MIN_PAIRS`, `VECTORIZED_MIN_LIST`)
+        겹침 마스크를 배열 연산으로 한 번에 계산합니다. NumPy가 없을 때 두 목록이 모두
+        `SPATIAL_HASH_MIN_SIZE` 이상이면 공간 해시로 같은 셀에 걸친 후보 쌍만
+        검사합니다. 어느 경우든 겹친 쌍은 전체 쌍 검사와 같은 순서로 처리하고 제거
+        여부도 같은 시점에 확인하므로, `collided_with` 호출 결과와 순서는 모든 방식이
+        같습니다.
+
         ### 파라미터
         - `list_a` (`List[Sprite]`): 첫 번째 스프라이트 목록
         - `list_b` (`List[Sprite]`): 두 번째 스프라이트 목록
         """
+        len_a = len(list_a)
+        len_b = len(list_b)
+        if (
+            np is not None
+            and len_a * len_b >= VECTORIZED_MIN_PAIRS
+            and min(len_a, len_b) >= VECTORIZED_MIN_LIST
+        ):
+            Sprite._lists_collide_vectorized(list_a, list_b)
+            return
+        if min(len_a, len_b) >= SPATIAL_HASH_MIN_SIZE:
+            Sprite._lists_collide_hashed(list_a, list_b)
+            return
+
         # list_a의 각 스프라이트에 대해 반복
         for a in list_a:
             if a.remove:  # 제거 표시된 스프라이트는 건너뜀
                 continue
+            # 충돌 처리 중에는 위치가 바뀌지 않으므로 a의 경계는 한 번만 계산
+            ax, ay = a.x, a.y
+            ar = ax + a.w
+            ab = ay + a.h
             # list_b의 각 스프라이트에 대해 반복
             for b in list_b:
                 if b.remove:  # 제거 표시된 스프라이트는 건너뜀
                     continue
-                # 두 스프라이트 간의 충돌 여부 확인
-                if Sprite.collide(a, b):
+                # 두 스프라이트 간의 충돌 여부 확인 (rect_overlap과 같은 판정)
+                bx, by = b.x, b.y
+                if ax < bx + b.w and ar > bx and ay < by + b.h and ab > by:
                     # 충돌 시 a의 collided_with 메서드 호출
                     a.collided_with(b)
                     # 충돌 시 b의 collided_with 메서드 호출
                     b.collided_with(a)
 
+    def _lists_collide_hashed(list_a: List[T], list_b: List[T]) -> None:
+        """
+        공간 해시로 후보 쌍을 좁혀 두 스프라이트 목록 간의 충돌을 처리합니다.
+
+        두 목록 중 작은 쪽을 격자에 등록하고 큰 쪽으로 조회해 겹치는 쌍을 모은 뒤,
+        (a 인덱스, b 인덱스) 순으로 정렬해 전체 쌍 검사와 같은 순서로 호출합니다.
+
+        ### 파라미터
+        - `list_a` (`List[Sprite]`): 첫 번째 스프라이트 목록
+        - `list_b` (`List[Sprite]`): 두 번째 스프라이트 목록
+        """
+        swapped = len(list_a) > len(list_b)
+        small, large = (list_b, list_a) if swapped else (list_a, list_b)
+
+        grid = _broadphase
+        grid.build(small)
+        if not grid.cells:
+            return
+
+        # 충돌 처리 중에는 위치가 바뀌지 않으므로 겹침 판정은 미리 해 둡니다.
+        # 조회는 SpatialHash.query와 같지만, 매 스프라이트마다 호출하는 비용을 줄이려고
+        # 셀 순회와 겹침 판정을 여기서 직접 수행하고 중복은 pairs 집합으로 제거합니다.
+        cs = grid.cell_size
+        cells = grid.cells
+        pairs = set()
+        for j, s in enumerate(large):
+            if s.remove:
+                continue
+            sx, sy = s.x, s.y
+            sr = sx + s.w
+            sb = sy + s.h
+            y0 = int(sy // cs)
+            y1 = int(sb // cs) + 1
+            for cx in range(int(sx // cs), int(sr // cs) + 1):
+                base = cx * CELL_KEY_STRIDE
+                for key in range(base + y0, base + y1):
+                    bucket = cells.get(key)
+                    if bucket is None:
+                        continue
+                    for i in bucket:
+                        o = small[i]
+                        ox, oy = o.x, o.y
+                        if sx < ox + o.w and sr > ox and sy < oy + o.h and sb > oy:
+                            pairs.add((j, i) if swapped else (i, j))
+        if pairs:
+            Sprite._dispatch_pairs(list_a, list_b, sorted(pairs))
+
+    def _lists_collide_vectorized(list_a: List[T], list_b: List[T]) -> None:
+        """
+        NumPy 브로드캐스팅으로 겹침 마스크를 계산해 두 스프라이트 목록 간의 충돌을 처리합니다.
+
+        ### 파라미터
+        - `list_a` (`List[Sprite]`): 첫 번째 스프라이트 목록
+        - `list_b` (`List[Sprite]`): 두 번째 스프라이트 목록
+        """
+        ra = _gather_rects(list_a)
+        rb = _gather_rects(list_b)
+        ax, ay, ar, ab = ra[:, 0:1], ra[:, 1:2], ra[:, 2:3], ra[:, 3:4]
+        bx, by, br, bb = rb[:, 0], rb[:, 1], rb[:, 2], rb[:, 3]
+        mask = (ax < br) & (ar > bx) & (ay < bb) & (ab > by)
+        # np.nonzero는 행 우선 순서이므로 (a 인덱스, b 인덱스) 순으로 정렬되어 있습니다.
+        ia, ib = np.nonzero(mask)
+        if len(ia):
+            Sprite._dispatch_pairs(list_a, list_b, zip(ia.tolist(), ib.tolist()))
+
+    def _dispatch_pairs(list_a: List[T], list_b: List[T], pairs) -> None:
+        """
+        겹친 쌍에 대해 `collided_with`를 호출합니다.
+
+        제거 여부는 전체 쌍 검사와 같은 시점(a는 처음 만날 때, b는 매 쌍)에 확인합니다.
+
+        ### 파라미터
+        - `list_a` (`List[Sprite]`): 첫 번째 스프라이트 목록
+        - `list_b` (`List[Sprite]`): 두 번째 스프라이트 목록
+        - `pairs`: (a 인덱스, b 인덱스) 쌍 (a 인덱스, b 인덱스 순으로 정렬됨)
+        """
+        last_ia = -1
+        skip_a = False
+        for ia, ib in pairs:
+            a = list_a[ia]
+            if ia != last_ia:
+                last_ia = ia
+                skip_a = a.remove
+            if skip_a:
+                continue
+            b = list_b[ib]
+            if b.remove:
+                continue
+            a.collided_with(b)
+            b.collided_with(a)
+
     def collide_list(spr: T, the_list: List[T]) -> None:
         """
         단일 스프라이트와 목록 간의 충돌을 처리합니다.
@@ -176,12 +380,17 @@ class Sprite(ABC):
         # spr이 제거 표시된 경우 함수 종료
         if spr.remove:
             return
+        # 충돌 처리 중에는 위치가 바뀌지 않으므로 spr의 경계는 한 번만 계산
+        sx, sy = spr.x, spr.y
+        sr = sx + spr.w
+        sb = sy + spr.h
         # 목록 내 각 스프라이트에 대해 반복
         for a in the_list:
             if a.remove:  # 제거 표시된 스프라이트는 건너뜀
                 continue
-            # spr과 목록 내 스프라이트 간의 충돌 여부 확인
-            if Sprite.collide(spr, a):
+            # spr과 목록 내 스프라이트 간의 충돌 여부 확인 (rect_overlap과 같은 판정)
+            ax, ay = a.x, a.y
+            if sx < ax + a.w and sr > ax and sy < ay + a.h and sb > ay:
                 # 충돌 시 spr의 collided_with 메서드 호출
                 spr.collided_with(a)
                 # 충돌 시 a의 collided_with 메서드 호출
@@ -228,6 +437,21 @@ class Sprite(ABC):
         """
         pass
 
+def _gather_rects(sprites: List[T]):
+    """
+    스프라이트 목록의 경계를 (N, 4) 배열로 모읍니다.
+
+    Args:
+        sprites (List[Sprite]): 스프라이트 목록
+
+    Returns:
+        np.ndarray: 각 행이 (왼쪽, 위, 오른쪽, 아래)인 float64 배열
+    """
+    r = np.array([(s.x, s.y, s.w, s.h) for s in sprites], dtype=np.float64).reshape(-1, 4)
+    r[:, 2] += r[:, 0]
+    r[:, 3] += r[:, 1]
+    return r
+
 def sprites_update(sprites: List[T]) -> None:
     """
     스프라이트 목록을 업데이트합니다.
@@ -246,6 +470,17 @@ def sprites_draw(sprites: List[T]) -> None:
     """
     Sprite.draw_list(sprites)
 
+def sprites_clear(sprites: List[T]) -> None:
+    """
+    스프라이트 목록을 비우고, 풀링 클래스의 인스턴스는 풀에 반환합니다.
+
+    Args:
+        sprites (List[Sprite]): 비울 스프라이트 목록
+    """
+    for s in sprites:
+        s.release()
+    sprites.clear()
+
 def sprite_lists_collide(list_a: List[T], list_b: List[T]) -> None:
     """
     두 스프라이트 목록 간의 충돌을 처리합니다.
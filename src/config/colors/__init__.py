@@ -1,5 +1,9 @@
 """Colors configuration package."""
 
-from .color_palette import COLOR_PALETTE as PALETTE, MAX_COLORS
+from .color_palette import (
+    COLOR_PALETTE as PALETTE,
+    COLOR_PALETTE_RGB as PALETTE_RGB,
+    MAX_COLORS,
+)
 
-__all__ = ["COLOR_PALETTE", "MAX_COLORS"]
+__all__ = ["PALETTE", "PALETTE_RGB", "MAX_COLORS"]
@@ -27,3 +27,8 @@ COLOR_PALETTE = [
 
 # COLOR_PALETTE에 정의된 총 색상 수
 MAX_COLORS = len(COLOR_PALETTE)
+
+# 팔레트 인덱스 → (R, G, B) 변환 테이블 (화면 버퍼를 RGB 이미지로 바꿀 때 사용)
+COLOR_PALETTE_RGB = tuple(
+    ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF) for color in COLOR_PALETTE
+)
@@ -1,4 +1,4 @@
-from config.colors.color_palette import COLOR_PALETTE, MAX_COLORS
+from config.colors.color_palette import COLOR_PALETTE, COLOR_PALETTE_RGB, MAX_COLORS
 
 
 def test_color_palette_length():
@@ -31,3 +31,10 @@ def test_color_palette_structure():
     assert all(
         isinstance(color, int) and 0 <= color <= 0xFFFFFF for color in COLOR_PALETTE
     ), "COLOR_PALETTE에 유효하지 않은 색상 값이 포함되어 있습니다."
+
+
+def test_color_palette_rgb_matches_palette():
+    """COLOR_PALETTE_RGB가 COLOR_PALETTE의 각 색상을 (R, G, B)로 정확히 분해하는지 테스트"""
+    assert len(COLOR_PALETTE_RGB) == MAX_COLORS
+    for color, (r, g, b) in zip(COLOR_PALETTE, COLOR_PALETTE_RGB):
+        assert (r << 16) | (g << 8) | b == color
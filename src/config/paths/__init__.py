@@ -1,5 +1,5 @@
 """Paths configuration package."""
 
-from .paths import ASSETS_DIR, SOURCE_DIR
+from .paths import ASSETS_DIR, CACHE_DIR, DATA_DIR, SOURCE_DIR
 
-__all__ = ["ASSETS_DIR", "SOURCE_DIR"]
+__all__ = ["ASSETS_DIR", "CACHE_DIR", "DATA_DIR", "SOURCE_DIR"]
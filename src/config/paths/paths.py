@@ -13,9 +13,13 @@ __PROJECT_DIR = pipe(
 # 주요 디렉토리 경로 정의
 SOURCE_DIR = __PROJECT_DIR / "src"  # 소스 코드 디렉토리 경로
 ASSETS_DIR = SOURCE_DIR / "assets"  # 에셋 디렉토리 경로
+DATA_DIR = __PROJECT_DIR / "data"  # 수집한 데이터셋 디렉토리 경로
+CACHE_DIR = __PROJECT_DIR / ".cache"  # 에셋에서 미리 계산한 데이터 캐시 디렉토리 경로
 
 # 공개 인터페이스 정의
 __all__ = [
     "ASSETS_DIR",
+    "CACHE_DIR",
+    "DATA_DIR",
     "SOURCE_DIR",
 ]
@@ -1,4 +1,4 @@
-from config.paths import SOURCE_DIR, ASSETS_DIR
+from config.paths import SOURCE_DIR, ASSETS_DIR, CACHE_DIR, DATA_DIR
 
 
 def test_source_dir_exists():
@@ -16,3 +16,13 @@ def test_assets_dir_exists():
 def test_assets_dir_is_subdir_of_source_dir():
     """ASSETS_DIR이 SOURCE_DIR의 하위 디렉토리인지 테스트"""
     assert ASSETS_DIR.parent == SOURCE_DIR
+
+
+def test_data_dir_is_outside_source_dir():
+    """DATA_DIR이 SOURCE_DIR과 같은 프로젝트 루트 아래에 있는지 테스트"""
+    assert DATA_DIR.parent == SOURCE_DIR.parent
+
+
+def test_cache_dir_is_outside_source_dir():
+    """CACHE_DIR이 SOURCE_DIR 밖(프로젝트 루트 아래)에 있는지 테스트"""
+    assert CACHE_DIR.parent == SOURCE_DIR.parent
@@ -1,26 +1,75 @@
-import os
+import argparse
+import hashlib
 import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
-from PIL import Image
+
+# 경로 설정
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data'))
+LABEL_DIR = os.path.join(BASE_DIR, 'labels')
+IMAGE_DIR = os.path.join(BASE_DIR, 'images')
+YOLO_LABEL_DIR = os.path.join(BASE_DIR, 'yolo_labels')
+
+# 변환 결과 디렉토리에 두는 매니페스트 (입력 해시/이미지 크기/클래스 캐시)
+MANIFEST_NAME = '.manifest.json'
+MANIFEST_VERSION = 1
+
+# 워커 프로세스에 한 번에 넘기는 파일 수
+CHUNK_SIZE = 256
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def png_size(img_path):
+    """
+    PNG 헤더(IHDR)만 읽어 이미지 크기를 구합니다. (이미지 전체를 디코딩하지 않음)
+
+    Args:
+        img_path (str): PNG 파일 경로
+
+    Returns:
+        tuple: (너비, 높이)
+    """
+    with open(img_path, 'rb') as f:
+        header = f.read(24)
+    if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+        raise ValueError(f"Not a PNG file: {img_path}")
+    return struct.unpack('>II', header[16:24])
+
+
+def label_classes(label):
+    """라벨 JSON에 등장하는 클래스 이름 목록을 반환합니다."""
+    classes = {"player"}
+    for enemy in label.get("enemies", []):
+        classes.add(f'enemy_{enemy["type"].lower()}')
+    return sorted(classes)
+
 
 # 클래스 매핑 (player + enemy 종류 자동)
 def get_class_map(label_dir):
     class_set = set()
     for label_file in glob(os.path.join(label_dir, "*.json")):
         with open(label_file, "r") as f:
-            label = json.load(f)
-            class_set.add("player")
-            for enemy in label.get("enemies", []):
-                class_set.add(f'enemy_{enemy["type"].lower()}')
+            class_set.update(label_classes(json.load(f)))
     class_list = sorted(list(class_set))
     return {cls: idx for idx, cls in enumerate(class_list)}, class_list
 
-def convert_label(label_path, img_path, class_map):
-    with open(label_path, "r") as f:
-        label = json.load(f)
-    img = Image.open(img_path)
-    w, h = img.size
 
+def label_lines(label, size, class_map):
+    """
+    라벨 JSON을 YOLO 라벨 줄 목록으로 변환합니다.
+
+    Args:
+        label (dict): 라벨 JSON (player, enemies)
+        size (tuple): 이미지 (너비, 높이)
+        class_map (dict): 클래스 이름 → ID
+
+    Returns:
+        list: YOLO 라벨 줄 목록
+    """
+    w, h = size
     lines = []
     # 플레이어
     player = label["player"]
@@ -46,25 +95,161 @@ def convert_label(label_path, img_path, class_map):
 
     return lines
 
-def main():
-    label_dir = "data/labels"
-    image_dir = "data/images"
-    yolo_label_dir = "data/yolo_labels"
-    os.makedirs(yolo_label_dir, exist_ok=True)
 
-    class_map, class_list = get_class_map(label_dir)
-    with open("data/classes.txt", "w") as f:
-        for cls in class_list:
-            f.write(f"{cls}\n")
+def convert_label(label_path, img_path, class_map):
+    with open(label_path, "r") as f:
+        label = json.load(f)
+    return label_lines(label, png_size(img_path), class_map)
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
 
+
+def _scan_label(job):
+    """
+    라벨 파일 하나의 해시, 클래스, 이미지 크기를 구합니다. (워커 프로세스에서 실행)
+
+    매니페스트의 해시와 같으면 JSON을 파싱하지 않고 이전 결과를 그대로 씁니다.
+    """
+    base, label_path, img_path, cached = job
+    with open(label_path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    img_stat = _stat_key(img_path)
+    entry = {"label_stat": _stat_key(label_path), "image_stat": img_stat, "hash": digest}
+    if cached and cached.get("hash") == digest:
+        entry["classes"] = cached["classes"]
+        entry["image_size"] = (
+            cached["image_size"] if cached.get("image_stat") == img_stat else list(png_size(img_path))
+        )
+        entry["changed"] = entry["image_size"] != cached["image_size"]
+        return base, entry
+    entry["classes"] = label_classes(json.loads(data))
+    entry["image_size"] = list(png_size(img_path))
+    entry["changed"] = True
+    return base, entry
+
+
+def _write_yolo_label(job):
+    """라벨 하나를 YOLO 형식으로 변환해 씁니다. (워커 프로세스에서 실행)"""
+    label_path, size, class_map, out_path = job
+    with open(label_path, "r") as f:
+        lines = label_lines(json.load(f), size, class_map)
+    with open(out_path, "w") as f:
+        f.write("\n".join(lines))
+
+
+def load_manifest(path):
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "class_list": [], "files": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "class_list": [], "files": {}}
+    return manifest
+
+
+def save_manifest(path, manifest):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
+
+
+def convert_all(label_dir=LABEL_DIR, image_dir=IMAGE_DIR, yolo_label_dir=YOLO_LABEL_DIR,
+                classes_path=None, workers=None):
+    """
+    라벨 JSON을 YOLO 라벨로 변환합니다. 바뀐 입력만 다시 변환합니다.
+
+    라벨 파일의 수정 시각/크기가 매니페스트와 같으면 읽지 않고, 다르면 내용 해시로
+    실제 변경 여부를 확인합니다. 클래스 목록이 바뀌면 ID가 달라지므로 모두 다시 씁니다.
+    스캔과 변환은 프로세스 풀에서 병렬로 수행합니다.
+
+    Args:
+        label_dir (str): 라벨 JSON 디렉토리
+        image_dir (str): PNG 이미지 디렉토리
+        yolo_label_dir (str): YOLO 라벨 출력 디렉토리
+        classes_path (str, optional): classes.txt 경로 (기본값: label_dir의 상위/classes.txt)
+        workers (int, optional): 워커 프로세스 수 (기본값: CPU 수)
+
+    Returns:
+        dict: 통계 (total, scanned, converted, removed)
+    """
+    os.makedirs(yolo_label_dir, exist_ok=True)
+    if classes_path is None:
+        classes_path = os.path.join(os.path.dirname(os.path.abspath(label_dir)), "classes.txt")
+    manifest_path = os.path.join(yolo_label_dir, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+    old_files = manifest["files"]
+
+    files = {}
+    scan_jobs = []
     for label_file in glob(os.path.join(label_dir, "*.json")):
         base = os.path.splitext(os.path.basename(label_file))[0]
         img_file = os.path.join(image_dir, base.replace("label_", "frame_") + ".png")
         if not os.path.exists(img_file):
             continue
-        yolo_lines = convert_label(label_file, img_file, class_map)
-        with open(os.path.join(yolo_label_dir, base + ".txt"), "w") as f:
-            f.write("\n".join(yolo_lines))
+        cached = old_files.get(base)
+        if (
+            cached is not None
+            and cached.get("label_stat") == _stat_key(label_file)
+            and cached.get("image_stat") == _stat_key(img_file)
+        ):
+            files[base] = dict(cached, changed=False)
+        else:
+            scan_jobs.append((base, label_file, img_file, cached))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for base, entry in executor.map(_scan_label, scan_jobs, chunksize=CHUNK_SIZE):
+            files[base] = entry
+
+        class_set = set()
+        for entry in files.values():
+            class_set.update(entry["classes"])
+        class_list = sorted(class_set)
+        class_map = {cls: idx for idx, cls in enumerate(class_list)}
+        rewrite_all = class_list != manifest["class_list"]
+
+        write_jobs = []
+        for base, entry in files.items():
+            out_path = os.path.join(yolo_label_dir, base + ".txt")
+            if rewrite_all or entry["changed"] or not os.path.exists(out_path):
+                label_file = os.path.join(label_dir, base + ".json")
+                write_jobs.append((label_file, entry["image_size"], class_map, out_path))
+        list(executor.map(_write_yolo_label, write_jobs, chunksize=CHUNK_SIZE))
+
+    # 입력이 사라진 라벨 제거
+    removed = 0
+    for base in old_files.keys() - files.keys():
+        out_path = os.path.join(yolo_label_dir, base + ".txt")
+        if os.path.exists(out_path):
+            os.remove(out_path)
+            removed += 1
+
+    with open(classes_path, "w") as f:
+        for cls in class_list:
+            f.write(f"{cls}\n")
+    for entry in files.values():
+        entry.pop("changed", None)
+    save_manifest(manifest_path, {"version": MANIFEST_VERSION, "class_list": class_list, "files": files})
+    return {"total": len(files), "scanned": len(scan_jobs), "converted": len(write_jobs), "removed": removed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert JSON labels to YOLO labels incrementally.")
+    parser.add_argument("--labels", default=LABEL_DIR, help="JSON label directory")
+    parser.add_argument("--images", default=IMAGE_DIR, help="PNG image directory")
+    parser.add_argument("--out", default=YOLO_LABEL_DIR, help="YOLO label output directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    stats = convert_all(args.labels, args.images, args.out, workers=args.workers)
+    print(f"{stats['total']} labels: {stats['scanned']} scanned, {stats['converted']} converted, "
+          f"{stats['removed']} removed")
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
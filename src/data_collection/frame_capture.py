@@ -0,0 +1,148 @@
+"""
+화면 버퍼 캡처 모듈
+
+pyxel 화면(`px.screen`)을 픽셀 단위 호출 없이 한 번에 팔레트 인덱스 배열로 가져오고,
+NumPy 팔레트 조회 한 번으로 RGB 배열로 변환합니다.
+"""
+
+import io
+from typing import Optional
+
+import numpy as np
+import pyxel as px
+
+from config.colors import PALETTE_RGB
+
+# 기본 팔레트 인덱스 → RGB 변환 테이블 (config.colors.PALETTE 기준)
+PALETTE_RGB_LUT = np.array(PALETTE_RGB, dtype=np.uint8)
+
+
+def screen_view() -> Optional[np.ndarray]:
+    """
+    pyxel 화면 버퍼를 복사 없이 (높이, 너비) uint8 배열로 봅니다.
+
+    배열은 화면 버퍼 메모리를 그대로 가리키므로 다음 그리기에서 내용이 바뀝니다.
+    `data_ptr()`를 쓸 수 없는 환경(일부 웹 빌드 등)에서는 None을 반환합니다.
+
+    Returns:
+        Optional[np.ndarray]: 화면 버퍼의 팔레트 인덱스 배열 또는 None
+    """
+    screen = px.screen
+    try:
+        buffer = np.frombuffer(screen.data_ptr(), dtype=np.uint8)
+    except (AttributeError, NotImplementedError, TypeError, ValueError):
+        return None
+    return buffer.reshape(screen.height, screen.width)
+
+
+def capture_indices(out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    현재 화면을 팔레트 인덱스 배열로 복사합니다.
+
+    Args:
+        out (Optional[np.ndarray]): 결과를 쓸 (높이, 너비) uint8 배열 (None이면 새로 할당)
+
+    Returns:
+        np.ndarray: (높이, 너비) uint8 팔레트 인덱스 배열
+    """
+    screen = px.screen
+    if out is None:
+        out = np.empty((screen.height, screen.width), dtype=np.uint8)
+
+    view = screen_view()
+    if view is not None:
+        np.copyto(out, view)
+        return out
+
+    # data_ptr()가 없는 환경: 픽셀 단위로 읽는 느린 경로
+    pget = screen.pget
+    for y in range(screen.height):
+        row = out[y]
+        for x in range(screen.width):
+            row[x] = pget(x, y)
+    return out
+
+
+def current_palette_lut() -> np.ndarray:
+    """
+    현재 pyxel 팔레트(`px.colors`)로 인덱스 → RGB 변환 테이블을 만듭니다.
+
+    Returns:
+        np.ndarray: (색상 수, 3) uint8 배열
+    """
+    colors = np.array(px.colors.to_list(), dtype=np.uint32)
+    lut = np.empty((len(colors), 3), dtype=np.uint8)
+    lut[:, 0] = colors >> 16
+    lut[:, 1] = colors >> 8
+    lut[:, 2] = colors
+    return lut
+
+
+def indices_to_rgb(
+    indices: np.ndarray, lut: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    팔레트 인덱스 배열을 RGB 배열로 변환합니다.
+
+    Args:
+        indices (np.ndarray): (높이, 너비) 팔레트 인덱스 배열
+        lut (Optional[np.ndarray]): 변환 테이블 (None이면 `PALETTE_RGB_LUT`)
+
+    Returns:
+        np.ndarray: (높이, 너비, 3) uint8 RGB 배열
+    """
+    if lut is None:
+        lut = PALETTE_RGB_LUT
+    # np.take는 같은 조회를 팬시 인덱싱(lut[indices])보다 몇 배 빠르게 수행합니다.
+    return np.take(lut, indices, axis=0)
+
+
+def capture_rgb(lut: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    현재 화면을 RGB 배열로 가져옵니다.
+
+    Args:
+        lut (Optional[np.ndarray]): 변환 테이블 (None이면 `PALETTE_RGB_LUT`)
+
+    Returns:
+        np.ndarray: (높이, 너비, 3) uint8 RGB 배열
+    """
+    view = screen_view()
+    if view is None:
+        view = capture_indices()
+    return indices_to_rgb(view, lut)
+
+
+def encode_png(rgb: np.ndarray) -> bytes:
+    """
+    RGB 배열을 PNG 바이트로 인코딩합니다.
+
+    Args:
+        rgb (np.ndarray): (높이, 너비, 3) uint8 RGB 배열
+
+    Returns:
+        bytes: PNG 파일 데이터
+    """
+    return encode_image(rgb, "png")
+
+
+def encode_image(rgb: np.ndarray, image_format: str) -> bytes:
+    """
+    RGB 배열을 이미지 파일 바이트로 인코딩합니다. (Pillow 필요)
+
+    Args:
+        rgb (np.ndarray): (높이, 너비, 3) uint8 RGB 배열
+        image_format (str): "png" 또는 "webp" (WebP는 무손실로 저장)
+
+    Returns:
+        bytes: 이미지 파일 데이터
+    """
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    image = Image.fromarray(rgb, "RGB")
+    if image_format == "webp":
+        image.save(buffer, format="WEBP", lossless=True)
+    else:
+        image.save(buffer, format=image_format.upper())
+    return buffer.getvalue()
@@ -0,0 +1,260 @@
+"""
+캡처 프레임 백그라운드 인코더 모듈
+
+게임 루프에서는 팔레트 인덱스 배열과 라벨 목록만 스냅샷해 제한된 크기의 큐에
+넣고, 색 변환/이미지 인코딩/샤드 기록은 워커가 처리합니다.
+
+- 데스크톱: 워커 스레드 풀이 큐를 소비합니다.
+- 웹(Emscripten): 스레드를 쓸 수 없으므로 게임이 매 프레임 남는 시간에
+  `pump(시간 예산)`을 호출해 협조적으로 처리합니다.
+
+큐가 가득 차면 새 프레임을 버리고(`dropped`) 게임을 기다리게 하지 않습니다.
+"""
+
+import collections
+import platform
+import threading
+import time
+import traceback
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data_collection.frame_capture import encode_image, indices_to_rgb
+from data_collection.shard_writer import ShardWriter, encode_npy
+
+# 저장 이미지 형식
+IMAGE_FORMAT_NPY = "npy"  # 팔레트 인덱스 배열 그대로 (변환/인코딩 없음)
+IMAGE_FORMAT_PNG = "png"  # RGB 무손실 PNG
+IMAGE_FORMAT_WEBP = "webp"  # RGB 무손실 WebP
+IMAGE_FORMATS = (IMAGE_FORMAT_NPY, IMAGE_FORMAT_PNG, IMAGE_FORMAT_WEBP)
+
+# 처리 대기 프레임 수 상한 (256x192 인덱스 배열 기준 약 48KB x 64)
+DEFAULT_MAX_PENDING = 64
+# 데스크톱 기본 워커 스레드 수
+DEFAULT_NUM_WORKERS = 2
+
+IS_WEB = platform.system() == "Emscripten"
+
+# 큐 항목: (팔레트 인덱스 배열, 라벨 목록, 메타데이터)
+_Job = Tuple[np.ndarray, Sequence[str], Optional[Dict[str, Any]]]
+
+
+def encode_frame(
+    indices: np.ndarray, image_format: str, lut: Optional[np.ndarray] = None
+) -> bytes:
+    """
+    팔레트 인덱스 배열을 저장 형식의 파일 내용으로 인코딩합니다.
+
+    Args:
+        indices (np.ndarray): (높이, 너비) 팔레트 인덱스 배열
+        image_format (str): 저장 이미지 형식 ("npy", "png", "webp")
+        lut (Optional[np.ndarray]): 인덱스 → RGB 변환 테이블 (None이면 기본 팔레트)
+
+    Returns:
+        bytes: 이미지 파일 내용
+    """
+    if image_format == IMAGE_FORMAT_NPY:
+        return encode_npy(indices)
+    return encode_image(indices_to_rgb(indices, lut), image_format)
+
+
+class FrameEncoderPool:
+    """
+    캡처 프레임을 인코딩해 `ShardWriter`에 기록하는 워커 풀.
+
+    인코딩(색 변환, PNG/WebP 압축)은 워커마다 병렬로 수행하고, 샤드 기록은
+    잠금으로 하나씩 수행합니다. 워커가 여러 개면 기록 순서가 제출 순서와 다를 수
+    있으므로 메타데이터의 `capture_index`로 제출 순서를 남깁니다.
+
+    Args:
+        writer (ShardWriter): 프레임을 기록할 샤드 기록기
+        image_format (str): 저장 이미지 형식 ("npy", "png", "webp")
+        num_workers (Optional[int]): 워커 스레드 수 (None이면 데스크톱 2개, 웹 0개.
+            0이면 스레드 없이 `pump()`로 처리)
+        max_pending (int): 처리 대기 프레임 수 상한
+        lut (Optional[np.ndarray]): 인덱스 → RGB 변환 테이블 (None이면 기본 팔레트)
+    """
+
+    def __init__(
+        self,
+        writer: ShardWriter,
+        image_format: str = IMAGE_FORMAT_NPY,
+        num_workers: Optional[int] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        lut: Optional[np.ndarray] = None,
+    ) -> None:
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(
+                f"Unsupported image_format: {image_format!r}. Expected one of {IMAGE_FORMATS}."
+            )
+        if num_workers is None:
+            num_workers = 0 if IS_WEB else DEFAULT_NUM_WORKERS
+        self.writer = writer
+        self.image_format = image_format
+        self.max_pending = max_pending
+        self.lut = lut
+
+        # 통계
+        self.submitted = 0  # 큐에 넣은 프레임 수
+        self.written = 0  # 샤드에 기록한 프레임 수
+        self.dropped = 0  # 큐가 가득 차 버린 프레임 수
+        self.failed = 0  # 인코딩/기록 중 오류로 잃은 프레임 수
+        self.peak_pending = 0  # 최대 대기 프레임 수
+
+        self._jobs: "collections.deque[_Job]" = collections.deque()
+        self._in_flight = 0  # 워커가 꺼내 처리 중인 프레임 수
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"frame-encoder-{i}", daemon=True)
+            for i in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def threaded(self) -> bool:
+        """워커 스레드로 처리하는지 여부 (False이면 `pump()` 필요)"""
+        return bool(self._workers)
+
+    @property
+    def pending(self) -> int:
+        """처리를 기다리거나 처리 중인 프레임 수"""
+        return len(self._jobs) + self._in_flight
+
+    def full(self) -> bool:
+        """큐가 가득 찼는지 여부. 캡처 전에 확인하면 버릴 프레임의 캡처 비용을 아낍니다."""
+        return self.pending >= self.max_pending
+
+    def drop_frame(self) -> None:
+        """`full()`을 보고 캡처를 건너뛴 프레임을 버린 프레임으로 셉니다."""
+        with self._cond:
+            self.dropped += 1
+
+    def submit(
+        self,
+        indices: np.ndarray,
+        labels: Sequence[str],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        프레임을 큐에 넣습니다. 배열은 복사하지 않으므로 호출한 쪽에서 다시 쓰면 안 됩니다.
+
+        Args:
+            indices (np.ndarray): (높이, 너비) 팔레트 인덱스 배열 스냅샷
+            labels (Sequence[str]): YOLO 라벨 줄 목록
+            meta (Optional[Dict[str, Any]]): 프레임 메타데이터
+
+        Returns:
+            bool: 큐에 넣었으면 True, 가득 차서 버렸으면 False
+        """
+        with self._cond:
+            if self._closed or self.pending >= self.max_pending:
+                self.dropped += 1
+                return False
+            frame_meta = {"capture_index": self.submitted}
+            if meta:
+                frame_meta.update(meta)
+            self._jobs.append((indices, labels, frame_meta))
+            self.submitted += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+            self._cond.notify()
+        return True
+
+    def _process(self, job: _Job) -> None:
+        indices, labels, meta = job
+        try:
+            image_bytes = encode_frame(indices, self.image_format, self.lut)
+            meta["shape"] = list(indices.shape)
+            with self._write_lock:
+                self.writer.add_encoded(self.image_format, image_bytes, labels, meta)
+                self.written += 1
+        except Exception as e:
+            # 여러 워커가 함께 세므로 written과 같은 잠금 안에서 증가시킵니다.
+            with self._write_lock:
+                self.failed += 1
+            print(f"[FRAME_ENCODER_ERROR] Failed to encode/write frame: {e}")
+            traceback.print_exc()
+
+    def _worker_loop(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._jobs and not self._closed:
+                    cond.wait()
+                if not self._jobs:
+                    return  # 닫혔고 남은 작업 없음
+                job = self._jobs.popleft()
+                self._in_flight += 1
+            try:
+                self._process(job)
+            finally:
+                with cond:
+                    self._in_flight -= 1
+                    cond.notify_all()
+
+    def pump(self, budget: float) -> int:
+        """
+        스레드 없이 대기 프레임을 시간 예산 안에서 처리합니다. (웹 환경의 유휴 시간 처리)
+
+        예산이 남아 있는 동안 한 프레임씩 처리하므로 마지막 프레임 처리 시간만큼
+        예산을 넘을 수 있습니다. 워커 스레드가 있으면 아무것도 하지 않습니다.
+
+        Args:
+            budget (float): 사용할 수 있는 시간 (초)
+
+        Returns:
+            int: 처리한 프레임 수
+        """
+        if self._workers or budget <= 0:
+            return 0
+        deadline = time.perf_counter() + budget
+        processed = 0
+        jobs = self._jobs
+        while jobs and time.perf_counter() < deadline:
+            self._process(jobs.popleft())
+            processed += 1
+        return processed
+
+    def drain(self) -> None:
+        """대기 중인 프레임을 모두 처리할 때까지 기다립니다."""
+        if not self._workers:
+            jobs = self._jobs
+            while jobs:
+                self._process(jobs.popleft())
+            return
+        with self._cond:
+            while self.pending:
+                self._cond.wait()
+
+    def flush(self) -> None:
+        """대기 중인 프레임을 모두 기록하고 현재 샤드를 닫습니다."""
+        self.drain()
+        with self._write_lock:
+            self.writer.flush()
+
+    def close(self) -> None:
+        """남은 프레임을 기록하고 워커를 멈춘 뒤 샤드 기록기를 닫습니다."""
+        if self._closed:
+            return
+        self.drain()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join()
+        with self._write_lock:
+            self.writer.close()
+
+    def stats(self) -> Dict[str, int]:
+        """처리 통계를 반환합니다."""
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "pending": self.pending,
+            "peak_pending": self.peak_pending,
+        }
@@ -0,0 +1,270 @@
+"""
+오프라인 YOLO 데이터셋 생성기
+
+게임을 헤드리스(`GameSimulator`)로 무작위/스크립트 에이전트와 함께 최대 속도로
+돌리면서, 캡처 간격마다 화면을 pyxel 소프트웨어 렌더러로 오프스크린 버퍼에 그리고
+스프라이트 좌표로 만든 정확한 YOLO 라벨과 함께 샤드에 기록합니다.
+캡처하지 않는 프레임은 그리지 않습니다.
+
+pyxel은 프로세스 전역 상태를 쓰므로 워커 프로세스마다 게임 하나를 돌리고,
+워커별 하위 디렉토리(`w00/`, `w01/`, ...)에 샤드와 인덱스를 씁니다.
+최상위 `index.json`은 모든 워커의 샤드 목록을 모읍니다.
+
+사용법 (src 디렉토리에서):
+    python -m data_collection.generate_dataset --workers 4 --frames 20000
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from config.app.constants import APP_WIDTH, APP_HEIGHT
+from config.colors import PALETTE
+from config.game_config import CLASS_MAP
+from config.paths import DATA_DIR
+from data_collection.frame_encoder import IMAGE_FORMAT_NPY, IMAGE_FORMATS, encode_frame
+
+# 워커 프로세스 시작 방식. fork는 부모의 pyxel(SDL) 상태를 복제하므로 spawn을 사용합니다.
+MP_START_METHOD = "spawn"
+
+DEFAULT_OUT_DIR = DATA_DIR / "generated"
+DEFAULT_CAPTURE_INTERVAL = 10  # 캡처 간격 (프레임)
+ACTION_HOLD_FRAMES = 8  # 무작위 에이전트가 같은 행동을 유지하는 프레임 수
+SWEEP_FRAMES = 90  # 스크립트 에이전트가 한 방향으로 이동하는 프레임 수
+
+AGENT_RANDOM = "random"
+AGENT_SCRIPTED = "scripted"
+AGENTS = (AGENT_RANDOM, AGENT_SCRIPTED)
+
+
+def make_agent(name: str, rng: random.Random) -> Callable[[int], int]:
+    """
+    프레임 번호를 받아 행동 ID를 돌려주는 에이전트 함수를 만듭니다.
+
+    Args:
+        name (str): "random" (일정 프레임마다 무작위 행동) 또는
+            "scripted" (좌우로 오가며 한 프레임씩 번갈아 발사)
+        rng (random.Random): 무작위 에이전트가 쓸 난수 생성기
+
+    Returns:
+        Callable[[int], int]: 프레임 번호 → 행동 ID
+    """
+    from input import NUM_AGENT_ACTIONS
+
+    if name == AGENT_RANDOM:
+        current = [0]
+
+        def random_agent(frame: int) -> int:
+            if frame % ACTION_HOLD_FRAMES == 0:
+                current[0] = rng.randrange(NUM_AGENT_ACTIONS)
+            return current[0]
+
+        return random_agent
+    if name == AGENT_SCRIPTED:
+
+        def scripted_agent(frame: int) -> int:
+            if frame % 2 == 0:
+                return 8  # 발사
+            return 3 if (frame // SWEEP_FRAMES) % 2 == 0 else 4  # 왼쪽 / 오른쪽
+
+        return scripted_agent
+    raise ValueError(f"Unsupported agent: {name!r}. Expected one of {AGENTS}.")
+
+
+def generate_shards(
+    worker_id: int,
+    out_dir: Union[str, Path],
+    num_frames: int,
+    capture_interval: int = DEFAULT_CAPTURE_INTERVAL,
+    image_format: str = IMAGE_FORMAT_NPY,
+    seed: int = 0,
+    agent: str = AGENT_RANDOM,
+    invincible: bool = False,
+    max_shard_frames: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    현재 프로세스에서 게임을 돌리며 샤드를 생성합니다. (워커 프로세스 진입점)
+
+    Args:
+        worker_id (int): 워커 번호 (출력 하위 디렉토리와 시드에 사용)
+        out_dir (Union[str, Path]): 데이터셋 최상위 디렉토리
+        num_frames (int): 진행할 게임 프레임 수
+        capture_interval (int): 캡처 간격 (프레임)
+        image_format (str): 저장 이미지 형식 ("npy", "png", "webp")
+        seed (int): 기본 시드 (워커 번호를 더해 사용)
+        agent (str): 에이전트 종류 ("random", "scripted")
+        invincible (bool): 플레이어를 무적으로 만들어 뒤 스테이지까지 진행할지 여부
+        max_shard_frames (Optional[int]): 샤드 최대 프레임 수 (None이면 기본값)
+
+    Returns:
+        Dict[str, Any]: 워커 통계와 샤드 목록
+    """
+    from data_collection.frame_capture import current_palette_lut, screen_view
+    from data_collection.shard_writer import DEFAULT_MAX_SHARD_FRAMES, ShardWriter
+    from data_collection.yolo_labels import yolo_labels_from_state
+    from rl.env.game_simulator import GameSimulator
+    from states.game_state.game_state_stage import State
+
+    worker_seed = seed + worker_id
+    rng = random.Random(worker_seed)
+    act = make_agent(agent, rng)
+
+    worker_dir_name = f"w{worker_id:02d}"
+    # pyxel 초기화가 작업 디렉토리를 바꾸므로 절대 경로로 고정
+    writer = ShardWriter(
+        out_dir=Path(out_dir).resolve() / worker_dir_name,
+        max_shard_frames=max_shard_frames or DEFAULT_MAX_SHARD_FRAMES,
+        metadata={
+            "image_format": image_format,
+            "image_shape": [APP_HEIGHT, APP_WIDTH],
+            "palette": list(PALETTE),
+            "class_map": dict(CLASS_MAP),
+            "worker": worker_id,
+            "seed": worker_seed,
+            "agent": agent,
+        },
+    )
+
+    sim = GameSimulator(render=False)
+    state = sim.reset(seed=worker_seed)
+    lut = current_palette_lut()
+    episodes = 1
+
+    start = time.perf_counter()
+    for frame in range(num_frames):
+        if invincible:
+            state.player.forced_invincible = True
+        state = sim.step(act(frame))
+        if state is None or state.state == State.GAME_OVER:
+            state = sim.reset()
+            episodes += 1
+            continue
+        if frame % capture_interval == 0:
+            sim.draw()
+            indices = screen_view()
+            labels = yolo_labels_from_state(state)
+            meta = {"episode": episodes - 1, "frame": sim.frame_count}
+            if image_format == IMAGE_FORMAT_NPY:
+                writer.add(indices, labels, meta)
+            else:
+                meta["shape"] = list(indices.shape)
+                writer.add_encoded(
+                    image_format, encode_frame(indices, image_format, lut), labels, meta
+                )
+    writer.close()
+    elapsed = time.perf_counter() - start
+    sim.close()
+
+    return {
+        "worker": worker_id,
+        "dir": worker_dir_name,
+        "frames_simulated": num_frames,
+        "frames_written": writer.total_frames,
+        "episodes": episodes,
+        "seconds": elapsed,
+        "shards": writer.shards,
+    }
+
+
+def _run_worker(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return generate_shards(**kwargs)
+
+
+def generate_dataset(
+    out_dir: Union[str, Path] = DEFAULT_OUT_DIR,
+    num_workers: int = 1,
+    frames_per_worker: int = 10000,
+    **worker_kwargs,
+) -> Dict[str, Any]:
+    """
+    워커 프로세스 N개로 데이터셋을 생성하고 최상위 인덱스를 씁니다.
+
+    Args:
+        out_dir (Union[str, Path]): 데이터셋 최상위 디렉토리
+        num_workers (int): 워커 프로세스 수 (1이면 현재 프로세스에서 실행)
+        frames_per_worker (int): 워커마다 진행할 게임 프레임 수
+        **worker_kwargs: `generate_shards`에 전달할 나머지 인자
+
+    Returns:
+        Dict[str, Any]: 최상위 인덱스 내용
+    """
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, got {num_workers}.")
+    out_dir = Path(out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        dict(worker_kwargs, worker_id=i, out_dir=str(out_dir), num_frames=frames_per_worker)
+        for i in range(num_workers)
+    ]
+
+    start = time.perf_counter()
+    if num_workers == 1:
+        results = [_run_worker(jobs[0])]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=get_context(MP_START_METHOD)
+        ) as executor:
+            results = list(executor.map(_run_worker, jobs))
+    elapsed = time.perf_counter() - start
+
+    shards: List[Dict[str, Any]] = []
+    for result in results:
+        for shard in result["shards"]:
+            shards.append(dict(shard, name=f"{result['dir']}/{shard['name']}"))
+    index = {
+        "version": 1,
+        "total_frames": sum(r["frames_written"] for r in results),
+        "frames_simulated": sum(r["frames_simulated"] for r in results),
+        "seconds": elapsed,
+        "workers": [{k: v for k, v in r.items() if k != "shards"} for r in results],
+        "image_format": worker_kwargs.get("image_format", IMAGE_FORMAT_NPY),
+        "image_shape": [APP_HEIGHT, APP_WIDTH],
+        "palette": list(PALETTE),
+        "class_map": dict(CLASS_MAP),
+        "shards": shards,
+    }
+    (out_dir / "index.json").write_text(json.dumps(index, indent=2), encoding="utf-8")
+    return index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a YOLO dataset from headless game runs.")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--frames", type=int, default=10000, help="game frames per worker")
+    parser.add_argument("--interval", type=int, default=DEFAULT_CAPTURE_INTERVAL, help="capture every N frames")
+    parser.add_argument("--format", choices=IMAGE_FORMATS, default=IMAGE_FORMAT_NPY, help="image format")
+    parser.add_argument("--agent", choices=AGENTS, default=AGENT_RANDOM, help="agent policy")
+    parser.add_argument("--seed", type=int, default=0, help="base seed (worker id is added)")
+    parser.add_argument("--invincible", action="store_true", help="keep the player alive to reach later stages")
+    parser.add_argument("--shard-frames", type=int, default=None, help="max frames per shard")
+    args = parser.parse_args()
+
+    index = generate_dataset(
+        out_dir=args.out,
+        num_workers=args.workers,
+        frames_per_worker=args.frames,
+        capture_interval=args.interval,
+        image_format=args.format,
+        agent=args.agent,
+        seed=args.seed,
+        invincible=args.invincible,
+        max_shard_frames=args.shard_frames,
+    )
+    seconds = index["seconds"]
+    print(
+        f"{index['frames_simulated']} frames simulated, {index['total_frames']} written "
+        f"to {len(index['shards'])} shard(s) in {seconds:.1f}s "
+        f"({index['frames_simulated'] / seconds:.0f} sim frames/s, "
+        f"{index['total_frames'] / seconds:.0f} written frames/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+데이터셋 샤드 기록 모듈
+
+캡처한 프레임(팔레트 인덱스 배열)과 YOLO 라벨을 모아 두지 않고 바로 크기 제한이
+있는 tar 샤드에 이어 씁니다. 메모리에는 현재 샤드 하나(웹) 또는 현재 프레임
+하나(데스크톱)만 남습니다.
+
+샤드 구성 (WebDataset 형식과 같은 "키.확장자" 이름 규칙):
+    {키}.npy   (높이, 너비) uint8 팔레트 인덱스 배열 (np.save 형식, 비압축)
+               (`add_encoded`로 쓰면 .png/.webp 등 인코딩된 RGB 이미지)
+    {키}.txt   YOLO 라벨 (한 줄에 객체 하나, 없으면 빈 파일)
+    {키}.json  프레임 메타데이터 (타임스탬프 등)
+
+샤드를 닫을 때마다 `index.json`을 다시 써서 샤드 목록과 팔레트를 기록합니다.
+(메모리 모드에서는 `flush()` 때만 인덱스를 내보냅니다.)
+팔레트 인덱스로 저장하므로 RGB가 필요하면 인덱스의 `palette`로 변환합니다.
+"""
+
+import io
+import json
+import tarfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# 샤드 하나의 최대 크기 (바이트). 넘으면 다음 프레임부터 새 샤드에 씁니다.
+DEFAULT_MAX_SHARD_BYTES = 64 * 1024 * 1024
+# 샤드 하나의 최대 프레임 수
+DEFAULT_MAX_SHARD_FRAMES = 1000
+
+INDEX_FILE_NAME = "index.json"
+INDEX_VERSION = 1
+
+# 샤드/인덱스를 닫을 때 호출되는 콜백 (파일 이름, 내용)
+ShardSink = Callable[[str, bytes], None]
+
+
+def _tar_add_bytes(tar: tarfile.TarFile, name: str, data: bytes, mtime: float) -> None:
+    """바이트열을 tar 멤버 하나로 추가합니다."""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(mtime)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def encode_npy(array: np.ndarray) -> bytes:
+    """배열을 .npy 파일 내용으로 직렬화합니다."""
+    buffer = io.BytesIO()
+    np.lib.format.write_array(buffer, np.ascontiguousarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+class ShardWriter:
+    """
+    프레임과 라벨을 크기 제한 tar 샤드로 스트리밍 기록하는 클래스.
+
+    `out_dir`를 주면 샤드를 디스크에 바로 쓰고, 주지 않으면(웹 환경) 현재 샤드만
+    메모리에 모았다가 샤드를 닫을 때 `sink(파일 이름, 내용)`으로 넘깁니다.
+    `flush()`는 현재 샤드를 닫으며, 다음 `add()`가 새 샤드를 엽니다.
+
+    Args:
+        out_dir (Optional[Union[str, Path]]): 샤드를 쓸 디렉토리 (None이면 메모리 모드)
+        sink (Optional[ShardSink]): 메모리 모드에서 닫힌 샤드/인덱스를 받을 콜백
+        prefix (str): 샤드 파일 이름 접두어
+        max_shard_bytes (int): 샤드 최대 크기 (바이트)
+        max_shard_frames (int): 샤드 최대 프레임 수
+        metadata (Optional[Dict[str, Any]]): 인덱스에 함께 기록할 정보 (팔레트, 클래스 맵 등)
+    """
+
+    def __init__(
+        self,
+        out_dir: Optional[Union[str, Path]] = None,
+        sink: Optional[ShardSink] = None,
+        prefix: str = "shard",
+        max_shard_bytes: int = DEFAULT_MAX_SHARD_BYTES,
+        max_shard_frames: int = DEFAULT_MAX_SHARD_FRAMES,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if out_dir is None and sink is None:
+            raise ValueError("ShardWriter needs either out_dir or sink.")
+        self.out_dir = Path(out_dir) if out_dir is not None else None
+        if self.out_dir is not None:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.sink = sink
+        self.prefix = prefix
+        self.max_shard_bytes = max_shard_bytes
+        self.max_shard_frames = max_shard_frames
+        self.metadata = dict(metadata or {})
+
+        self.shards: List[Dict[str, Any]] = []  # 닫힌 샤드 정보 (인덱스 내용)
+        self.total_frames = 0
+        self._next_key = 0
+        self._tar: Optional[tarfile.TarFile] = None
+        self._fileobj = None
+        self._shard_name = ""
+        self._shard_frames = 0
+        self._shard_first_key = 0
+
+    @property
+    def shard_open(self) -> bool:
+        """현재 열려 있는 샤드가 있는지 여부"""
+        return self._tar is not None
+
+    @property
+    def current_shard_bytes(self) -> int:
+        """현재 샤드에 지금까지 쓴 바이트 수"""
+        return self._fileobj.tell() if self._fileobj is not None else 0
+
+    def _open_shard(self) -> None:
+        self._shard_name = f"{self.prefix}-{len(self.shards):06d}.tar"
+        if self.out_dir is not None:
+            self._fileobj = open(self.out_dir / self._shard_name, "wb")
+        else:
+            self._fileobj = io.BytesIO()
+        self._tar = tarfile.open(fileobj=self._fileobj, mode="w", format=tarfile.USTAR_FORMAT)
+        self._shard_frames = 0
+        self._shard_first_key = self._next_key
+
+    def _close_shard(self) -> None:
+        self._tar.close()  # tar 끝 표시(빈 블록) 기록
+        size = self._fileobj.tell()
+        if self.out_dir is None:
+            self.sink(self._shard_name, self._fileobj.getvalue())
+        self._fileobj.close()
+        self.shards.append(
+            {
+                "name": self._shard_name,
+                "frames": self._shard_frames,
+                "bytes": size,
+                "first_key": f"{self._shard_first_key:09d}",
+                "last_key": f"{self._next_key - 1:09d}",
+            }
+        )
+        self._tar = None
+        self._fileobj = None
+
+    def _write_index(self) -> None:
+        index = {
+            "version": INDEX_VERSION,
+            "total_frames": self.total_frames,
+            "shards": self.shards,
+            **self.metadata,
+        }
+        data = json.dumps(index, indent=2).encode("utf-8")
+        if self.out_dir is not None:
+            # 쓰는 도중 중단되어도 이전 인덱스가 남도록 임시 파일을 거쳐 교체
+            tmp_path = self.out_dir / (INDEX_FILE_NAME + ".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(self.out_dir / INDEX_FILE_NAME)
+        else:
+            self.sink(INDEX_FILE_NAME, data)
+
+    def add(
+        self,
+        image: np.ndarray,
+        labels: Sequence[str],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        프레임 하나를 현재 샤드에 씁니다. 이미지는 .npy로 저장합니다.
+
+        Args:
+            image (np.ndarray): (높이, 너비) 팔레트 인덱스 배열
+            labels (Sequence[str]): YOLO 라벨 줄 목록
+            meta (Optional[Dict[str, Any]]): 프레임 메타데이터 (None이면 타임스탬프만 기록)
+
+        Returns:
+            str: 프레임 키 (샤드 안의 파일 이름 앞부분)
+        """
+        frame_meta = {"shape": list(image.shape)}
+        if meta:
+            frame_meta.update(meta)
+        return self.add_encoded("npy", encode_npy(image), labels, frame_meta)
+
+    def add_encoded(
+        self,
+        image_ext: str,
+        image_bytes: bytes,
+        labels: Sequence[str],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        이미 인코딩된 이미지(PNG, WebP 등) 프레임 하나를 현재 샤드에 씁니다.
+
+        Args:
+            image_ext (str): 이미지 확장자 ("npy", "png", "webp" 등)
+            image_bytes (bytes): 이미지 파일 내용
+            labels (Sequence[str]): YOLO 라벨 줄 목록
+            meta (Optional[Dict[str, Any]]): 프레임 메타데이터 (None이면 타임스탬프만 기록)
+
+        Returns:
+            str: 프레임 키 (샤드 안의 파일 이름 앞부분)
+        """
+        if self._tar is None:
+            self._open_shard()
+
+        key = f"{self._next_key:09d}"
+        now = time.time()
+        frame_meta = {"timestamp": now}
+        if meta:
+            frame_meta.update(meta)
+
+        tar = self._tar
+        _tar_add_bytes(tar, f"{key}.{image_ext}", image_bytes, now)
+        _tar_add_bytes(tar, key + ".txt", "\n".join(labels).encode("utf-8"), now)
+        _tar_add_bytes(tar, key + ".json", json.dumps(frame_meta).encode("utf-8"), now)
+
+        self._next_key += 1
+        self._shard_frames += 1
+        self.total_frames += 1
+
+        if (
+            self._shard_frames >= self.max_shard_frames
+            or self.current_shard_bytes >= self.max_shard_bytes
+        ):
+            self._close_shard()
+            # 메모리 모드에서는 인덱스를 flush() 때만 내보내 다운로드 수를 줄입니다.
+            if self.out_dir is not None:
+                self._write_index()
+        return key
+
+    def flush(self) -> None:
+        """현재 샤드를 닫고 인덱스를 씁니다. (열린 샤드가 없으면 아무것도 하지 않음)"""
+        if self._tar is not None:
+            self._close_shard()
+            self._write_index()
+
+    def close(self) -> None:
+        """현재 샤드를 닫고 최종 인덱스를 써서 기록을 끝냅니다."""
+        if self._tar is not None:
+            self.flush()
+        elif self.shards:
+            self._write_index()
+
+    def __enter__(self) -> "ShardWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -1,6 +1,7 @@
+import argparse
+import hashlib
 import os
 import shutil
-import random
 from glob import glob
 
 # 경로 설정
@@ -15,27 +16,113 @@ OUT_LABEL_VAL = os.path.join(BASE_DIR, 'dataset/labels/val')
 # 파라미터
 VAL_RATIO = 0.2  # 검증 데이터 비율
 
+# 파일 배치 방식
+MODE_HARDLINK = 'hardlink'  # 하드 링크 (같은 파일 시스템에서만 가능, 실패 시 심볼릭 링크)
+MODE_SYMLINK = 'symlink'  # 심볼릭 링크
+MODE_COPY = 'copy'  # 복사
+MODES = (MODE_HARDLINK, MODE_SYMLINK, MODE_COPY)
+
+
 # 폴더 생성
 def ensure_dirs():
     for d in [OUT_IMG_TRAIN, OUT_IMG_VAL, OUT_LABEL_TRAIN, OUT_LABEL_VAL]:
         os.makedirs(d, exist_ok=True)
 
-def split_dataset():
+
+def is_val(name, val_ratio=VAL_RATIO):
+    """
+    파일 이름의 해시로 검증 세트 여부를 정합니다.
+
+    무작위 셔플과 달리 실행할 때마다 같은 결과가 나오므로, 새 파일이 추가되어도
+    기존 파일은 원래 세트에 남고 새 파일만 배치하면 됩니다.
+
+    Args:
+        name (str): 확장자를 뺀 파일 이름
+        val_ratio (float): 검증 데이터 비율
+
+    Returns:
+        bool: 검증 세트이면 True
+    """
+    digest = hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') < val_ratio * 2 ** 64
+
+
+def split_dataset(val_ratio=VAL_RATIO):
     images = sorted(glob(os.path.join(IMG_DIR, '*.png')))
-    random.shuffle(images)
-    n_val = int(len(images) * VAL_RATIO)
-    val_images = set(images[:n_val])
-    train_images = set(images[n_val:])
+    val_images = set()
+    train_images = set()
+    for img_path in images:
+        base = os.path.splitext(os.path.basename(img_path))[0]
+        (val_images if is_val(base, val_ratio) else train_images).add(img_path)
     return train_images, val_images
 
-def copy_files(image_set, img_out_dir, label_out_dir):
+
+def place_file(src, dst, mode=MODE_HARDLINK):
+    """
+    파일을 지정한 방식으로 배치합니다. 이미 같은 파일이 있으면 아무것도 하지 않습니다.
+
+    Args:
+        src (str): 원본 파일 경로
+        dst (str): 대상 경로
+        mode (str): "hardlink", "symlink", "copy"
+
+    Returns:
+        bool: 새로 배치했으면 True
+    """
+    if os.path.lexists(dst):
+        try:
+            if os.path.samefile(src, dst) or (
+                mode == MODE_COPY and os.path.getmtime(dst) >= os.path.getmtime(src)
+            ):
+                return False
+        except OSError:
+            pass  # 깨진 링크 등은 새로 만듦
+        os.remove(dst)
+
+    if mode == MODE_HARDLINK:
+        try:
+            os.link(src, dst)
+            return True
+        except OSError:
+            mode = MODE_SYMLINK  # 다른 파일 시스템 등
+    if mode == MODE_SYMLINK:
+        try:
+            os.symlink(os.path.abspath(src), dst)
+            return True
+        except OSError:
+            pass  # 심볼릭 링크 권한이 없는 환경 (Windows 등)
+    shutil.copy2(src, dst)
+    return True
+
+
+def remove_stale(out_dir, keep_names):
+    """세트에서 빠진 파일을 출력 디렉토리에서 지웁니다."""
+    removed = 0
+    for name in os.listdir(out_dir):
+        if name not in keep_names:
+            os.remove(os.path.join(out_dir, name))
+            removed += 1
+    return removed
+
+
+def copy_files(image_set, img_out_dir, label_out_dir, mode=MODE_HARDLINK):
+    placed = 0
+    img_names = set()
+    label_names = set()
     for img_path in image_set:
         base = os.path.splitext(os.path.basename(img_path))[0]
         label_path = os.path.join(LABEL_DIR, base + '.txt')
         if not os.path.exists(label_path):
             continue
-        shutil.copy2(img_path, os.path.join(img_out_dir, os.path.basename(img_path)))
-        shutil.copy2(label_path, os.path.join(label_out_dir, os.path.basename(label_path)))
+        img_name = os.path.basename(img_path)
+        label_name = os.path.basename(label_path)
+        img_names.add(img_name)
+        label_names.add(label_name)
+        placed += place_file(img_path, os.path.join(img_out_dir, img_name), mode)
+        placed += place_file(label_path, os.path.join(label_out_dir, label_name), mode)
+    removed = remove_stale(img_out_dir, img_names) + remove_stale(label_out_dir, label_names)
+    return placed, removed
+
 
 def write_yaml():
     yaml_path = os.path.join(BASE_DIR, 'dataset/data.yaml')
@@ -52,14 +139,22 @@ def write_yaml():
         f.write(f"\nnc: {len(class_list)}\n")
         f.write(f"names: {class_list}\n")
 
+
 def main():
+    parser = argparse.ArgumentParser(description="Split the YOLO dataset into train/val sets.")
+    parser.add_argument("--mode", choices=MODES, default=MODE_HARDLINK, help="how to place files")
+    parser.add_argument("--val-ratio", type=float, default=VAL_RATIO, help="validation ratio")
+    args = parser.parse_args()
+
     ensure_dirs()
-    train_images, val_images = split_dataset()
-    copy_files(train_images, OUT_IMG_TRAIN, OUT_LABEL_TRAIN)
-    copy_files(val_images, OUT_IMG_VAL, OUT_LABEL_VAL)
+    train_images, val_images = split_dataset(args.val_ratio)
+    placed_train, removed_train = copy_files(train_images, OUT_IMG_TRAIN, OUT_LABEL_TRAIN, args.mode)
+    placed_val, removed_val = copy_files(val_images, OUT_IMG_VAL, OUT_LABEL_VAL, args.mode)
     write_yaml()
     print(f"Train: {len(train_images)} images, Val: {len(val_images)} images")
+    print(f"Placed {placed_train + placed_val} files, removed {removed_train + removed_val} stale files")
     print(f"data.yaml saved at: {os.path.join(BASE_DIR, 'dataset/data.yaml')}")
 
+
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
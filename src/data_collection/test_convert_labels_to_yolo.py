@@ -0,0 +1,133 @@
+import json
+import os
+import struct
+
+import pytest
+
+from data_collection.convert_labels_to_yolo import (
+    MANIFEST_NAME,
+    PNG_SIGNATURE,
+    convert_all,
+    label_lines,
+    png_size,
+)
+
+
+def _write_png_header(path, width, height):
+    """png_size가 읽는 부분(시그니처 + IHDR)만 있는 PNG 파일을 만듭니다."""
+    with open(path, "wb") as f:
+        f.write(PNG_SIGNATURE + struct.pack(">I", 13) + b"IHDR" + struct.pack(">II", width, height))
+
+
+def _write_label(label_dir, index, enemy_types):
+    label = {
+        "player": {"position": [10, 20], "bbox": [16, 16]},
+        "enemies": [{"type": t, "position": [40, 50], "bbox": [8, 8]} for t in enemy_types],
+    }
+    path = os.path.join(label_dir, f"label_{index:06d}.json")
+    with open(path, "w") as f:
+        json.dump(label, f)
+    return path
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    """라벨 3개와 이미지 3개가 있는 데이터 디렉토리"""
+    dirs = {name: tmp_path / name for name in ("labels", "images", "yolo_labels")}
+    dirs["labels"].mkdir()
+    dirs["images"].mkdir()
+    for i, enemy_types in enumerate([["A"], ["A", "B"], []]):
+        _write_label(dirs["labels"], i, enemy_types)
+        _write_png_header(dirs["images"] / f"frame_{i:06d}.png", 256, 192)
+    dirs["classes"] = tmp_path / "classes.txt"
+    return dirs
+
+
+def _convert(dataset):
+    return convert_all(
+        str(dataset["labels"]),
+        str(dataset["images"]),
+        str(dataset["yolo_labels"]),
+        classes_path=str(dataset["classes"]),
+        workers=1,
+    )
+
+
+def test_png_size_reads_header(tmp_path):
+    """PNG 헤더만으로 이미지 크기를 읽고, PNG가 아니면 ValueError가 발생하는지 테스트"""
+    path = tmp_path / "frame.png"
+    _write_png_header(path, 256, 192)
+    assert png_size(str(path)) == (256, 192)
+
+    (tmp_path / "broken.png").write_bytes(b"not a png file at all....")
+    with pytest.raises(ValueError):
+        png_size(str(tmp_path / "broken.png"))
+
+
+def test_label_lines():
+    """플레이어와 적 박스가 클래스 ID와 정규화 좌표로 변환되는지 테스트"""
+    label = {
+        "player": {"position": [0, 0], "bbox": [50, 20]},
+        "enemies": [{"type": "B", "position": [50, 80], "bbox": [10, 20]}],
+    }
+    lines = label_lines(label, (100, 200), {"player": 0, "enemy_b": 1})
+    assert lines == [
+        "0 0.250000 0.050000 0.500000 0.100000",
+        "1 0.550000 0.450000 0.100000 0.100000",
+    ]
+
+
+def test_rerun_converts_nothing(dataset):
+    """
+    재실행 테스트
+
+    목적: 입력이 바뀌지 않았으면 두 번째 실행에서 라벨을 읽거나 다시 쓰지 않는지 검증
+    """
+    stats = _convert(dataset)
+    assert stats == {"total": 3, "scanned": 3, "converted": 3, "removed": 0}
+    assert dataset["classes"].read_text().split() == ["enemy_a", "enemy_b", "player"]
+    assert (dataset["yolo_labels"] / "label_000001.txt").read_text().splitlines()[0].startswith("2 ")
+
+    stats = _convert(dataset)
+    assert stats == {"total": 3, "scanned": 0, "converted": 0, "removed": 0}
+
+
+def test_changed_and_removed_inputs(dataset):
+    """
+    변경 감지 테스트
+
+    목적: 내용이 바뀐 라벨만 다시 변환하고, 수정 시각만 바뀐 라벨은 해시로 걸러내며,
+    입력이 사라진 라벨은 출력에서 지우는지 검증
+    """
+    _convert(dataset)
+
+    # 내용은 같고 수정 시각만 바뀐 라벨: 다시 읽지만 해시가 같아 변환하지 않음
+    os.utime(dataset["labels"] / "label_000000.json", ns=(1, 1))
+    # 클래스 목록이 그대로인 내용 변경
+    _write_label(dataset["labels"], 2, ["A"])
+    stats = _convert(dataset)
+    assert stats == {"total": 3, "scanned": 2, "converted": 1, "removed": 0}
+    assert (dataset["yolo_labels"] / "label_000002.txt").read_text().splitlines()[1].startswith("0 ")
+
+    os.remove(dataset["labels"] / "label_000000.json")
+    stats = _convert(dataset)
+    assert stats == {"total": 2, "scanned": 0, "converted": 0, "removed": 1}
+    assert not (dataset["yolo_labels"] / "label_000000.txt").exists()
+
+
+def test_new_class_rewrites_all(dataset):
+    """
+    클래스 목록 변경 테스트
+
+    목적: 새 클래스가 생겨 클래스 ID가 바뀌면 모든 라벨을 다시 쓰는지 검증
+    """
+    _convert(dataset)
+    _write_label(dataset["labels"], 3, ["C"])
+    _write_png_header(dataset["images"] / "frame_000003.png", 256, 192)
+
+    stats = _convert(dataset)
+    assert stats == {"total": 4, "scanned": 1, "converted": 4, "removed": 0}
+    with open(dataset["yolo_labels"] / MANIFEST_NAME) as f:
+        manifest = json.load(f)
+    assert manifest["class_list"] == ["enemy_a", "enemy_b", "enemy_c", "player"]
+    assert (dataset["yolo_labels"] / "label_000000.txt").read_text().startswith("3 ")
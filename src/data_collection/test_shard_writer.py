@@ -0,0 +1,123 @@
+import io
+import json
+import tarfile
+
+import numpy as np
+import pytest
+
+from data_collection.shard_writer import INDEX_FILE_NAME, ShardWriter
+
+
+def _frame(value=0):
+    """테스트용 (높이, 너비) 팔레트 인덱스 프레임"""
+    return np.full((4, 6), value, dtype=np.uint8)
+
+
+def _member_names(data: bytes):
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        return tar.getnames()
+
+
+def test_rollover_at_frame_limit(tmp_path):
+    """
+    프레임 수 제한 샤드 분할 테스트
+
+    목적: max_shard_frames마다 새 샤드가 열리고, 닫을 때마다 index.json이 갱신되는지 검증
+    """
+    writer = ShardWriter(tmp_path, max_shard_frames=2)
+    keys = [writer.add(_frame(i), ["0 0.5 0.5 0.1 0.1"]) for i in range(3)]
+    assert keys == ["000000000", "000000001", "000000002"]
+
+    # 첫 샤드는 2프레임째에 닫히고 인덱스가 기록됨
+    index = json.loads((tmp_path / INDEX_FILE_NAME).read_text())
+    assert [shard["name"] for shard in index["shards"]] == ["shard-000000.tar"]
+    assert writer.shard_open
+
+    writer.close()
+    index = json.loads((tmp_path / INDEX_FILE_NAME).read_text())
+    assert index["total_frames"] == 3
+    assert [(s["name"], s["frames"], s["first_key"], s["last_key"]) for s in index["shards"]] == [
+        ("shard-000000.tar", 2, "000000000", "000000001"),
+        ("shard-000001.tar", 1, "000000002", "000000002"),
+    ]
+    for shard in index["shards"]:
+        assert (tmp_path / shard["name"]).stat().st_size == shard["bytes"]
+    assert not (tmp_path / (INDEX_FILE_NAME + ".tmp")).exists()
+
+
+def test_rollover_at_byte_limit(tmp_path):
+    """
+    바이트 크기 제한 샤드 분할 테스트
+
+    목적: 샤드 크기가 max_shard_bytes를 넘으면 프레임 수 제한 전에도 샤드가 닫히는지 검증
+    """
+    with ShardWriter(tmp_path, max_shard_bytes=1, max_shard_frames=100) as writer:
+        for i in range(3):
+            writer.add(_frame(i), [])
+            assert not writer.shard_open
+
+    index = json.loads((tmp_path / INDEX_FILE_NAME).read_text())
+    assert [shard["frames"] for shard in index["shards"]] == [1, 1, 1]
+    assert index["total_frames"] == 3
+
+
+def test_shard_contents_and_metadata(tmp_path):
+    """
+    샤드 내용 테스트
+
+    목적: 프레임마다 .npy/.txt/.json이 기록되고, 인덱스에 metadata가 함께 저장되는지 검증
+    """
+    palette = [[0, 0, 0], [255, 255, 255]]
+    with ShardWriter(tmp_path, metadata={"palette": palette}) as writer:
+        writer.add(_frame(1), ["2 0.5 0.5 0.25 0.25", "19 0.1 0.1 0.05 0.05"], {"episode": 3})
+
+    index = json.loads((tmp_path / INDEX_FILE_NAME).read_text())
+    assert index["palette"] == palette
+
+    with tarfile.open(tmp_path / "shard-000000.tar") as tar:
+        assert tar.getnames() == ["000000000.npy", "000000000.txt", "000000000.json"]
+        image = np.load(io.BytesIO(tar.extractfile("000000000.npy").read()))
+        labels = tar.extractfile("000000000.txt").read().decode("utf-8")
+        meta = json.loads(tar.extractfile("000000000.json").read())
+    assert np.array_equal(image, _frame(1))
+    assert labels.splitlines() == ["2 0.5 0.5 0.25 0.25", "19 0.1 0.1 0.05 0.05"]
+    assert meta["episode"] == 3
+    assert meta["shape"] == [4, 6]
+    assert "timestamp" in meta
+
+
+def test_sink_receives_shards_and_index():
+    """
+    메모리(웹) 모드 테스트
+
+    목적: out_dir 없이 sink를 주면 닫힌 샤드가 sink로 넘어가고, 인덱스는 flush() 때만
+    내보내지는지 검증
+    """
+    received = []
+    writer = ShardWriter(sink=lambda name, data: received.append((name, data)), max_shard_frames=2)
+    for i in range(3):
+        writer.add(_frame(i), [])
+
+    # 프레임 수 제한으로 닫힌 샤드는 인덱스 없이 넘어감
+    assert [name for name, _ in received] == ["shard-000000.tar"]
+    assert _member_names(received[0][1])[0] == "000000000.npy"
+
+    writer.flush()
+    assert [name for name, _ in received] == [
+        "shard-000000.tar",
+        "shard-000001.tar",
+        INDEX_FILE_NAME,
+    ]
+    index = json.loads(received[-1][1])
+    assert index["total_frames"] == 3
+    assert [shard["frames"] for shard in index["shards"]] == [2, 1]
+
+    # 열린 샤드가 없으면 flush()는 아무것도 하지 않음
+    writer.flush()
+    assert len(received) == 3
+
+
+def test_requires_destination():
+    """out_dir와 sink가 모두 없으면 ValueError가 발생하는지 테스트"""
+    with pytest.raises(ValueError):
+        ShardWriter()
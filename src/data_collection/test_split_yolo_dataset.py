@@ -0,0 +1,66 @@
+import os
+
+from data_collection import split_yolo_dataset
+from data_collection.split_yolo_dataset import MODE_COPY, MODE_HARDLINK, copy_files, is_val, place_file
+
+
+def test_is_val_is_deterministic():
+    """
+    검증 세트 배정 테스트
+
+    목적: 같은 이름은 항상 같은 세트에 배정되고, 비율이 대략 val_ratio를 따르는지 검증
+    """
+    names = [f"frame_{i:06d}" for i in range(2000)]
+    first = [is_val(name) for name in names]
+    assert first == [is_val(name) for name in names]
+    assert 0.15 < sum(first) / len(names) < 0.25
+    assert not any(is_val(name, 0.0) for name in names)
+    assert all(is_val(name, 1.0) for name in names)
+
+
+def test_place_file_skips_existing(tmp_path):
+    """
+    파일 배치 테스트
+
+    목적: 이미 같은 파일이 배치되어 있으면 다시 배치하지 않는지 검증
+    """
+    src = tmp_path / "src.txt"
+    src.write_text("label")
+    for mode in (MODE_HARDLINK, MODE_COPY):
+        dst = tmp_path / f"dst_{mode}.txt"
+        assert place_file(str(src), str(dst), mode)
+        assert not place_file(str(src), str(dst), mode)
+        assert dst.read_text() == "label"
+
+
+def test_copy_files_rerun_and_stale(tmp_path, monkeypatch):
+    """
+    세트 배치 재실행 테스트
+
+    목적: 두 번째 실행에서는 새로 배치하는 파일이 없고, 세트에서 빠진 파일은 지워지며,
+    라벨이 없는 이미지는 건너뛰는지 검증
+    """
+    img_dir = tmp_path / "images"
+    label_dir = tmp_path / "labels"
+    img_out = tmp_path / "out_images"
+    label_out = tmp_path / "out_labels"
+    for d in (img_dir, label_dir, img_out, label_out):
+        d.mkdir()
+    monkeypatch.setattr(split_yolo_dataset, "LABEL_DIR", str(label_dir))
+
+    images = []
+    for i in range(3):
+        img = img_dir / f"frame_{i:06d}.png"
+        img.write_bytes(b"png")
+        images.append(str(img))
+        if i < 2:
+            (label_dir / f"frame_{i:06d}.txt").write_text("0 0.5 0.5 0.1 0.1")
+
+    assert copy_files(set(images), str(img_out), str(label_out)) == (4, 0)
+    assert sorted(os.listdir(img_out)) == ["frame_000000.png", "frame_000001.png"]
+    assert copy_files(set(images), str(img_out), str(label_out)) == (0, 0)
+
+    # frame_000001이 세트에서 빠짐
+    assert copy_files({images[0]}, str(img_out), str(label_out)) == (0, 2)
+    assert os.listdir(img_out) == ["frame_000000.png"]
+    assert os.listdir(label_out) == ["frame_000000.txt"]
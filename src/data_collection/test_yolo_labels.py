@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+from config.game_config import CLASS_MAP
+from data_collection.yolo_labels import yolo_label, yolo_labels_from_state
+
+
+def _sprite(type_name, x, y, w=16, h=16, remove=False):
+    """라벨 생성에 필요한 속성만 가진 테스트용 스프라이트"""
+    return SimpleNamespace(
+        type=SimpleNamespace(name=type_name), x=x, y=y, w=w, h=h, remove=remove
+    )
+
+
+def _parse(label):
+    class_id, *box = label.split()
+    return int(class_id), [float(v) for v in box]
+
+
+def test_yolo_label_normalizes_box():
+    """좌상단 좌표/크기가 정규화된 중심 좌표/크기로 바뀌는지 테스트"""
+    assert yolo_label(3, 10, 20, 30, 40, width=100, height=200) == (
+        "3 0.250000 0.200000 0.300000 0.200000"
+    )
+
+
+def test_labels_follow_sprite_list_order():
+    """
+    라벨 순서 테스트
+
+    목적: 플레이어, 적, 보스, 플레이어 발사체, 적 발사체, 파워업 순서로 기록되는지 검증
+    """
+    state = SimpleNamespace(
+        player=_sprite("PLAYER", 10, 10),
+        enemies=[_sprite("ENEMY_A", 50, 50)],
+        bosses=[],
+        player_shots=[_sprite("PLAYER_SHOT", 20, 10, 8, 4)],
+        enemy_shots=[_sprite("ENEMY_SHOT", 60, 60, 4, 4)],
+        powerups=[_sprite("POWERUP", 100, 100)],
+    )
+    class_ids = [_parse(label)[0] for label in yolo_labels_from_state(state)]
+    assert class_ids == [
+        CLASS_MAP["player"],
+        CLASS_MAP["enemy_a"],
+        CLASS_MAP["player_shot"],
+        CLASS_MAP["enemy_shot"],
+        CLASS_MAP["powerup"],
+    ]
+
+
+def test_skips_removed_unknown_and_missing():
+    """
+    제외 대상 테스트
+
+    목적: 제거 표시된 스프라이트, CLASS_MAP에 없는 타입, 상태에 없는 목록을 건너뛰는지 검증
+    """
+    state = SimpleNamespace(
+        player=None,
+        enemies=[
+            _sprite("ENEMY_B", 10, 10, remove=True),
+            _sprite("EXPLOSION", 10, 10),
+            _sprite("ENEMY_C", 10, 10),
+        ],
+    )
+    labels = yolo_labels_from_state(state)
+    assert [_parse(label)[0] for label in labels] == [CLASS_MAP["enemy_c"]]
+
+
+def test_clipping_to_screen():
+    """
+    화면 자르기 테스트
+
+    목적: clip=True이면 화면에 걸친 박스는 화면 안으로 잘리고 화면 밖 스프라이트는 빠지며,
+    clip=False이면 그대로 기록되는지 검증
+    """
+    state = SimpleNamespace(
+        enemies=[_sprite("ENEMY_A", -8, 0, 16, 16), _sprite("ENEMY_A", -32, 0, 16, 16)]
+    )
+    clipped = yolo_labels_from_state(state, width=100, height=100)
+    assert len(clipped) == 1
+    _, (cx, cy, w, h) = _parse(clipped[0])
+    assert (cx, cy, w, h) == (0.04, 0.08, 0.08, 0.16)
+
+    unclipped = yolo_labels_from_state(state, width=100, height=100, clip=False)
+    assert len(unclipped) == 2
+    assert _parse(unclipped[0])[1] == [0.0, 0.08, 0.16, 0.16]
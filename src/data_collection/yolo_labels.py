@@ -0,0 +1,103 @@
+"""
+YOLO 라벨 생성 모듈
+
+게임 상태의 스프라이트 좌표(x, y, w, h)와 `config.game_config.CLASS_MAP`으로 정확한
+바운딩 박스를 만듭니다. 게임 내 수집(`App`)과 오프라인 생성기
+(`data_collection.generate_dataset`)가 같은 함수를 사용합니다.
+"""
+
+from typing import List, Optional, Tuple
+
+from config.app.constants import APP_WIDTH, APP_HEIGHT
+from config.game_config import CLASS_MAP
+
+# 라벨을 만들 게임 상태 속성 (순서대로 기록)
+LABELED_SPRITE_LISTS = (
+    "enemies",
+    "bosses",
+    "player_shots",
+    "enemy_shots",
+    "powerups",
+)
+
+
+def _clip_box(
+    x: float, y: float, w: float, h: float, width: int, height: int
+) -> Optional[Tuple[float, float, float, float]]:
+    """박스를 화면 안으로 자릅니다. 화면 밖이면 None을 반환합니다."""
+    x0 = max(x, 0.0)
+    y0 = max(y, 0.0)
+    x1 = min(x + w, width)
+    y1 = min(y + h, height)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def yolo_label(
+    class_id: int,
+    x: float,
+    y: float,
+    w: float,
+    h: float,
+    width: int = APP_WIDTH,
+    height: int = APP_HEIGHT,
+) -> str:
+    """
+    좌상단 좌표와 크기로 YOLO 라벨 한 줄을 만듭니다.
+
+    Args:
+        class_id (int): 클래스 ID
+        x, y (float): 박스 좌상단 좌표 (픽셀)
+        w, h (float): 박스 크기 (픽셀)
+        width, height (int): 이미지 크기 (픽셀)
+
+    Returns:
+        str: "클래스 x중심 y중심 너비 높이" (좌표는 0~1로 정규화)
+    """
+    return (
+        f"{class_id} {(x + w / 2) / width:.6f} {(y + h / 2) / height:.6f} "
+        f"{w / width:.6f} {h / height:.6f}"
+    )
+
+
+def yolo_labels_from_state(
+    state,
+    width: int = APP_WIDTH,
+    height: int = APP_HEIGHT,
+    clip: bool = True,
+) -> List[str]:
+    """
+    게임 상태의 모든 스프라이트로 YOLO 라벨 목록을 만듭니다.
+
+    플레이어, 적, 보스, 플레이어 발사체, 적 발사체, 파워업 순서로 기록하며,
+    제거 표시된 스프라이트와 `CLASS_MAP`에 없는 타입은 건너뜁니다.
+
+    Args:
+        state: 게임 상태 객체 (`GameStateStage` 등, 없는 목록은 건너뜀)
+        width, height (int): 이미지 크기 (픽셀)
+        clip (bool): 박스를 화면 안으로 자르고 화면 밖 스프라이트를 뺄지 여부
+
+    Returns:
+        List[str]: YOLO 라벨 줄 목록
+    """
+    sprites = []
+    player = getattr(state, "player", None)
+    if player:
+        sprites.append(player)
+
+    labels = []
+    for sprite_list in [sprites] + [getattr(state, name, ()) for name in LABELED_SPRITE_LISTS]:
+        for obj in sprite_list:
+            if not obj or obj.remove:
+                continue
+            class_id = CLASS_MAP.get(obj.type.name.lower())
+            if class_id is None:
+                continue
+            box = (obj.x, obj.y, obj.w, obj.h)
+            if clip:
+                box = _clip_box(*box, width, height)
+                if box is None:
+                    continue
+            labels.append(yolo_label(class_id, *box, width, height))
+    return labels
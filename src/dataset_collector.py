@@ -1,3 +1,9 @@
+"""
+pyautogui 스크린샷 기반 수집기.
+
+게임 상태의 정확한 좌표로 라벨을 만드는 오프라인 생성기
+`data_collection.generate_dataset`(라벨러: `data_collection.yolo_labels`)를 사용하세요.
+"""
 import os
 import pyautogui
 import cv2
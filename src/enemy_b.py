@@ -10,6 +10,8 @@ BULLET_SPEED = 2
 
 
 class EnemyB(Enemy):
+    __slots__ = ()
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_B  # EnemyB 타입으로 설정
@@ -5,6 +5,8 @@ SPEED_Y = 2
 
 
 class EnemyD(Enemy):
+    __slots__ = ("vx", "vy")
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_D  # EnemyD 타입으로 설정
@@ -6,6 +6,8 @@ BULLET_SPEED = 2
 
 
 class EnemyE(Enemy):
+    __slots__ = ()
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_E  # EnemyE 타입으로 설정
@@ -5,6 +5,8 @@ SPEED_Y = 1.5
 
 
 class EnemyG(Enemy):
+    __slots__ = ("speed",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_G  # EnemyG 타입으로 설정
@@ -7,6 +7,8 @@ GRAVITY = 0.2
 
 
 class EnemyH(Enemy):
+    __slots__ = ("vel_y",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_H  # EnemyH 타입으로 설정
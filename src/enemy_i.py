@@ -7,6 +7,8 @@ VEL_Y = [-0.5, 1, -1.25, 1.25, -1, 0.5]
 
 
 class EnemyI(Enemy):
+    __slots__ = ("vel_y_index",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_I  # EnemyI 타입으로 설정
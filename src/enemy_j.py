@@ -5,6 +5,8 @@ BULLET_SPEED = 1.5
 
 
 class EnemyJ(Enemy):
+    __slots__ = ("speed_x",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_J  # EnemyJ 타입으로 설정
@@ -9,6 +9,8 @@ MOVE_SPEED_Y = 0.5
 
 
 class EnemyK(Enemy):
+    __slots__ = ("speed_x", "speed_y")
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_K  # EnemyK 타입으로 설정
@@ -55,9 +57,10 @@ class EnemyK(Enemy):
                 self.shoot()
 
     def explode(self):
+        rng = self.game_state.game.rng
         for i in range(12):
             self.game_state.add_explosion(
-                self.x + 8 + px.rndi(-12, 12), self.y + 8 + px.rndi(-6, 6), i * 5
+                self.x + 8 + rng.randint(-12, 12), self.y + 8 + rng.randint(-6, 6), i * 5
             )
 
     def destroy(self):
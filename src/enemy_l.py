@@ -9,6 +9,8 @@ BULLET_SPEED = 1.5
 
 # Boss: large leaves
 class EnemyL(Enemy):
+    __slots__ = ("speed_x",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_L  # EnemyL 타입으로 설정
@@ -42,9 +44,10 @@ class EnemyL(Enemy):
                 self.shoot()
 
     def explode(self):
+        rng = self.game_state.game.rng
         for i in range(6):
             self.game_state.add_explosion(
-                self.x + 8 + px.rndi(-12, 12), self.y + 8 + px.rndi(-6, 6), i * 5
+                self.x + 8 + rng.randint(-12, 12), self.y + 8 + rng.randint(-6, 6), i * 5
             )
 
     def destroy(self):
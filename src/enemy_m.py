@@ -8,6 +8,8 @@ BULLET_SPEED = 1.5
 
 # Boss: Eye
 class EnemyM(Enemy):
+    __slots__ = ("speed_x",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.colour = 9  # light red
@@ -42,9 +44,10 @@ class EnemyM(Enemy):
                 self.shoot()
 
     def explode(self):
+        rng = self.game_state.game.rng
         for i in range(6):
             self.game_state.add_explosion(
-                self.x + 8 + px.rndi(-12, 12), self.y + 8 + px.rndi(-6, 6), i * 5
+                self.x + 8 + rng.randint(-12, 12), self.y + 8 + rng.randint(-6, 6), i * 5
             )
 
     def destroy(self):
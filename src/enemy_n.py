@@ -6,6 +6,8 @@ SPEED_Y = 0.5
 
 
 class EnemyN(Enemy):
+    __slots__ = ("speed_y",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_N  # EnemyN 타입으로 설정
@@ -8,6 +8,8 @@ SHOT_DELAY = 120
 
 
 class EnemyO(Enemy):
+    __slots__ = ("shot_delay",)
+
     def __init__(self, state, x, y) -> None:
         super().__init__(state, x, y)
         self.type = EntityType.ENEMY_O  # EnemyO 타입으로 설정
@@ -106,7 +106,7 @@ class EnemyShot(Sprite):
             return
 
         # 색상 변경 (10프레임마다)
-        if px.frame_count % 10 == 0:
+        if self.game_state.game.frame_count % 10 == 0:
             self.colour = 8 if (self.colour == 11) else 11
 
     def draw(self):
@@ -2,16 +2,12 @@ import pyxel as px
 
 from components.sprite import Sprite
 from config.sound import SoundType
-from audio import AudioManager
 
 # 폭발 애니메이션 프레임 정보
 FRAMES = ((0, 64), (16, 64), (32, 64))
 MAX_FRAMES = len(FRAMES)  # 프레임 수
 FRAME_DELAY = 5  # 프레임 지연 시간
 
-# 오디오 매니저 인스턴스 생성
-audio_manager = AudioManager()
-
 class Explosion(Sprite):
     """
     폭발 효과를 나타내는 클래스
@@ -19,6 +15,10 @@ class Explosion(Sprite):
     폭발 효과의 애니메이션과 사운드를 관리합니다.
     """
 
+    __slots__ = ("delay", "frame", "frame_delay")
+
+    pooled = True  # 폭발은 한 번에 여러 개씩 생성되므로 인스턴스를 재사용
+
     def __init__(self, game_state, x, y, delay) -> None:
         """
         폭발 효과 초기화
@@ -44,7 +44,7 @@ class Explosion(Sprite):
         """
         폭발 사운드 재생
         """
-        audio_manager.play_sound(SoundType.EXPLODE_SMALL)
+        self.game_state.game.audio.play_sound(SoundType.EXPLODE_SMALL)
 
     def update(self):
         """
@@ -67,7 +67,7 @@ class Explosion(Sprite):
             self.v = FRAMES[self.frame][1]  # v좌표 업데이트
 
         if self.frame == 0:
-            audio_manager.play_sound(SoundType.EXPLOSION)
+            self.game_state.game.audio.play_sound(SoundType.EXPLOSION)
 
     def draw(self):
         """
@@ -6,10 +6,12 @@ from states.game_state.game_state_stage import GameStateStage
 # from states.game_state.game_state_titles import GameStateTitles # 필요시 주석 해제
 # from states.game_state.game_state_complete import GameStateComplete # 필요시 주석 해제
 from game_vars import GameVars
+from audio import AudioManager
 # from utils.transform_utils import transform_game_to_image_coords # 데이터 수집 시 필요
 # from data_collection.screen_capture import ScreenCapture # 데이터 수집 시 필요
 # from data_collection.label_generator import LabelGenerator # 데이터 수집 시 필요
 import os
+import random
 import time
 from config.game_config import CLASS_MAP # 데이터 수집 시 필요. CLASS_MAP이 정의되어 있어야 함.
 
@@ -23,17 +25,38 @@ class GameState(Enum):
     GAME_COMPLETE = auto()
 
 class Game:
-    def __init__(self, app):
+    def __init__(self, app, seed=None, audio=None):
         self.app = app
+        # 이 게임이 쓰는 오디오 백엔드 (AudioManager: pyxel, NullAudio/RecordingAudio: 헤드리스).
+        # 게임 로직은 모듈 전역 대신 항상 game.audio로 소리를 냅니다.
+        self.audio = audio if audio is not None else AudioManager()
         self.next_state = None
         self.game_vars = GameVars(self)
         self.collected_frames_data = [] # 데이터 수집용
+        # 게임 로직이 쓰는 난수 생성기와 프레임 카운터 (px.rndi / px.frame_count 대신 사용).
+        # 같은 시드와 같은 프레임별 입력이면 게임 진행이 항상 같습니다.
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.frame_count = 0 # start_new_game 이후 진행된 update 횟수
+        self.total_frames = 0 # 이 Game이 진행한 update 횟수 (새 게임/스냅샷 복원에도 줄지 않음)
+        # 점수/목숨/데미지/스테이지 이벤트를 받는 보상 리스너 (rl.reward.RewardAccumulator).
+        # None이면 이벤트를 보내지 않습니다.
+        self.reward_listener = None
+        self.audio.attach(self)
 
         # 게임 시작 시 바로 스테이지로 진입 (타이틀 생략)
-        self.start_new_game() # GameVars 초기화 및 첫 스테이지 시작
+        self.start_new_game(seed) # GameVars 초기화 및 첫 스테이지 시작
 
-    def start_new_game(self):
-        """새 게임을 시작합니다 (스테이지 1부터)."""
+    def start_new_game(self, seed=None):
+        """
+        새 게임을 시작합니다 (스테이지 1부터).
+
+        seed를 주면 게임 난수 생성기를 다시 시드합니다. (None이면 이어서 사용)
+        """
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
+        self.frame_count = 0
         self.game_vars.new_game() # 점수, 목숨, 스테이지 등 초기화
         try:
             print("[GAME_PY_DEBUG] Starting new game, initializing GameStateStage.")
@@ -51,6 +74,8 @@ class Game:
 
     def go_to_next_stage(self):
         """다음 스테이지로 진행합니다."""
+        if self.reward_listener is not None:
+            self.reward_listener.on_stage_cleared()
         if self.game_vars.go_to_next_stage():
             try:
                 print(f"[GAME_PY_DEBUG] Going to next stage: {self.game_vars.stage_num}")
@@ -63,6 +88,8 @@ class Game:
         else:
             # TODO: 게임 완료 처리 (예: GameStateComplete 상태로 전환)
             print("[GAME_PY_DEBUG] Final stage cleared. Game complete (Not implemented).")
+            if self.reward_listener is not None:
+                self.reward_listener.on_game_complete()
             self.go_to_titles() # 임시로 타이틀로 이동 (또는 재시작)
 
     def go_to_titles(self):
@@ -84,6 +111,9 @@ class Game:
         if self.next_state:
             self.state = self.next_state
             self.next_state = None
+
+        self.frame_count += 1
+        self.total_frames += 1
     
     def draw(self):
         if self.state:
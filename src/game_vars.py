@@ -19,6 +19,12 @@ class GameVars:
         for _ in range(MAX_WEAPONS):
             self.weapon_levels.append(0)
         self.stage_num = StageNum.STAGE_1
+        # HUD에 표시되는 값(score, hi_score, lives, current_weapon, weapon_levels)이
+        # 바뀔 때마다 증가하는 카운터. Hud는 이 값이 바뀌었을 때만 다시 그립니다.
+        self.version = 0
+
+    def mark_changed(self):
+        self.version += 1
 
     def is_vortex_stage(self):
         return self.stage_num % 2 == 0
@@ -33,6 +39,7 @@ class GameVars:
         for i in range(len(self.weapon_levels)):
             self.weapon_levels[i] = 0
         self.lives = STARTING_LIVES
+        self.mark_changed()
 
     def go_to_next_stage(self):
         if self.stage_num < FINAL_STAGE:
@@ -41,29 +48,48 @@ class GameVars:
         return False
 
     def add_life(self):
-        self.lives = min(MAX_LIVES, self.lives + 1)
+        lives = self.lives
+        self.lives = min(MAX_LIVES, lives + 1)
+        self.mark_changed()
+        # 보상 리스너 (rl.reward.RewardAccumulator, 없으면 None)
+        listener = self.game.reward_listener
+        if listener is not None and self.lives > lives:
+            listener.on_life_gained()
 
     def subtract_life(self):
         self.lives = max(0, self.lives - 1)
+        self.mark_changed()
+        listener = self.game.reward_listener
+        if listener is not None:
+            listener.on_life_lost()
 
     def add_score(self, s):
-        self.score = min(MAX_SCORE, self.score + s)
+        score = self.score
+        self.score = min(MAX_SCORE, score + s)
         self.hi_score = max(self.score, self.hi_score)
+        self.mark_changed()
+        listener = self.game.reward_listener
+        if listener is not None:
+            listener.on_score(self.score - score)
 
     def decrease_all_weapon_levels(self, amount):
         for i in range(len(self.weapon_levels)):
             self.weapon_levels[i] = max(0, self.weapon_levels[i] - amount)
+        self.mark_changed()
 
     def increase_all_weapon_levels(self, amount):
         for i in range(len(self.weapon_levels)):
             self.weapon_levels[i] = min(
                 MAX_WEAPON_LEVEL, self.weapon_levels[i] + amount
             )
+        self.mark_changed()
 
     def change_weapon(self, new_wpn):
         self.current_weapon = new_wpn
+        self.mark_changed()
 
     def add_current_weapon_level(self):
         self.weapon_levels[self.current_weapon] = min(
             MAX_WEAPON_LEVEL, self.weapon_levels[self.current_weapon] + 1
         )
+        self.mark_changed()
@@ -2,11 +2,23 @@ import pyxel as px
 
 from config.player import max_weapons, max_weapon_level, weapon_names
 
+# HUD를 미리 그려 두는 이미지 뱅크 (0번은 게임 그래픽, 2번은 문자열 캐시)
+HUD_IMAGE = 1
+BAR_WIDTH = 256
+BAR_HEIGHT = 16
+TOP_BAR_Y = 0
+BOTTOM_BAR_Y = 176
+
+# HUD 이미지에 마지막으로 그린 (GameVars, version). 모든 Hud가 같은 이미지 뱅크를 씁니다.
+_composed = None
+
 
 class Hud:
     """
     게임의 헤드업 디스플레이(HUD)를 담당하는 클래스.
 
+    HUD는 `HUD_IMAGE` 이미지 뱅크에 그려 두고, `GameVars`의 값이 바뀌었을 때만 다시 그린다.
+
     속성:
         game_vars: 게임 변수 관리 객체
         font: 텍스트 렌더링을 위한 폰트 객체
@@ -23,61 +35,88 @@ class Hud:
         self.game_vars = game_vars
         self.font = font
 
-    def draw_weapon_level(self, i: int, x: int, y: int) -> None:
+    def draw_weapon_level(self, image, i: int, x: int, y: int) -> None:
         """
-        특정 무기의 레벨을 화면에 그린다.
+        특정 무기의 레벨을 HUD 이미지에 그린다.
 
         매개변수:
+            image: 그릴 대상 이미지 (`px.Image`)
             i (int): 무기 인덱스
             x (int): 그리기 시작 x 좌표
             y (int): 그리기 시작 y 좌표
         """
         # 무기 이름 그리기
-        self.font.draw_text(x + 16, y, weapon_names[i])
+        self.font.draw_glyphs(image.blt, x + 16, y, weapon_names[i])
         # 무기 아이콘 그리기
-        px.blt(x + 24, y, 0, i * 16, 224, 16, 8)
+        image.blt(x + 24, y, 0, i * 16, 224, 16, 8)
 
         # 무기 레벨 표시 그리기
         j = 0
         while j <= self.game_vars.weapon_levels[i]:
             # 활성화된 레벨 표시
-            px.blt(x + (j * 8), y + 8, 0, 32, 232, 8, 8)
+            image.blt(x + (j * 8), y + 8, 0, 32, 232, 8, 8)
             j += 1
         while j <= max_weapon_level:
             # 비활성화된 레벨 표시
-            px.blt(x + (j * 8), y + 8, 0, 40, 232, 8, 8)
+            image.blt(x + (j * 8), y + 8, 0, 40, 232, 8, 8)
             j += 1
 
-    def draw(self) -> None:
+    def compose(self) -> None:
         """
-        HUD를 화면에 그린다.
+        HUD 상단/하단 막대를 HUD 이미지 뱅크에 다시 그린다.
+
+        상단 막대는 이미지의 (0, 0), 하단 막대는 (0, BAR_HEIGHT) 위치에 그린다.
         """
+        global _composed
+        image = px.images[HUD_IMAGE]
+        draw_text = self.font.draw_glyphs
+        blt = image.blt
+
         # 상단 및 하단 배경 그리기
-        px.rect(0, 0, 256, 16, 1)
-        px.rect(0, 176, 256, 16, 1)
+        image.rect(0, 0, BAR_WIDTH, BAR_HEIGHT * 2, 1)
 
         # 상단 정보 그리기
         # 1UP 점수
-        self.font.draw_text(24, 0, "1UP")
-        self.font.draw_text(16, 8, f"{self.game_vars.score:06}")
+        draw_text(blt, 24, 0, "1UP")
+        draw_text(blt, 16, 8, f"{self.game_vars.score:06}")
 
         # 최고 점수
-        self.font.draw_text(96, 0, "HI-SCORE")
-        self.font.draw_text(104, 8, f"{self.game_vars.hi_score:06}")
+        draw_text(blt, 96, 0, "HI-SCORE")
+        draw_text(blt, 104, 8, f"{self.game_vars.hi_score:06}")
 
         # 현재 무기 정보
-        self.font.draw_text(176, 0, "ARM")
-        self.font.draw_text(176, 8, weapon_names[self.game_vars.current_weapon])
-        px.blt(184, 8, 0, self.game_vars.current_weapon * 16, 224, 16, 8)
+        draw_text(blt, 176, 0, "ARM")
+        draw_text(blt, 176, 8, weapon_names[self.game_vars.current_weapon])
+        image.blt(184, 8, 0, self.game_vars.current_weapon * 16, 224, 16, 8)
 
         # 생명 수 표시
-        px.blt(216, 0, 0, 0, 4, 16, 8, 0)
-        self.font.draw_text(224, 8, f"{self.game_vars.lives}")
+        image.blt(216, 0, 0, 0, 4, 16, 8, 0)
+        draw_text(blt, 224, 8, f"{self.game_vars.lives}")
 
         # 하단 정보 그리기
-        self.font.draw_text(16, 176, "ARM")
-        self.font.draw_text(16, 184, "LVL")
+        y = BAR_HEIGHT
+        draw_text(blt, 16, y, "ARM")
+        draw_text(blt, 16, y + 8, "LVL")
 
         # 무기 레벨 정보
         for i in range(max_weapons):
-            self.draw_weapon_level(i, 56 + (64 * i), 176)
+            self.draw_weapon_level(image, i, 56 + (64 * i), y)
+
+        _composed = (self.game_vars, self.game_vars.version)
+
+    def draw(self) -> None:
+        """
+        HUD를 화면에 그린다.
+
+        `GameVars.version`이 마지막으로 그린 뒤 바뀌었을 때만 HUD 이미지를 다시 그리고,
+        화면에는 상단/하단 막대를 각각 blt 한 번으로 복사한다.
+        """
+        composed = _composed
+        if (
+            composed is None
+            or composed[0] is not self.game_vars
+            or composed[1] != self.game_vars.version
+        ):
+            self.compose()
+        px.blt(0, TOP_BAR_Y, HUD_IMAGE, 0, 0, BAR_WIDTH, BAR_HEIGHT)
+        px.blt(0, BOTTOM_BAR_Y, HUD_IMAGE, 0, BAR_HEIGHT, BAR_WIDTH, BAR_HEIGHT)
@@ -10,6 +10,23 @@ BUTTON_2 = 5  # 버튼 2 입력 (X, 게임패드 B 버튼)
 INVINCIBLE = 6  # 무적 모드 토글 입력 (I 키)
 COLLECT_DATA = 7  # 데이터 수집 토글 입력 (C 키)
 
+# RL 에이전트 행동 ID별 입력 조합 (왼쪽, 오른쪽, 위, 아래, 발사)
+AGENT_ACTIONS = (
+    (True, False, True, False, False),  # 0: 왼쪽 위
+    (False, False, True, False, False),  # 1: 위
+    (False, True, True, False, False),  # 2: 오른쪽 위
+    (True, False, False, False, False),  # 3: 왼쪽
+    (False, True, False, False, False),  # 4: 오른쪽
+    (True, False, False, True, False),  # 5: 왼쪽 아래
+    (False, False, False, True, False),  # 6: 아래
+    (False, True, False, True, False),  # 7: 오른쪽 아래
+    (False, False, False, False, True),  # 8: 발사
+)
+# 에이전트 행동 공간 크기
+NUM_AGENT_ACTIONS = len(AGENT_ACTIONS)
+# 모든 입력을 뗀 상태 (정의되지 않은 행동 ID에 사용)
+NO_AGENT_ACTION = (False, False, False, False, False)
+
 
 class Input:
     """
@@ -35,6 +52,25 @@ class Input:
         self.fire_pressed = False  # Z키에 해당
         self.z_pressed = False     # Z키 직접 제어용
 
+    def apply_agent_action(self, action_id) -> None:
+        """
+        RL 에이전트의 행동 ID를 직접 입력 상태로 반영.
+
+        매개변수:
+            action_id: `AGENT_ACTIONS`의 인덱스 (정의되지 않은 값이면 모든 입력을 뗌)
+        """
+        if action_id is not None and 0 <= int(action_id) < NUM_AGENT_ACTIONS:
+            pressed = AGENT_ACTIONS[int(action_id)]
+        else:
+            pressed = NO_AGENT_ACTION
+        (
+            self.left_pressed,
+            self.right_pressed,
+            self.up_pressed,
+            self.down_pressed,
+            self.fire_pressed,
+        ) = pressed
+
     def is_pressing(self, i: int) -> bool:
         """
         특정 입력이 현재 눌려져 있는지 확인.
@@ -4,25 +4,23 @@ import sys
 import platform
 import traceback
 import time # For timestamping (optional)
-import json
+import atexit
 
-# 웹 환경에서만 Pillow, io, base64, numpy를 import 시도
 IS_WEB = platform.system() == "Emscripten"
 if IS_WEB:
     import js
-    # json은 이미 위에서 import
-    try:
-        from PIL import Image as PILImage
-        import io
-        import base64
-        import numpy # numpy는 Pillow 내부 또는 다른 곳에서 필요할 수 있음
-    except ImportError as e:
-        print(f"[APP_ERROR] Failed to import libraries for image processing: {e}. Data collection might fail.")
-        # Pillow 등이 없으면 이미지 처리가 불가능하므로, 이후 로직에서 이를 고려해야 함.
-        PILImage = None
-        io = None
-        base64 = None
-        numpy = None
+
+# 데이터 수집용 라이브러리 (NumPy가 없으면 데이터 수집을 할 수 없음)
+try:
+    from data_collection import frame_capture
+    from data_collection.shard_writer import ShardWriter
+    from data_collection.frame_encoder import FrameEncoderPool
+    from data_collection.yolo_labels import yolo_labels_from_state
+except ImportError as e:
+    print(f"[APP_ERROR] Failed to import libraries for data collection: {e}. Data collection is disabled.")
+    frame_capture = None
+    ShardWriter = None
+    FrameEncoderPool = None
 
 from game import Game
 from config.app.constants import (
@@ -33,23 +31,41 @@ from config.app.constants import (
     APP_CAPTURE_SCALE,
     APP_FPS,
 )
-from config.paths import ASSETS_DIR
+from config.paths import ASSETS_DIR, DATA_DIR
 from config.colors import PALETTE
 from config.game_config import CLASS_MAP # YOLO 라벨링용
 from monospace_bitmap_font import MonospaceBitmapFont
+from audio import music_registry
+from render_policy import RenderPolicy
 import input as input_module # 수정된 방식
 
+# 스레드가 없는 웹 환경에서 캡처 프레임 인코딩에 쓸 프레임 시간의 비율.
+# 게임 로직이 쓰고 남은 시간 중 이 비율까지만 쓰고, 나머지는 그리기에 남겨 둡니다.
+CAPTURE_IDLE_FRACTION = 0.5
+
 print("[MAIN_PY_DEBUG] App class definition START")
 class App:
-    def __init__(self, agent=None) -> None:
+    def __init__(self, agent=None, render_policy=None) -> None:
         print("[MAIN_PY_DEBUG] App.__init__ VERY START")
         try:
             self.agent = agent
+            # 어떤 프레임을 그릴지 정하는 정책 (기본값: 매 프레임)
+            self.render_policy = render_policy if render_policy is not None else RenderPolicy()
+            # 에이전트에 전달할 엔티티 상태 관측값 (에이전트가 있을 때만 NumPy 사용)
+            self.obs_builder = None
+            if agent is not None:
+                try:
+                    from rl.observation import EntityObservationBuilder
+                    self.obs_builder = EntityObservationBuilder()
+                except ImportError as e:  # 웹 빌드 등 NumPy가 없으면 관측값 없이 진행
+                    print(f"[APP_WARNING] Entity observations unavailable: {e}")
             # Data collection variables
             self.collecting_data = False # 데이터 수집 활성화 여부 (C키로 토글 가능하도록 설정)
-            self.collected_data = []
+            self.frame_encoder = None  # 수집한 프레임을 인코딩해 샤드로 기록 (첫 캡처 시 생성)
+            self.capture_image_format = "npy"  # 샤드에 저장할 이미지 형식 ("npy", "png", "webp")
             self.capture_interval = 10 # 캡처 간격 (프레임)
             self.frames_since_last_capture = 0
+            self.palette_lut = None  # 캡처용 팔레트 변환 테이블 (첫 캡처 시 생성)
             
             if IS_WEB:
                 px.init(
@@ -89,6 +105,10 @@ class App:
                 excl_musics=True,
             )
 
+            # 음악 파일을 백그라운드에서 미리 파싱 (웹은 스레드가 없으므로 처음 재생할 때 읽음)
+            if not IS_WEB:
+                music_registry.preload_async()
+
             self.main_font = MonospaceBitmapFont()
             self.input = input_module.Input()
             self.game = Game(self)
@@ -102,50 +122,52 @@ class App:
             raise
 
     def toggle_data_collection(self):
-        """데이터 수집 상태를 토글합니다."""
+        """데이터 수집 상태를 토글합니다. 수집을 멈추면 현재 샤드를 닫습니다."""
         self.collecting_data = not self.collecting_data
         if self.collecting_data:
             print("[APP_DEBUG] Data collection STARTED (toggled from game state).")
-            self.collected_data.clear()
         else:
             print("[APP_DEBUG] Data collection STOPPED (toggled from game state).")
-            if IS_WEB and self.collected_data:
-                print(f"[APP_DEBUG] {len(self.collected_data)} frames collected. Press 'S' to download.")
+            if self.frame_encoder is not None:
+                # 대기 중인 프레임을 모두 기록하고 현재 샤드를 닫음
+                self.frame_encoder.flush()
+                writer = self.frame_encoder.writer
+                print(f"[APP_DEBUG] {writer.total_frames} frames written to {len(writer.shards)} shard(s). Encoder stats: {self.frame_encoder.stats()}")
 
-    def apply_agent_action(self, action_id):
-        self.input.left_pressed = False
-        self.input.right_pressed = False
-        self.input.up_pressed = False
-        self.input.down_pressed = False
-        self.input.fire_pressed = False
+    def _create_frame_encoder(self):
+        """샤드 기록기와 인코더 풀을 만듭니다. (웹에서는 샤드를 닫을 때마다 다운로드)"""
+        metadata = {
+            "image_format": self.capture_image_format,
+            "image_shape": [APP_HEIGHT, APP_WIDTH],
+            "palette": list(PALETTE),
+            "class_map": dict(CLASS_MAP),
+        }
+        if IS_WEB:
+            writer = ShardWriter(sink=download_bytes_web, metadata=metadata)
+        else:
+            session_dir = DATA_DIR / "shards" / time.strftime("%Y%m%d-%H%M%S")
+            print(f"[APP_DEBUG] Writing dataset shards to {session_dir}")
+            writer = ShardWriter(out_dir=session_dir, metadata=metadata)
 
-        if action_id == 0:
-            self.input.left_pressed = True
-            self.input.up_pressed = True
-        elif action_id == 1:
-            self.input.up_pressed = True
-        elif action_id == 2:
-            self.input.right_pressed = True
-            self.input.up_pressed = True
-        elif action_id == 3:
-            self.input.left_pressed = True
-        elif action_id == 4:
-            self.input.right_pressed = True
-        elif action_id == 5:
-            self.input.left_pressed = True
-            self.input.down_pressed = True
-        elif action_id == 6:
-            self.input.down_pressed = True
-        elif action_id == 7:
-            self.input.right_pressed = True
-            self.input.down_pressed = True
-        elif action_id == 8:
-            self.input.fire_pressed = True
+        if self.palette_lut is None:
+            self.palette_lut = frame_capture.current_palette_lut()
+        encoder = FrameEncoderPool(
+            writer, image_format=self.capture_image_format, lut=self.palette_lut
+        )
+        if not IS_WEB:
+            # 수집 중에 종료해도 남은 프레임과 마지막 샤드, 인덱스를 마무리
+            atexit.register(encoder.close)
+        return encoder
+
+    def apply_agent_action(self, action_id):
+        self.input.apply_agent_action(action_id)
 
     def update(self):
+        frame_start = time.perf_counter()
         try:
             if self.agent:
-                agent_action = self.agent.select_action(state=None) 
+                obs = self.obs_builder.build(self.game.state) if self.obs_builder is not None else None
+                agent_action = self.agent.select_action(state=obs)
                 self.apply_agent_action(agent_action)
             
             self.input.update()
@@ -165,8 +187,14 @@ class App:
 
             if not IS_WEB and self.input.has_tapped(input_module.BUTTON_2):
                 print("Local save triggered (not implemented).")
-            elif IS_WEB and px.btnp(px.KEY_S):
-                self.download_collected_data_web()
+            elif IS_WEB and px.btnp(px.KEY_S) and self.frame_encoder is not None:
+                # 지금까지 모은 프레임을 샤드로 닫아 바로 다운로드
+                self.frame_encoder.flush()
+
+            # 스레드가 없으면 이번 프레임에 남은 시간 동안 캡처 프레임을 인코딩
+            if self.frame_encoder is not None and not self.frame_encoder.threaded:
+                elapsed = time.perf_counter() - frame_start
+                self.frame_encoder.pump(CAPTURE_IDLE_FRACTION / APP_FPS - elapsed)
         except Exception as e:
             error_message = f"Error in App.update: {type(e).__name__}: {e}\n{traceback.format_exc()}"
             if IS_WEB and 'js' in globals():
@@ -175,42 +203,19 @@ class App:
 
     def draw(self):
         try:
-            self.game.draw()
+            if self.render_policy.should_draw(self):
+                self.game.draw()
         except Exception as e:
             error_message = f"Error in App.draw: {type(e).__name__}: {e}\n{traceback.format_exc()}"
             if IS_WEB and 'js' in globals():
                 js.console.error(error_message)
             print(error_message, file=sys.stderr)
 
-    def _collect_current_frame_data(self):
-        """현재 프레임의 이미지와 게임 객체 정보를 수집하여 YOLO 라벨을 생성합니다."""
-        print("[APP_DEBUG] _collect_current_frame_data CALLED")
-        if IS_WEB:
-            print(f"[WEB_PYXEL_DEBUG] Type of px.images[0]: {type(px.images[0])}")
-            print(f"[WEB_PYXEL_DEBUG] Attributes of px.images[0]: {dir(px.images[0])}")
-            try:
-                print(f"[WEB_PYXEL_DEBUG] px.images[0].width: {px.images[0].width}")
-                print(f"[WEB_PYXEL_DEBUG] px.images[0].height: {px.images[0].height}")
-            except Exception as e_dim:
-                print(f"[WEB_PYXEL_DEBUG] Error accessing width/height: {e_dim}")
-
-            # Try to access a single pixel using get(), if available
-            if hasattr(px.images[0], 'get'):
-                try:
-                    print(f"[WEB_PYXEL_DEBUG] px.images[0].get(0,0) result: {px.images[0].get(0,0)}")
-                except Exception as e_get:
-                    print(f"[WEB_PYXEL_DEBUG] Error calling .get(0,0): {e_get}")
-            else:
-                print(f"[WEB_PYXEL_DEBUG] px.images[0] does not have 'get' method.")
-
-            # Check for .data attribute
-            if hasattr(px.images[0], 'data'):
-                print(f"[WEB_PYXEL_DEBUG] px.images[0] has 'data' attribute. Type: {type(px.images[0].data)}")
-            else:
-                print(f"[WEB_PYXEL_DEBUG] px.images[0] does NOT have 'data' attribute.")
 
-        if not IS_WEB or not PILImage or not io or not base64: # Pillow 등 라이브러리 없으면 실행 중단
-            print("[APP_ERROR] Image processing libraries not available. Cannot collect frame data.")
+    def _collect_current_frame_data(self):
+        """현재 프레임의 화면(팔레트 인덱스)과 YOLO 라벨을 스냅샷해 인코더 풀에 넘깁니다."""
+        if frame_capture is None or FrameEncoderPool is None: # NumPy 등 라이브러리 없으면 실행 중단
+            print("[APP_ERROR] Data collection libraries not available. Cannot collect frame data.")
             # 데이터 수집 중단 (선택적)
             if self.collecting_data:
                 print("[APP_DEBUG] Data collection STOPPED due to missing libraries.")
@@ -220,128 +225,52 @@ class App:
         if not hasattr(self.game, 'state') or not self.game.state:
             return
 
+        if self.frame_encoder is None:
+            self.frame_encoder = self._create_frame_encoder()
+        if self.frame_encoder.full():
+            # 인코더가 밀려 있으면 게임을 기다리게 하지 않고 이번 프레임을 버림
+            self.frame_encoder.drop_frame()
+            return
+
         current_game_state = self.game.state
-        image_payload = None
-        image_shape_info = None
 
         try:
-            active_image_bank = px.screen # 변경: px.images[0] 대신 px.screen 사용
-            width = active_image_bank.width
-            height = active_image_bank.height
-            image_shape_info = (height, width)
-
-            pil_image = PILImage.new("RGB", (width, height))
-            
-            for y_coord in range(height):
-                for x_coord in range(width):
-                    if IS_WEB: # If in web environment
-                        color_value = active_image_bank.pget(x_coord, y_coord) # Use pget directly
-                        # Assuming pget returns a color index for now, like bget was expected to.
-                        # If pget returns an RGB tuple or a direct hex value, this part will need adjustment.
-                        color_index = color_value 
-                    else: # Otherwise (e.g., desktop)
-                        color_index = active_image_bank.get(x_coord, y_coord) # Use get
-                    
-                    rgb_hex = px.colors[color_index]
-                    r = (rgb_hex >> 16) & 0xFF
-                    g = (rgb_hex >> 8) & 0xFF
-                    b = rgb_hex & 0xFF
-                    pil_image.putpixel((x_coord, y_coord), (r, g, b))
-
-            png_buffer = io.BytesIO()
-            pil_image.save(png_buffer, format="PNG")
-            png_bytes = png_buffer.getvalue()
-            image_payload = base64.b64encode(png_bytes).decode('utf-8')
-            
+            # 화면 버퍼 전체를 한 번에 팔레트 인덱스로 스냅샷 (색 변환/인코딩은 인코더 풀에서)
+            image = frame_capture.capture_indices()
         except Exception as e_img:
-            print(f"[APP_ERROR] Failed to get and process image data: {e_img}")
+            print(f"[APP_ERROR] Failed to get image data: {e_img}")
             traceback.print_exc()
             return 
 
-        yolo_labels = []
-        object_lists_to_process = {
-            "player": [current_game_state.player] if hasattr(current_game_state, 'player') and current_game_state.player else [],
-            "enemies": current_game_state.enemies if hasattr(current_game_state, 'enemies') else [],
-            "bosses": current_game_state.bosses if hasattr(current_game_state, 'bosses') else [],
-            "player_shots": current_game_state.player_shots if hasattr(current_game_state, 'player_shots') else [],
-            "enemy_shots": current_game_state.enemy_shots if hasattr(current_game_state, 'enemy_shots') else [],
-            "powerups": current_game_state.powerups if hasattr(current_game_state, 'powerups') else []
-        }
+        # 스프라이트 좌표로 정확한 박스를 만듦 (오프라인 생성기와 같은 라벨러)
+        yolo_labels = yolo_labels_from_state(current_game_state)
 
-        for list_name, obj_list in object_lists_to_process.items():
-            if not obj_list: 
-                continue
-            for obj in obj_list:
-                if not obj or obj.remove: 
-                    continue
-                class_name = obj.type.name.lower()
-                class_id = CLASS_MAP.get(class_name)
-                if class_id is None:
-                    continue
-                obj_x, obj_y, obj_w, obj_h = obj.x, obj.y, obj.w, obj.h
-                x_center = obj_x + obj_w / 2
-                y_center = obj_y + obj_h / 2
-                x_center_norm = x_center / APP_WIDTH
-                y_center_norm = y_center / APP_HEIGHT
-                width_norm = obj_w / APP_WIDTH
-                height_norm = obj_h / APP_HEIGHT
-                yolo_label = f"{class_id} {x_center_norm:.6f} {y_center_norm:.6f} {width_norm:.6f} {height_norm:.6f}"
-                yolo_labels.append(yolo_label)
+        # 라벨 없는 이미지도 저장 (빈 .txt)
+        self.frame_encoder.submit(image, yolo_labels)
 
-        if image_payload and yolo_labels:
-            self.collected_data.append({
-                "timestamp": time.time(),
-                "image_original_shape": image_shape_info, 
-                "image_png_base64": image_payload,
-                "yolo_labels": yolo_labels
-            })
-        elif image_payload:
-             self.collected_data.append({
-                "timestamp": time.time(),
-                "image_original_shape": image_shape_info, 
-                "image_png_base64": image_payload,
-                "yolo_labels": [] # 라벨 없는 이미지도 저장 (선택적)
-            })
 
-    def download_collected_data_web(self):
-        if not IS_WEB or not self.collected_data:
-            print("No data to download or not in web environment.", file=sys.stderr)
-            return
+def download_bytes_web(file_name, data, mime_type="application/x-tar"):
+    """웹 환경에서 바이트열을 파일로 다운로드합니다. (JSON 직렬화/이스케이프 없이 그대로 전달)"""
+    if not IS_WEB:
+        return
+    try:
+        from pyodide.ffi import to_js
 
-        try:
-            file_name = "collected_rl_dataset.json"
+        if file_name.endswith(".json"):
             mime_type = "application/json"
-            
-            # self.collected_data는 이미 JSON으로 직렬화 가능한 형태임
-            # (image_data가 tolist()로 변환되었음)
-            json_data_string = json.dumps(self.collected_data)
-            
-            # JavaScript에서 백슬래시와 따옴표 문제를 피하기 위해
-            # JSON 문자열을 안전하게 이스케이프 처리합니다.
-            # 여기서는 Python의 json.dumps가 생성한 문자열을 그대로 사용하고,
-            # JavaScript 템플릿 리터럴 내에 직접 삽입하는 대신 변수로 전달하는 방식을 고려할 수 있으나,
-            # Pyodide의 js.eval 한계상 직접 문자열 구성이 일반적입니다.
-            # 가장 큰 문제는 json_data_string 내의 따옴표입니다. 
-            # 간단한 방법은 json_data_string 자체를 JavaScript 변수로 할당하는 것입니다.
-
-            # JSON 문자열 내의 백슬래시와 작은따옴표를 이스케이프 처리합니다.
-            escaped_json_data = json_data_string.replace("\\", "\\\\").replace("'", "\\'")
-
-            js_code = f"""
-            const jsonData = JSON.parse('{escaped_json_data}');
-            const blob = new Blob([JSON.stringify(jsonData, null, 2)], {{type: '{mime_type}'}});
-            const link = document.createElement('a');
-            link.href = URL.createObjectURL(blob);
-            link.download = '{file_name}';
-            document.body.appendChild(link);
-            link.click();
-            document.body.removeChild(link);
-            URL.revokeObjectURL(link.href);
-            """
-            js.eval(js_code)
-            print(f"Starting download of '{file_name}'...")
-            # 다운로드 후 데이터 클리어 여부는 정책에 따라 결정 (현재는 유지)
-            # self.collected_data.clear()
-        except Exception as e:
-            print(f"Error during web data download: {e}", file=sys.stderr)
-            traceback.print_exc()
+        blob = js.Blob.new(
+            js.Array.of(to_js(data)),
+            to_js({"type": mime_type}, dict_converter=js.Object.fromEntries),
+        )
+        url = js.URL.createObjectURL(blob)
+        link = js.document.createElement("a")
+        link.href = url
+        link.download = file_name
+        js.document.body.appendChild(link)
+        link.click()
+        js.document.body.removeChild(link)
+        js.URL.revokeObjectURL(url)
+        print(f"Starting download of '{file_name}'...")
+    except Exception as e:
+        print(f"Error during web data download: {e}", file=sys.stderr)
+        traceback.print_exc()
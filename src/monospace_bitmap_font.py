@@ -1,12 +1,17 @@
-from typing import ClassVar
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple
 import pyxel as px
 
+# 미리 그린 문자열을 보관하는 이미지 뱅크 (0번은 게임 그래픽)
+TEXT_CACHE_IMAGE = 2
+
 
 class MonospaceBitmapFont:
     """
     고정폭 비트맵 폰트를 처리하는 클래스입니다.
 
     이 클래스는 고정폭 비트맵 폰트의 그리기 기능을 제공합니다.
+    문자열은 `text_cache`에 한 번 그려 두고, 같은 위치에 같은 문자열을 다시 그릴 때는
+    한 번의 blt로 그립니다.
     """
 
     width: ClassVar[int] = 8
@@ -14,34 +19,140 @@ class MonospaceBitmapFont:
     uv_chars_wide: ClassVar[int] = 32  # 이미지 너비당 문자 수
     u_offset: ClassVar[int] = 0
     v_offset: ClassVar[int] = 240
+    first_char: ClassVar[int] = 32  # 폰트 이미지의 첫 문자 코드 (공백)
+    last_char: ClassVar[int] = 95  # 폰트 이미지의 마지막 문자 코드 ('_')
 
-    def __init__(self) -> None:
+    def __init__(self, use_cache: bool = True) -> None:
         """
         MonospaceBitmapFont 클래스의 인스턴스를 초기화합니다.
+
+        Args:
+            use_cache (bool): 문자열 캐시(`text_cache`)를 사용할지 여부 (기본값: True)
         """
+        self.cache: Optional["GlyphRunCache"] = text_cache if use_cache else None
 
-    def draw_text(self, x: int, y: int, text: str) -> None:
+    def draw_glyphs(self, blt: Callable, x: int, y: int, text: str) -> None:
         """
-        지정된 위치에 텍스트를 그립니다.
+        문자마다 폰트 이미지에서 글리프를 복사합니다.
 
         Args:
+            blt (Callable): 복사 함수 (`px.blt` 또는 `px.Image.blt`)
             x (int): 텍스트를 그릴 x 좌표
             y (int): 텍스트를 그릴 y 좌표
             text (str): 그릴 텍스트 문자열
         """
         for char in text:
             code = ord(char)
-            if code < 32 or code > 95:
+            if code < self.first_char or code > self.last_char:
                 x += self.width
                 continue
-            code -= 32
-            px.blt(
+            row, col = divmod(code - self.first_char, self.uv_chars_wide)
+            blt(
                 x,
                 y,
                 0,
-                self.u_offset + (px.floor(code % self.uv_chars_wide) * self.width),
-                self.v_offset + (px.floor(code / self.uv_chars_wide) * self.height),
+                self.u_offset + col * self.width,
+                self.v_offset + row * self.height,
                 self.width,
                 self.height,
             )
             x += self.width
+
+    def draw_text(self, x: int, y: int, text: str) -> None:
+        """
+        지정된 위치에 텍스트를 그립니다.
+
+        Args:
+            x (int): 텍스트를 그릴 x 좌표
+            y (int): 텍스트를 그릴 y 좌표
+            text (str): 그릴 텍스트 문자열
+        """
+        if self.cache is None or not self.cache.draw(self, x, y, text):
+            self.draw_glyphs(px.blt, x, y, text)
+
+
+class GlyphRunCache:
+    """
+    문자열(글리프 묶음)을 이미지 뱅크에 미리 그려 두는 캐시입니다.
+
+    화면 위치 `(x, y)`마다 마지막으로 그린 문자열과 이미지 뱅크 영역을 기억합니다.
+    같은 위치의 문자열이 바뀌었을 때만 글리프를 다시 그리므로, HUD 라벨처럼 거의 바뀌지
+    않는 문자열은 프레임마다 blt 한 번으로 그려집니다.
+
+    이미지 뱅크는 높이 `MonospaceBitmapFont.height`의 줄로 나누어 앞에서부터 채우며,
+    자리가 모자라면 캐시를 모두 비우고 다시 채웁니다.
+    """
+
+    def __init__(self, image: int = TEXT_CACHE_IMAGE) -> None:
+        """
+        캐시를 초기화합니다.
+
+        Args:
+            image (int): 문자열을 그려 둘 이미지 뱅크 번호 (기본값: `TEXT_CACHE_IMAGE`)
+        """
+        self.image = image
+        # 위치 → [문자열, u, v, 영역 너비]
+        self._slots: Dict[Tuple[int, int], List] = {}
+        # 줄마다 다음에 쓸 u 좌표
+        self._line_ends: List[int] = []
+
+    def clear(self) -> None:
+        """캐시한 문자열을 모두 버립니다. (이미지 뱅크를 다른 용도로 덮어썼을 때 호출)"""
+        self._slots.clear()
+        self._line_ends.clear()
+
+    def _allocate(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        image = px.images[self.image]
+        for i, end in enumerate(self._line_ends):
+            if end + width <= image.width:
+                self._line_ends[i] = end + width
+                return end, i * height
+        v = len(self._line_ends) * height
+        if v + height > image.height:
+            return None
+        self._line_ends.append(width)
+        return 0, v
+
+    def draw(self, font: MonospaceBitmapFont, x: int, y: int, text: str) -> bool:
+        """
+        캐시를 통해 문자열을 그립니다.
+
+        폰트 이미지에 없는 문자가 있거나 한 줄보다 긴 문자열은 캐시하지 않습니다.
+        (빈칸으로 남겨야 하는 문자를 이미지 뱅크 영역으로 덮어쓰지 않기 위함)
+
+        Args:
+            font (MonospaceBitmapFont): 글리프를 그릴 폰트
+            x (int): 텍스트를 그릴 x 좌표
+            y (int): 텍스트를 그릴 y 좌표
+            text (str): 그릴 텍스트 문자열
+
+        Returns:
+            bool: 그렸으면 True, 캐시할 수 없는 문자열이면 False
+        """
+        width = len(text) * font.width
+        slot = self._slots.get((x, y))
+        if slot is None or slot[0] != text:
+            if not text:
+                return True
+            if (
+                width > px.images[self.image].width
+                or min(text) < chr(font.first_char)
+                or max(text) > chr(font.last_char)
+            ):
+                return False
+            if slot is None or slot[3] < width:
+                uv = self._allocate(width, font.height)
+                if uv is None:
+                    self.clear()
+                    uv = self._allocate(width, font.height)
+                slot = [text, uv[0], uv[1], width]
+                self._slots[(x, y)] = slot
+            else:
+                slot[0] = text
+            font.draw_glyphs(px.images[self.image].blt, slot[1], slot[2], text)
+        px.blt(x, y, self.image, slot[1], slot[2], width, font.height)
+        return True
+
+
+# 모든 폰트가 공유하는 문자열 캐시
+text_cache = GlyphRunCache()
@@ -21,6 +21,10 @@ player_config = PlayerConfig()
 
 
 class PlayerShot(Sprite):
+    __slots__ = ("type", "velx", "vely", "damage")
+
+    pooled = True  # 발사할 때마다 생성되므로 인스턴스를 재사용
+
     def __init__(self, state, x, y, type, lvl, velx, vely) -> None:
         super().__init__(state)
         self.type = EntityType.PLAYER_SHOT
@@ -72,12 +76,12 @@ def create(gs, player_x, player_y, wpn_type, wlvl):
     addshot = gs.add_player_shot
     if wpn_type == 0:  # fwd
         addshot(
-            PlayerShot(
+            PlayerShot.acquire(
                 gs, player_x + 12, player_y - 10, wpn_type, wlvl, player_config.speed_levels[wlvl], 0
             )
         )
         addshot(
-            PlayerShot(
+            PlayerShot.acquire(
                 gs, player_x + 12, player_y + 4, wpn_type, wlvl, player_config.speed_levels[wlvl], 0
             )
         )
@@ -85,19 +89,19 @@ def create(gs, player_x, player_y, wpn_type, wlvl):
         spdx = player_config.speed_levels[wlvl] * 0.894
         spdy = player_config.speed_levels[wlvl] * 0.447
         addshot(
-            PlayerShot(gs, player_x + 12, player_y - 10, wpn_type, wlvl, spdx, -spdy)
+            PlayerShot.acquire(gs, player_x + 12, player_y - 10, wpn_type, wlvl, spdx, -spdy)
         )
         addshot(
-            PlayerShot(gs, player_x + 12, player_y + 4, wpn_type, wlvl, spdx, +spdy)
+            PlayerShot.acquire(gs, player_x + 12, player_y + 4, wpn_type, wlvl, spdx, +spdy)
         )
     elif wpn_type == 2:  # back and fwd
         addshot(
-            PlayerShot(
+            PlayerShot.acquire(
                 gs, player_x + 12, player_y - 3, wpn_type, wlvl, player_config.speed_levels[wlvl], 0
             )
         )
         addshot(
-            PlayerShot(
+            PlayerShot.acquire(
                 gs, player_x - 10, player_y - 3, wpn_type, wlvl, -player_config.speed_levels[wlvl], 0
             )
         )
@@ -7,13 +7,9 @@ from components.entity_types import EntityType
 from config.colors.constants import MAX_COLOURS
 from config.player import max_weapons
 from config.sound import SoundType
-from audio import AudioManager
 
 SPEED = 1
 
-# 오디오 매니저 인스턴스 생성
-audio_manager = AudioManager()
-
 class PowerupType(IntEnum):
     NONE = 0
     LIFE = auto()
@@ -48,6 +44,8 @@ MAX_CYCLE_GAP_LEN = 999999  # every n enemies killed spawn next pup
 
 
 class Powerup(Sprite):
+    __slots__ = ("type", "puptype", "weapon_type")
+
     type_cycle_index = 0
     type_cycle_gap_cnt = 0
 
@@ -82,14 +80,14 @@ class Powerup(Sprite):
     def collected(self):
         self.remove = True
         if self.puptype == PowerupType.LIFE:
-            audio_manager.play_sound(SoundType.LIFE_POWERUP, priority=True)
+            self.game_state.game.audio.play_sound(SoundType.LIFE_POWERUP, priority=True)
             self.game_state.game.game_vars.add_life()
         elif self.puptype == PowerupType.WEAPON:
-            audio_manager.play_sound(SoundType.WEAPON_POWERUP, priority=True)
+            self.game_state.game.audio.play_sound(SoundType.WEAPON_POWERUP, priority=True)
             self.game_state.game.game_vars.change_weapon(self.weapon_type)
             self.game_state.game.game_vars.add_current_weapon_level()
         elif self.puptype == PowerupType.BOMB:
-            audio_manager.play_sound(SoundType.BOMB_POWERUP, priority=True)
+            self.game_state.game.audio.play_sound(SoundType.BOMB_POWERUP, priority=True)
             self.game_state.trigger_bomb()
 
     def collided_with(self, other):
@@ -102,14 +100,15 @@ class Powerup(Sprite):
             self.remove = True
             return
 
-        self.y += px.sin(px.frame_count * pi)
+        frame_count = self.game_state.game.frame_count
+        self.y += px.sin(frame_count * pi)
 
-        if px.frame_count % 5 == 0:
+        if frame_count % 5 == 0:
             self.colour += 1
             if self.colour == MAX_COLOURS:
                 self.colour = 2
 
-        if px.frame_count % 60 == 0:
+        if frame_count % 60 == 0:
             if self.puptype == PowerupType.WEAPON:
                 self.weapon_type += 1
                 if self.weapon_type == max_weapons:
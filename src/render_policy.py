@@ -0,0 +1,73 @@
+"""
+렌더링 정책 모듈
+
+에이전트가 게임을 진행하고 아무도 화면을 보지 않을 때는 매 프레임 배경, 스프라이트,
+HUD를 그릴 필요가 없습니다. `App.draw`는 `RenderPolicy.should_draw()`가 True인
+프레임에만 `Game.draw()`를 호출하고, 나머지 프레임은 이전 화면을 그대로 둡니다.
+
+그리지 않은 프레임은 게임 진행에 영향이 없습니다. (게임 로직은 update에서만 진행)
+"""
+
+from typing import Tuple
+
+# 매 프레임 그리기 (기본값)
+RENDER_ALWAYS = "always"
+# N 프레임마다 한 번 그리기
+RENDER_EVERY_N = "every_n"
+# 데이터 수집 캡처가 있는 프레임만 그리기
+RENDER_CAPTURE = "capture"
+# 그리지 않기
+RENDER_NEVER = "never"
+
+RENDER_MODES: Tuple[str, ...] = (RENDER_ALWAYS, RENDER_EVERY_N, RENDER_CAPTURE, RENDER_NEVER)
+
+
+class RenderPolicy:
+    """
+    어떤 프레임을 그릴지 정하는 정책.
+
+    속성:
+        mode (str): `RENDER_MODES` 중 하나
+        interval (int): `RENDER_EVERY_N`에서 그리는 간격 (프레임)
+    """
+
+    def __init__(self, mode: str = RENDER_ALWAYS, interval: int = 1) -> None:
+        """
+        정책 초기화.
+
+        매개변수:
+            mode (str): 렌더링 모드 (기본값: `RENDER_ALWAYS`)
+            interval (int): `RENDER_EVERY_N`에서 그리는 간격 (기본값: 1)
+        """
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode: {mode!r} (expected one of {RENDER_MODES}).")
+        if interval < 1:
+            raise ValueError(f"Render interval must be at least 1, got {interval}.")
+        self.mode = mode
+        self.interval = interval
+
+    def should_draw(self, app) -> bool:
+        """
+        이번 프레임을 그려야 하는지 판단합니다.
+
+        캡처는 `App.update`에서 직전에 그린 화면 버퍼를 저장하므로, `RENDER_CAPTURE`는
+        다음 update에서 캡처할 프레임을 그립니다.
+
+        매개변수:
+            app: `App` 객체 (`game`, `collecting_data`, `frames_since_last_capture`,
+                `capture_interval` 속성 사용)
+
+        반환값:
+            bool: 그려야 하면 True
+        """
+        mode = self.mode
+        if mode == RENDER_ALWAYS:
+            return True
+        if mode == RENDER_EVERY_N:
+            return app.game.frame_count % self.interval == 0
+        if mode == RENDER_CAPTURE:
+            return (
+                app.collecting_data
+                and app.frames_since_last_capture + 1 >= app.capture_interval
+            )
+        return False
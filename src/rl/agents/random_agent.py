@@ -18,7 +18,7 @@ class RandomAgent(BaseAgent):
     무작위로 행동을 선택하는 간단한 에이전트입니다.
     torchrl 환경과 호환되도록 고려되었습니다.
     """
-    def __init__(self, action_space):
+    def __init__(self, action_space, seed=None):
         """
         RandomAgent를 초기화합니다.
 
@@ -27,13 +27,18 @@ class RandomAgent(BaseAgent):
                           torchrl의 TensorSpec 객체 (예: DiscreteTensorSpec) 또는
                           sample() 메소드를 가진 객체를 기대합니다.
                           간단한 리스트 형식도 지원합니다 (하위 호환성).
+            seed: 행동 선택 난수 시드입니다. 주면 같은 행동 순서를 재현합니다.
+                  (seed() 메소드가 있는 gym.Space에도 전달합니다.)
         """
         super().__init__(action_space)
+        self.rng = random.Random(seed)
+        if seed is not None and callable(getattr(action_space, 'seed', None)):
+            action_space.seed(seed)
 
     def select_action(self, state):
         """
         주어진 상태(state)와 관계없이 무작위로 행동을 선택합니다.
-        action_space에 sample() 메소드가 있으면 사용하고, 없으면 리스트로 간주하여 random.choice를 사용합니다.
+        action_space에 sample() 메소드가 있으면 사용하고, 없으면 리스트로 간주하여 self.rng.choice를 사용합니다.
 
         Args:
             state: 현재 상태 (이 에이전트에서는 사용되지 않음).
@@ -47,7 +52,7 @@ class RandomAgent(BaseAgent):
         elif isinstance(self.action_space, list):
             if not self.action_space:
                 raise ValueError("Action space is an empty list. Cannot select an action.")
-            action = random.choice(self.action_space)
+            action = self.rng.choice(self.action_space)
             # 웹 환경이 아니고 torch가 로드되었다면 텐서 변환을 고려할 수 있습니다.
             # if not IS_WEB and 'torch' in globals() and hasattr(self.action_space, 'dtype'):
             #    return torch.tensor(action, dtype=self.action_space.dtype)
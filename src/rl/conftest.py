@@ -0,0 +1,12 @@
+"""
+rl 테스트 설정
+
+`rl.env` 패키지는 import할 때 pyxel(SDL)과 gymnasium을 불러오므로, 이를 쓸 수 없는
+환경에서는 `env/test_*.py`를 수집하지 않습니다.
+"""
+
+try:
+    import gymnasium  # noqa: F401
+    import pyxel  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["env/test_*.py"]
@@ -0,0 +1,15 @@
+from .game_simulator import GameSimulator
+from .replay import EpisodeReplay, ReplayRecorder, play_replay, verify_replay
+from .vortexion_env import VortexionEnv
+from .vector_env import make_vector_env
+
+# TorchRL 래퍼(torchrl_env.VortexionTorchEnv)는 torch 의존성 때문에 직접 import 해서 사용합니다.
+__all__ = [
+    "EpisodeReplay",
+    "GameSimulator",
+    "ReplayRecorder",
+    "VortexionEnv",
+    "make_vector_env",
+    "play_replay",
+    "verify_replay",
+]
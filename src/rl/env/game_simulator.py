@@ -0,0 +1,186 @@
+"""
+헤드리스 게임 시뮬레이터 모듈
+
+pyxel 창 루프(`px.run`) 없이 `Game`을 직접 갱신하여, 프레임 페이싱이나 디스플레이 없이
+RL 롤아웃을 원하는 만큼 빠르게 실행합니다.
+"""
+
+import os
+import time
+from typing import Optional
+
+import pyxel as px
+
+from config.app.constants import APP_WIDTH, APP_HEIGHT, APP_NAME, APP_FPS
+from config.colors import PALETTE
+from config.paths import ASSETS_DIR, SOURCE_DIR
+from audio import AudioManager, NullAudio
+from game import Game
+from monospace_bitmap_font import MonospaceBitmapFont
+import input as input_module
+from states.game_state.game_state_stage import State
+
+# 창과 오디오 장치 없이 pyxel을 초기화하기 위한 SDL 드라이버 설정
+HEADLESS_SDL_ENV = {
+    "SDL_VIDEODRIVER": "offscreen",
+    "SDL_AUDIODRIVER": "dummy",
+}
+
+_pyxel_initialized = False
+
+
+def init_headless_pyxel() -> None:
+    """
+    현재 프로세스에서 pyxel을 헤드리스로 한 번만 초기화하고 게임 리소스를 로드합니다.
+
+    이미 설정된 SDL 환경 변수는 덮어쓰지 않으므로, 화면 확인이 필요하면
+    `SDL_VIDEODRIVER`를 직접 지정해서 실행할 수 있습니다.
+    """
+    global _pyxel_initialized
+    if _pyxel_initialized:
+        return
+
+    for key, value in HEADLESS_SDL_ENV.items():
+        os.environ.setdefault(key, value)
+
+    px.init(APP_WIDTH, APP_HEIGHT, title=APP_NAME, fps=APP_FPS)
+    # pyxel은 init 시 작업 디렉토리를 메인 스크립트 위치로 바꾸므로,
+    # "assets/..." 상대 경로를 쓰는 기존 코드를 위해 src 디렉토리로 맞춥니다.
+    os.chdir(SOURCE_DIR)
+
+    px.colors.from_list(PALETTE)
+    px.images[0].load(0, 0, str(ASSETS_DIR / "gfx.png"))
+    px.load(
+        str(ASSETS_DIR / "sounds.pyxres"),
+        excl_images=True,
+        excl_tilemaps=True,
+        excl_musics=True,
+    )
+    _pyxel_initialized = True
+
+
+class GameSimulator:
+    """
+    pyxel 창 없이 게임을 구동하는 헤드리스 시뮬레이터.
+
+    `App`과 같은 속성(`input`, `main_font`, `game`)을 제공하므로 기존 `Game`,
+    `GameStateStage`, `Input`, 스프라이트 클래스를 동작 변경 없이 그대로 사용합니다.
+    `step()` 한 번이 게임의 한 프레임(`repeat`를 주면 여러 프레임)이며, 호출하는 만큼
+    즉시 진행됩니다.
+
+    pyxel의 이미지/타일맵/사운드는 프로세스 전역 상태이므로 프로세스당 하나의
+    시뮬레이터만 만들 수 있습니다. 여러 게임을 병렬로 돌리려면 프로세스를 나누세요.
+
+    게임 난수와 프레임 카운터는 `Game`이 가지므로, 같은 시드로 `reset(seed)`한 뒤 같은
+    행동을 넣으면 매번 같은 에피소드가 재현됩니다. (`rl.env.replay` 참고)
+
+    속성:
+        render (bool): `step()`마다 화면 버퍼에 그릴지 여부
+        frame_count (int): 마지막 `reset()` 이후 진행된 프레임 수 (`Game.frame_count`)
+        total_frames (int): 시뮬레이터가 진행한 전체 프레임 수 (`Game.total_frames`)
+        input: 에이전트 행동이 반영되는 입력 객체
+        main_font: 게임 상태가 사용하는 폰트 객체
+        game: 시뮬레이션 중인 `Game` 객체
+    """
+
+    _active: bool = False
+
+    def __init__(
+        self, render: bool = False, audio: Optional[AudioManager] = None
+    ) -> None:
+        """
+        시뮬레이터 초기화.
+
+        매개변수:
+            render (bool): `step()`마다 `Game.draw()`를 호출할지 여부 (기본값: False)
+            audio (Optional[AudioManager]): 게임 오디오 백엔드 (기본값: 소리를 내지 않는
+                `NullAudio`. 음악 종료 시점은 게임 프레임으로 계산되어 결정적임)
+        """
+        if GameSimulator._active:
+            raise RuntimeError(
+                "GameSimulator already exists in this process. "
+                "Call close() on it or run another simulator in a separate process."
+            )
+        init_headless_pyxel()
+        GameSimulator._active = True
+
+        self.render = render
+        self.agent = None
+        self.main_font = MonospaceBitmapFont()
+        self.input = input_module.Input()
+        self.game = Game(self, audio=audio if audio is not None else NullAudio())
+
+    @property
+    def frame_count(self) -> int:
+        return self.game.frame_count
+
+    @property
+    def total_frames(self) -> int:
+        return self.game.total_frames
+
+    def reset(self, seed: Optional[int] = None):
+        """
+        새 게임을 시작하고 첫 스테이지 상태를 반환합니다.
+
+        매개변수:
+            seed (Optional[int]): 게임 난수 시드 (None이면 이전 난수 상태를 이어서 사용)
+
+        반환값:
+            GameStateStage: 초기화된 스테이지 상태
+        """
+        self.input.apply_agent_action(None)
+        self.game.start_new_game(seed)
+        if self.render:
+            self.game.draw()
+        return self.game.state
+
+    def step(self, action: Optional[int], repeat: int = 1):
+        """
+        에이전트 행동을 적용하고 게임을 `repeat` 프레임 진행합니다.
+
+        행동은 한 번만 적용되고 `repeat` 프레임 동안 유지됩니다. 화면은 마지막 프레임에만
+        그리며, 도중에 게임 오버가 되면 남은 프레임은 진행하지 않습니다.
+        실제로 진행한 프레임 수는 `total_frames`의 차이로 알 수 있습니다.
+        (`frame_count`는 새 게임이 시작되면 0으로 돌아가므로 차이가 음수가 될 수 있음)
+
+        매개변수:
+            action (Optional[int]): `input.AGENT_ACTIONS`의 행동 ID (None이면 입력 없음)
+            repeat (int): 진행할 프레임 수 (기본값: 1)
+
+        반환값:
+            GameStateStage: 갱신된 스테이지 상태
+        """
+        self.input.apply_agent_action(action)
+        input_update = self.input.update
+        game = self.game
+        for _ in range(repeat):
+            input_update()
+            game.update()
+            state = game.state
+            if state is None or state.state == State.GAME_OVER:
+                break
+        if self.render:
+            game.draw()
+        return game.state
+
+    def draw(self) -> None:
+        """현재 상태를 화면 버퍼(`px.screen`)에 그립니다."""
+        self.game.draw()
+
+    def close(self) -> None:
+        """시뮬레이터를 해제하여 같은 프로세스에서 새 시뮬레이터를 만들 수 있게 합니다."""
+        GameSimulator._active = False
+
+
+if __name__ == "__main__":
+    # 무작위 행동으로 헤드리스 처리량을 측정합니다.
+    import random
+
+    num_frames = 10000
+    sim = GameSimulator()
+    sim.reset()
+    start = time.perf_counter()
+    for _ in range(num_frames):
+        sim.step(random.randrange(input_module.NUM_AGENT_ACTIONS))
+    elapsed = time.perf_counter() - start
+    print(f"{num_frames} frames in {elapsed:.2f}s ({num_frames / elapsed:.0f} frames/s)")
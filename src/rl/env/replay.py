@@ -0,0 +1,223 @@
+"""
+에피소드 리플레이 모듈
+
+게임 난수(`Game.rng`)와 프레임 카운터(`Game.frame_count`)는 `reset(seed)`로 정해지므로,
+에피소드는 시드와 프레임별 행동 ID만으로 똑같이 재현됩니다. 영상 대신 이 작은
+기록을 저장해 두고, 필요할 때 다시 실행해 관측값/화면을 만들어 씁니다.
+
+바이너리 형식 (리틀 엔디언):
+    헤더   magic(4) "VXRP", version(u16), flags(u16), seed(u64), frames(u32)
+    지문   state_fingerprint SHA-1 (20바이트, flags에 FLAG_FINGERPRINT가 있을 때만 유효)
+    행동   프레임당 1바이트 행동 ID (입력 없음은 255)를 zlib으로 압축
+"""
+
+import hashlib
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .game_simulator import GameSimulator
+
+REPLAY_MAGIC = b"VXRP"
+REPLAY_VERSION = 1
+FLAG_FINGERPRINT = 1
+
+# 입력 없음(None) 행동을 나타내는 바이트 값
+NO_ACTION_BYTE = 255
+
+_HEADER = struct.Struct("<4sHHQI")
+_FINGERPRINT_SIZE = 20
+
+
+def state_fingerprint(game) -> bytes:
+    """
+    게임 진행 상태의 지문(SHA-1)을 계산합니다.
+
+    점수/목숨/스테이지, 프레임 카운터, 난수 상태, 배경 스크롤, 모든 스프라이트의
+    위치를 포함하므로 리플레이가 원래 에피소드와 비트 단위로 같은지 확인할 수 있습니다.
+
+    매개변수:
+        game: `Game` 객체
+
+    반환값:
+        bytes: 20바이트 SHA-1 다이제스트
+    """
+    h = hashlib.sha1()
+    gv = game.game_vars
+    h.update(repr((gv.score, gv.lives, int(gv.stage_num), game.frame_count)).encode())
+    h.update(repr(game.rng.getstate()).encode())
+    state = game.state
+    if state is not None:
+        h.update(repr((state.state.value, state.background.scroll_x)).encode())
+        player = state.player
+        h.update(repr((player.x, player.y, player.current_hp)).encode())
+        for sprites in (
+            state.enemies,
+            state.bosses,
+            state.player_shots,
+            state.powerups,
+        ):
+            h.update(repr([(s.type.value, s.x, s.y, s.remove) for s in sprites]).encode())
+        # 폭발은 스프라이트 타입이 없으므로 애니메이션 진행 상태로 구분합니다.
+        h.update(
+            repr([(s.x, s.y, s.delay, s.frame, s.remove) for s in state.explosions]).encode()
+        )
+        shots = state.enemy_shots
+        n = len(shots)
+        for arr in (shots.x, shots.y, shots.vx, shots.vy, shots.delay, shots.alive):
+            h.update(arr[:n].tobytes())
+    return h.digest()
+
+
+class EpisodeReplay:
+    """
+    한 에피소드의 시드와 프레임별 행동 기록.
+
+    속성:
+        seed (int): `GameSimulator.reset(seed)`에 넣은 시드
+        actions (bytearray): 프레임별 행동 ID (입력 없음은 `NO_ACTION_BYTE`)
+        fingerprint (Optional[bytes]): 마지막 프레임의 `state_fingerprint` (검증용)
+    """
+
+    __slots__ = ("seed", "actions", "fingerprint")
+
+    def __init__(
+        self,
+        seed: int,
+        actions: Optional[bytearray] = None,
+        fingerprint: Optional[bytes] = None,
+    ) -> None:
+        if not 0 <= seed < 2**64:
+            raise ValueError(f"Replay seed must fit in 64 unsigned bits, got {seed}.")
+        self.seed = seed
+        self.actions = actions if actions is not None else bytearray()
+        self.fingerprint = fingerprint
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def append(self, action: Optional[int]) -> None:
+        """행동 하나를 기록합니다."""
+        self.actions.append(NO_ACTION_BYTE if action is None else int(action))
+
+    def iter_actions(self) -> Iterator[Optional[int]]:
+        """기록된 행동을 프레임 순서대로 돌려줍니다. (입력 없음은 None)"""
+        for byte in self.actions:
+            yield None if byte == NO_ACTION_BYTE else byte
+
+    def to_bytes(self) -> bytes:
+        """바이너리 형식으로 직렬화합니다."""
+        flags = FLAG_FINGERPRINT if self.fingerprint is not None else 0
+        header = _HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, flags, self.seed, len(self.actions)
+        )
+        fingerprint = self.fingerprint or bytes(_FINGERPRINT_SIZE)
+        return header + fingerprint + zlib.compress(bytes(self.actions), 9)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "EpisodeReplay":
+        """`to_bytes()`로 만든 바이너리에서 리플레이를 읽습니다."""
+        magic, version, flags, seed, frames = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file (bad magic).")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {version}.")
+        offset = _HEADER.size
+        fingerprint = data[offset:offset + _FINGERPRINT_SIZE]
+        actions = bytearray(zlib.decompress(data[offset + _FINGERPRINT_SIZE:]))
+        if len(actions) != frames:
+            raise ValueError(
+                f"Replay is truncated: expected {frames} frames, got {len(actions)}."
+            )
+        return cls(seed, actions, fingerprint if flags & FLAG_FINGERPRINT else None)
+
+    def save(self, path: Union[str, Path]) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "EpisodeReplay":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayRecorder:
+    """
+    시뮬레이터를 감싸 시드와 행동을 기록하는 클래스.
+
+    `GameSimulator`의 `reset`/`step` 대신 이 클래스의 메소드를 호출하면 되며,
+    `finish()`가 마지막 상태 지문을 포함한 `EpisodeReplay`를 반환합니다.
+
+    속성:
+        simulator (GameSimulator): 기록 중인 시뮬레이터
+        replay (Optional[EpisodeReplay]): 현재 기록 중인 리플레이
+    """
+
+    def __init__(self, simulator: GameSimulator) -> None:
+        self.simulator = simulator
+        self.replay: Optional[EpisodeReplay] = None
+
+    def reset(self, seed: int):
+        """
+        시드로 새 에피소드를 시작하고 기록을 새로 시작합니다.
+
+        매개변수:
+            seed (int): 게임 난수 시드 (재현에 필요하므로 생략할 수 없음)
+
+        반환값:
+            GameStateStage: 초기화된 스테이지 상태
+        """
+        self.replay = EpisodeReplay(seed)
+        return self.simulator.reset(seed=seed)
+
+    def step(self, action: Optional[int], repeat: int = 1):
+        """행동을 적용해 `repeat` 프레임 진행하고, 실제로 진행한 프레임 수만큼 기록합니다."""
+        if self.replay is None:
+            raise RuntimeError("Call reset(seed) before step().")
+        # `frame_count`는 게임 오버 후 재시작이나 마지막 스테이지 클리어 시 0으로 돌아가므로
+        # 줄지 않는 `total_frames`로 진행한 프레임 수를 셉니다.
+        start_frame = self.simulator.total_frames
+        state = self.simulator.step(action, repeat)
+        for _ in range(self.simulator.total_frames - start_frame):
+            self.replay.append(action)
+        return state
+
+    def finish(self) -> EpisodeReplay:
+        """현재 상태의 지문을 기록하고 리플레이를 반환합니다."""
+        if self.replay is None:
+            raise RuntimeError("Nothing has been recorded.")
+        self.replay.fingerprint = state_fingerprint(self.simulator.game)
+        return self.replay
+
+
+def play_replay(replay: EpisodeReplay, simulator: GameSimulator) -> Iterator:
+    """
+    리플레이를 처음부터 다시 실행하며 프레임마다 게임 상태를 돌려줍니다.
+
+    시뮬레이터를 `render=True`로 만들었거나 호출하는 쪽에서 `simulator.draw()`를
+    부르면 원하는 프레임의 화면을 다시 만들 수 있습니다.
+
+    매개변수:
+        replay (EpisodeReplay): 재생할 리플레이
+        simulator (GameSimulator): 재생에 쓸 시뮬레이터
+
+    반환값:
+        Iterator[GameStateStage]: 프레임별 게임 상태
+    """
+    simulator.reset(seed=replay.seed)
+    step = simulator.step
+    for action in replay.iter_actions():
+        yield step(action)
+
+
+def verify_replay(replay: EpisodeReplay, simulator: GameSimulator) -> bool:
+    """
+    리플레이를 끝까지 재생해 마지막 상태 지문이 기록과 같은지 확인합니다.
+
+    반환값:
+        bool: 지문이 같으면 True (기록에 지문이 없으면 ValueError)
+    """
+    if replay.fingerprint is None:
+        raise ValueError("Replay has no fingerprint to verify against.")
+    for _ in play_replay(replay, simulator):
+        pass
+    return state_fingerprint(simulator.game) == replay.fingerprint
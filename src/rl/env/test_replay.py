@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from input import NUM_AGENT_ACTIONS
+from rl.env.game_simulator import GameSimulator
+from rl.env.replay import EpisodeReplay, ReplayRecorder, verify_replay
+
+MAX_STEPS = 3000
+
+
+@pytest.fixture
+def simulator():
+    sim = GameSimulator()
+    yield sim
+    sim.close()
+
+
+def _record(simulator, seed, repeat):
+    """무작위 행동으로 기록하다가, 폭발이 화면에 남아 있는 시점에 기록을 끝냅니다."""
+    recorder = ReplayRecorder(simulator)
+    recorder.reset(seed=seed)
+    rng = random.Random(seed)
+    saw_explosion = False
+    for step in range(MAX_STEPS):
+        action = rng.choice([None] + list(range(NUM_AGENT_ACTIONS)))
+        state = recorder.step(action, repeat)
+        if state is not None and state.explosions:
+            saw_explosion = True
+            if step >= MAX_STEPS // 4:
+                break
+    return recorder.finish(), saw_explosion
+
+
+@pytest.mark.parametrize("repeat", [1, 4])
+def test_replay_round_trip(simulator, repeat):
+    """
+    리플레이 기록/재생 테스트
+
+    목적: 기록한 에피소드를 바이트로 직렬화했다가 다시 읽어 재생해도 마지막 상태 지문이
+    같은지 검증 (폭발이 살아 있는 상태의 지문 포함)
+    """
+    replay, saw_explosion = _record(simulator, seed=1234, repeat=repeat)
+    assert saw_explosion
+    assert simulator.game.state.explosions
+
+    loaded = EpisodeReplay.from_bytes(replay.to_bytes())
+    assert loaded.seed == replay.seed
+    assert loaded.fingerprint == replay.fingerprint
+    assert len(loaded) == len(replay)
+    assert verify_replay(loaded, simulator)
+
@@ -0,0 +1,115 @@
+"""
+TorchRL 환경 모듈
+
+`VortexionEnv`를 TorchRL `EnvBase` 인터페이스로 감쌉니다.
+"""
+
+from typing import Optional
+
+import numpy as np
+import torch
+from tensordict import TensorDict, TensorDictBase
+from torchrl.envs import EnvBase
+
+try:
+    from torchrl.data import Bounded, Categorical, Composite, Unbounded
+except ImportError:  # torchrl < 0.6
+    from torchrl.data import (
+        BoundedTensorSpec as Bounded,
+        CompositeSpec as Composite,
+        DiscreteTensorSpec as Categorical,
+        UnboundedContinuousTensorSpec as Unbounded,
+    )
+
+from input import NUM_AGENT_ACTIONS
+from .vortexion_env import VortexionEnv
+
+
+def _torch_dtype(np_dtype) -> torch.dtype:
+    """NumPy dtype에 대응하는 torch dtype을 반환합니다."""
+    return torch.from_numpy(np.zeros(0, dtype=np_dtype)).dtype
+
+
+class VortexionTorchEnv(EnvBase):
+    """
+    Vortexion 게임의 TorchRL 환경.
+
+    관측값/보상/종료 규칙은 `VortexionEnv`와 같으며, 값은 `TensorDict`로 주고받습니다.
+
+    속성:
+        env (VortexionEnv): 실제 게임을 구동하는 Gymnasium 환경
+    """
+
+    def __init__(self, device="cpu", **env_kwargs) -> None:
+        """
+        환경 초기화.
+
+        매개변수:
+            device: 텐서를 올릴 장치 (기본값: "cpu")
+            **env_kwargs: `VortexionEnv`에 전달할 인자
+        """
+        super().__init__(device=device, batch_size=torch.Size([]))
+        # 관측값은 텐서로 옮길 때 복사하므로 환경 쪽 복사는 생략합니다.
+        env_kwargs.setdefault("copy_obs", False)
+        self.env = VortexionEnv(**env_kwargs)
+        self._next_seed: Optional[int] = None
+
+        obs_space = self.env.observation_space
+        obs_dtype = _torch_dtype(obs_space.dtype)
+        self.observation_spec = Composite(
+            observation=Bounded(
+                low=torch.as_tensor(obs_space.low, dtype=obs_dtype),
+                high=torch.as_tensor(obs_space.high, dtype=obs_dtype),
+                shape=obs_space.shape,
+                dtype=obs_dtype,
+                device=self.device,
+            ),
+            shape=(),
+        )
+        self.action_spec = Categorical(
+            n=NUM_AGENT_ACTIONS, shape=(), dtype=torch.int64, device=self.device
+        )
+        self.reward_spec = Unbounded(shape=(1,), dtype=torch.float32, device=self.device)
+        self.done_spec = Composite(
+            {
+                key: Categorical(n=2, shape=(1,), dtype=torch.bool, device=self.device)
+                for key in ("done", "terminated", "truncated")
+            },
+            shape=(),
+        )
+
+    def _to_tensordict(self, obs, reward=None, terminated=False, truncated=False):
+        td = TensorDict(
+            {
+                "observation": torch.as_tensor(obs.copy(), device=self.device),
+                "done": torch.tensor([terminated or truncated], device=self.device),
+                "terminated": torch.tensor([terminated], device=self.device),
+                "truncated": torch.tensor([truncated], device=self.device),
+            },
+            batch_size=self.batch_size,
+        )
+        if reward is not None:
+            td.set(
+                "reward",
+                torch.tensor([reward], dtype=torch.float32, device=self.device),
+            )
+        return td
+
+    def _reset(self, tensordict: Optional[TensorDictBase] = None, **kwargs) -> TensorDictBase:
+        obs, _ = self.env.reset(seed=self._next_seed)
+        self._next_seed = None
+        return self._to_tensordict(obs)
+
+    def _step(self, tensordict: TensorDictBase) -> TensorDictBase:
+        action = int(tensordict.get("action"))
+        obs, reward, terminated, truncated, _ = self.env.step(action)
+        return self._to_tensordict(obs, reward, terminated, truncated)
+
+    def _set_seed(self, seed: Optional[int]):
+        # 다음 reset에서 게임 난수 시드로 사용합니다.
+        self._next_seed = seed
+        return seed
+
+    def close(self, *args, **kwargs) -> None:
+        self.env.close()
+        super().close(*args, **kwargs)
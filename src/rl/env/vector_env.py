@@ -0,0 +1,62 @@
+"""
+벡터화 환경 모듈
+
+여러 게임 인스턴스를 각각 별도의 워커 프로세스에서 실행합니다. pyxel은 프로세스
+전역 상태를 사용하므로 게임 하나당 프로세스 하나가 필요하며, 관측값은 공유 메모리
+버퍼를 통해 메인 프로세스로 전달됩니다.
+"""
+
+from functools import partial
+
+from gymnasium.vector import AsyncVectorEnv
+
+from .vortexion_env import VortexionEnv
+
+# 워커 프로세스 시작 방식. fork는 부모의 pyxel(SDL) 상태를 복제하므로 spawn을 사용합니다.
+MP_START_METHOD = "spawn"
+
+
+def make_vector_env(num_envs: int, **env_kwargs) -> AsyncVectorEnv:
+    """
+    `VortexionEnv` N개를 워커 프로세스에서 실행하는 Gymnasium 벡터 환경을 생성합니다.
+
+    Args:
+        num_envs (int): 워커(게임 인스턴스) 수
+        **env_kwargs: 각 `VortexionEnv`에 전달할 인자
+
+    Returns:
+        AsyncVectorEnv: 공유 메모리 관측 버퍼를 사용하는 비동기 벡터 환경
+    """
+    if num_envs < 1:
+        raise ValueError(f"num_envs must be at least 1, got {num_envs}.")
+    # 워커는 관측값을 곧바로 공유 메모리에 복사하므로 환경 쪽 복사는 생략합니다.
+    env_kwargs.setdefault("copy_obs", False)
+    return AsyncVectorEnv(
+        [partial(VortexionEnv, **env_kwargs) for _ in range(num_envs)],
+        shared_memory=True,
+        context=MP_START_METHOD,
+    )
+
+
+def make_parallel_env(num_workers: int, **env_kwargs):
+    """
+    `VortexionTorchEnv` N개를 워커 프로세스에서 실행하는 TorchRL `ParallelEnv`를 생성합니다.
+
+    Args:
+        num_workers (int): 워커(게임 인스턴스) 수
+        **env_kwargs: 각 `VortexionTorchEnv`에 전달할 인자
+
+    Returns:
+        ParallelEnv: 공유 메모리 텐서 버퍼를 사용하는 TorchRL 병렬 환경
+    """
+    from torchrl.envs import ParallelEnv
+
+    from .torchrl_env import VortexionTorchEnv
+
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, got {num_workers}.")
+    return ParallelEnv(
+        num_workers,
+        partial(VortexionTorchEnv, **env_kwargs),
+        mp_start_method=MP_START_METHOD,
+    )
@@ -0,0 +1,244 @@
+"""
+Gymnasium 환경 모듈
+
+`GameSimulator` 위에 Gymnasium `Env` 인터페이스를 제공합니다.
+행동 공간은 `App.apply_agent_action`과 같은 9개 행동(8방향 이동 + 발사)입니다.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+from config.app.constants import APP_WIDTH, APP_HEIGHT, APP_FPS
+from config.colors import MAX_COLORS
+from data_collection.frame_capture import PALETTE_RGB_LUT, indices_to_rgb, screen_view
+from input import NUM_AGENT_ACTIONS
+from rl.observation import EntityObservationBuilder, OBSERVATION_SHAPE
+from rl.reward import RewardAccumulator, RewardConfig, RewardEvents
+from states.game_state.game_state_stage import State
+from .game_simulator import GameSimulator
+
+# 관측값 종류
+OBS_ENTITIES = "entities"  # 엔티티 상태 배열 (rl.observation)
+OBS_PIXELS = "pixels"  # 화면 버퍼의 팔레트 인덱스 배열
+
+# 프레임 스킵 시 화면 관측값을 만드는 방식
+POOL_LAST = "last"  # 마지막 프레임
+POOL_MAX = "max"  # 마지막 두 프레임 중 픽셀별로 더 밝은 색 (깜빡이는 스프라이트가 사라지지 않도록)
+
+# 팔레트 인덱스 → 밝기 (ITU-R BT.601 가중치의 정수 버전)
+# 관측값은 팔레트 인덱스이므로 인덱스 크기가 아니라 색의 밝기로 최댓값 풀링을 합니다.
+_PALETTE_LUMA = PALETTE_RGB_LUT.astype(np.uint32) @ np.array([299, 587, 114], dtype=np.uint32)
+
+
+class VortexionEnv(gym.Env):
+    """
+    Vortexion 게임의 Gymnasium 환경.
+
+    관측값은 기본적으로 엔티티 상태 배열(`rl.observation.OBSERVATION_SHAPE`, float32)이며,
+    `obs_type="pixels"`이면 화면 버퍼의 팔레트 인덱스 배열(`APP_HEIGHT x APP_WIDTH`, uint8)
+    입니다. 엔티티 관측값을 쓰면 매 스텝 화면을 그리지 않습니다.
+    보상과 종료(terminated)는 `rl.reward.RewardAccumulator`가 게임 이벤트로 계산합니다.
+    기본 설정은 한 스텝 동안 증가한 점수가 보상, 게임 오버와 게임 완료(마지막 스테이지
+    클리어)가 종료입니다.
+
+    `frame_skip`이 k이면 한 스텝에서 행동을 한 번 적용한 뒤 게임을 k 프레임 진행하고
+    (action repeat), 화면은 관측에 필요한 프레임에만 그립니다. 보상은 k 프레임 동안의
+    이벤트를 모두 더한 값이며, 도중에 게임 오버가 되면 그 자리에서 멈춥니다.
+
+    `GameSimulator`와 마찬가지로 프로세스당 하나만 만들 수 있으므로, 여러 환경을
+    동시에 돌리려면 `vector_env.make_vector_env`를 사용하세요.
+
+    속성:
+        simulator (GameSimulator): 게임을 구동하는 헤드리스 시뮬레이터
+        max_episode_steps (Optional[int]): 에피소드 최대 스텝 수 (초과 시 truncated)
+        rewards (RewardAccumulator): 게임 이벤트로 보상과 종료 여부를 계산하는 누적기
+    """
+
+    metadata = {"render_modes": ["rgb_array"], "render_fps": APP_FPS}
+
+    def __init__(
+        self,
+        render_mode: Optional[str] = None,
+        max_episode_steps: Optional[int] = None,
+        copy_obs: bool = True,
+        obs_type: str = OBS_ENTITIES,
+        frame_skip: int = 1,
+        frame_pool: str = POOL_LAST,
+        reward_config: Optional[RewardConfig] = None,
+        reward_fn: Optional[Callable[[RewardEvents], float]] = None,
+    ) -> None:
+        """
+        환경 초기화.
+
+        매개변수:
+            render_mode (Optional[str]): "rgb_array"이면 `render()`가 RGB 프레임을 반환
+            max_episode_steps (Optional[int]): 에피소드 최대 스텝 수 (None이면 제한 없음)
+            copy_obs (bool): 관측값을 매번 새 배열로 반환할지 여부. False이면 내부 버퍼를
+                그대로 반환하므로 다음 스텝에서 덮어써집니다. (공유 메모리로 바로 복사하는
+                벡터 환경 워커용)
+            obs_type (str): 관측값 종류 ("entities" 또는 "pixels", 기본값: "entities")
+            frame_skip (int): 한 스텝에 진행할 프레임 수 (기본값: 1)
+            frame_pool (str): 화면 관측값을 만드는 방식 ("last" 또는 "max", 기본값: "last").
+                "max"는 `obs_type="pixels"`에서만 쓸 수 있으며 마지막 두 프레임을 그려 픽셀마다
+                더 밝은 색의 팔레트 인덱스를 씁니다. (밝기가 같으면 마지막 프레임)
+            reward_config (Optional[RewardConfig]): 보상 가중치와 종료 조건 (None이면 점수만 보상)
+            reward_fn (Optional[Callable]): `RewardEvents`를 보상으로 바꾸는 함수
+                (None이면 `reward_config.reward`)
+        """
+        if obs_type not in (OBS_ENTITIES, OBS_PIXELS):
+            raise ValueError(
+                f"Unsupported obs_type: {obs_type!r}. Expected {OBS_ENTITIES!r} or {OBS_PIXELS!r}."
+            )
+        if frame_skip < 1:
+            raise ValueError(f"frame_skip must be at least 1, got {frame_skip}.")
+        if frame_pool not in (POOL_LAST, POOL_MAX):
+            raise ValueError(
+                f"Unsupported frame_pool: {frame_pool!r}. Expected {POOL_LAST!r} or {POOL_MAX!r}."
+            )
+        if frame_pool == POOL_MAX and obs_type != OBS_PIXELS:
+            raise ValueError(f"frame_pool={POOL_MAX!r} requires obs_type={OBS_PIXELS!r}.")
+        self.render_mode = render_mode
+        self.max_episode_steps = max_episode_steps
+        self.copy_obs = copy_obs
+        self.obs_type = obs_type
+        self.frame_skip = frame_skip
+        self.frame_pool = frame_pool
+
+        self.simulator = GameSimulator(render=obs_type == OBS_PIXELS)
+
+        self.action_space = spaces.Discrete(NUM_AGENT_ACTIONS)
+        if obs_type == OBS_PIXELS:
+            self.observation_space = spaces.Box(
+                low=0,
+                high=MAX_COLORS - 1,
+                shape=(APP_HEIGHT, APP_WIDTH),
+                dtype=np.uint8,
+            )
+            # 매 스텝 같은 버퍼에 관측값을 덮어씁니다.
+            self._obs = np.zeros(self.observation_space.shape, dtype=np.uint8)
+            self._obs_builder = None
+        else:
+            self.observation_space = spaces.Box(
+                low=-np.inf, high=np.inf, shape=OBSERVATION_SHAPE, dtype=np.float32
+            )
+            self._obs_builder = EntityObservationBuilder()
+            self._obs = self._obs_builder.obs
+        # 최댓값 풀링용 직전 프레임 버퍼 (프레임 스킵이 없으면 풀링할 프레임도 없음)
+        self._pool_frame = (
+            np.zeros(self._obs.shape, dtype=np.uint8)
+            if frame_pool == POOL_MAX and frame_skip > 1
+            else None
+        )
+        if self._pool_frame is not None:
+            # 두 프레임의 밝기와 비교 결과를 담는 버퍼
+            self._pool_luma = np.zeros((2,) + self._obs.shape, dtype=np.uint32)
+            self._pool_mask = np.zeros(self._obs.shape, dtype=bool)
+        self.rewards = RewardAccumulator(reward_config, reward_fn)
+        self.rewards.attach(self.simulator.game)
+        self._steps = 0
+
+    @property
+    def game_vars(self):
+        return self.simulator.game.game_vars
+
+    def _screen(self) -> np.ndarray:
+        """pyxel 화면 버퍼를 복사 없이 (높이, 너비) 배열로 봅니다."""
+        return screen_view()
+
+    def _observe(self, state, frame: Optional[np.ndarray] = None) -> np.ndarray:
+        if self._obs_builder is not None:
+            self._obs_builder.build(state)
+        else:
+            np.copyto(self._obs, self._screen() if frame is None else frame)
+        return self._obs.copy() if self.copy_obs else self._obs
+
+    def _pool_brighter(self, frame: np.ndarray, screen: np.ndarray) -> None:
+        """`frame`의 픽셀 중 `screen`이 같거나 더 밝은 곳을 `screen`의 팔레트 인덱스로 바꿉니다."""
+        prev_luma, curr_luma = self._pool_luma
+        np.take(_PALETTE_LUMA, frame, out=prev_luma)
+        np.take(_PALETTE_LUMA, screen, out=curr_luma)
+        np.greater_equal(curr_luma, prev_luma, out=self._pool_mask)
+        np.copyto(frame, screen, where=self._pool_mask)
+
+    @staticmethod
+    def _is_game_over(state) -> bool:
+        return state is None or state.state == State.GAME_OVER
+
+    def _info(self) -> Dict[str, Any]:
+        return {
+            "score": self.game_vars.score,
+            "lives": self.game_vars.lives,
+            "stage": int(self.game_vars.stage_num),
+            "frame": self.simulator.frame_count,
+        }
+
+    def reset(
+        self, *, seed: Optional[int] = None, options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        새 에피소드를 시작합니다.
+
+        매개변수:
+            seed (Optional[int]): 게임 난수 시드 (폭발 위치 등). None이면 환경의
+                `np_random`에서 뽑으므로, 처음에 한 번 시드를 주면 이후 에피소드도 재현됩니다.
+            options: 사용하지 않음
+
+        반환값:
+            (관측값, 정보 딕셔너리)
+        """
+        super().reset(seed=seed)
+        if seed is None:
+            seed = int(self.np_random.integers(2**31))
+        state = self.simulator.reset(seed=seed)
+        if self._obs_builder is not None:
+            self._obs_builder.reset()
+        self.rewards.reset()
+        self._steps = 0
+        return self._observe(state), self._info()
+
+    def step(self, action) -> Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]:
+        """
+        행동을 적용하고 `frame_skip` 프레임 진행합니다.
+
+        매개변수:
+            action: 행동 ID (0~8)
+
+        반환값:
+            (관측값, 보상, terminated, truncated, 정보 딕셔너리)
+        """
+        action = int(action)
+        frame = None
+        if self._pool_frame is None:
+            state = self.simulator.step(action, self.frame_skip)
+        else:
+            # 마지막 두 프레임만 그려서 픽셀마다 더 밝은 색을 관측값으로 씁니다.
+            state = self.simulator.step(action, self.frame_skip - 1)
+            frame = self._pool_frame
+            np.copyto(frame, self._screen())
+            if not self._is_game_over(state):
+                state = self.simulator.step(action)
+                self._pool_brighter(frame, self._screen())
+        self._steps += 1
+
+        reward, terminated = self.rewards.collect()
+        terminated = terminated or state is None
+        truncated = (
+            self.max_episode_steps is not None
+            and self._steps >= self.max_episode_steps
+        )
+        return self._observe(state, frame), reward, terminated, truncated, self._info()
+
+    def render(self) -> Optional[np.ndarray]:
+        """`render_mode`가 "rgb_array"이면 현재 화면을 (높이, 너비, 3) RGB 배열로 반환합니다."""
+        if self.render_mode == "rgb_array":
+            if not self.simulator.render:
+                self.simulator.draw()
+            return indices_to_rgb(self._screen())
+        return None
+
+    def close(self) -> None:
+        self.rewards.detach()
+        self.simulator.close()
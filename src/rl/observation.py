@@ -0,0 +1,157 @@
+"""
+엔티티 상태 관측값 모듈
+
+화면을 캡처해 객체를 검출하는 대신, `GameStateStage`의 스프라이트 목록을 직접 읽어
+고정 크기 NumPy 배열로 기록합니다. 배열은 한 번만 할당하고 매 스텝 제자리에서 덮어씁니다.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from components.bullet_pool import BulletPool
+from components.entity_types import EntityType
+from config.app.constants import APP_WIDTH, APP_HEIGHT
+
+# 엔티티 그룹별 슬롯 수 (GameStateStage 속성 이름, 최대 개수)
+# 최대 개수를 넘는 엔티티는 목록 앞쪽부터 채우고 나머지는 버립니다.
+ENTITY_SLOTS: Tuple[Tuple[str, int], ...] = (
+    ("player", 1),
+    ("enemies", 16),
+    ("bosses", 2),
+    ("enemy_shots", 64),
+    ("player_shots", 8),
+    ("powerups", 4),
+)
+NUM_ENTITY_SLOTS = sum(count for _, count in ENTITY_SLOTS)
+
+# 슬롯별 특성 인덱스
+FEATURE_PRESENT = 0  # 슬롯 사용 여부 (1.0 / 0.0)
+FEATURE_TYPE = 1  # EntityType 값
+FEATURE_X = 2  # 중심 x좌표 (화면 너비로 정규화)
+FEATURE_Y = 3  # 중심 y좌표 (화면 높이로 정규화)
+FEATURE_VX = 4  # x축 속도 (픽셀/프레임)
+FEATURE_VY = 5  # y축 속도 (픽셀/프레임)
+FEATURE_HP = 6  # 체력 (적: hp, 플레이어: current_hp, 그 외 0)
+FEATURE_DELAY = 7  # 발사/등장 지연 프레임 (없으면 0)
+NUM_FEATURES = 8
+
+OBSERVATION_SHAPE = (NUM_ENTITY_SLOTS, NUM_FEATURES)
+
+
+class EntityObservationBuilder:
+    """
+    게임 상태를 (엔티티 슬롯 x 특성) 배열로 변환하는 클래스.
+
+    슬롯 순서는 `ENTITY_SLOTS` 순서를 따르며, 비어 있는 슬롯은 0으로 채워집니다.
+    속도는 직전 `build()` 때 위치와의 차이를 그 사이 진행한 프레임 수로 나눠 계산합니다
+    (프레임 스킵을 써도 픽셀/프레임). 엔티티는 등장할 때마다 새로 받는 `Sprite.serial`로
+    구분하므로, 풀에서 재사용한 객체나 같은 주소를 받은 새 객체는 이전 생애의 위치를
+    물려받지 않고 첫 프레임 속도가 0입니다. 프레임 카운터가 줄었으면(새 게임, 스냅샷
+    복원) 모든 속도를 0으로 둡니다. `BulletPool`에 저장된 적 발사체는 풀의 배열에서
+    속도를 바로 읽어 한 번에 기록합니다.
+
+    속성:
+        obs (np.ndarray): 관측값 버퍼 (`OBSERVATION_SHAPE`, float32)
+    """
+
+    def __init__(self) -> None:
+        self.obs = np.zeros(OBSERVATION_SHAPE, dtype=np.float32)
+        # entity.serial → (x, y). 두 딕셔너리를 번갈아 써서 매 프레임 새로 만들지 않습니다.
+        self._prev_pos = {}
+        self._curr_pos = {}
+        # 직전 build()의 Game.frame_count (None이면 기록 없음)
+        self._prev_frame = None
+
+    def reset(self) -> None:
+        """이전 프레임 위치 기록을 지웁니다. (에피소드 시작 시 호출)"""
+        self._prev_pos.clear()
+        self._curr_pos.clear()
+        self._prev_frame = None
+        self.obs.fill(0.0)
+
+    def build(self, state) -> np.ndarray:
+        """
+        현재 게임 상태를 관측값 버퍼에 기록합니다.
+
+        Args:
+            state: `GameStateStage` 객체 (None이면 모든 슬롯을 비움)
+
+        Returns:
+            np.ndarray: 갱신된 관측값 버퍼 (`self.obs`, 다음 호출에서 덮어써짐)
+        """
+        obs = self.obs
+        if state is None:
+            obs.fill(0.0)
+            return obs
+
+        prev_pos = self._prev_pos
+        curr_pos = self._curr_pos
+        curr_pos.clear()
+
+        frame = state.game.frame_count
+        elapsed = frame - self._prev_frame if self._prev_frame is not None else 0
+        if elapsed <= 0:
+            # 같은 프레임을 다시 관측했거나 프레임 카운터가 되돌아감: 속도 없음
+            prev_pos = {}
+        self._prev_frame = frame
+
+        slot = 0
+        for attr, count in ENTITY_SLOTS:
+            entities = getattr(state, attr)
+            end = slot + count
+            if isinstance(entities, BulletPool):
+                self._write_bullets(entities, slot, end)
+                slot = end
+                continue
+            if attr == "player":
+                entities = (entities,) if entities is not None else ()
+            for e in entities:
+                if slot == end:
+                    break
+                if e.remove:
+                    continue
+                x = e.x
+                y = e.y
+                key = e.serial
+                curr_pos[key] = (x, y)
+                prev = prev_pos.get(key)
+
+                row = obs[slot]
+                row[FEATURE_PRESENT] = 1.0
+                row[FEATURE_TYPE] = e.type
+                row[FEATURE_X] = (x + e.w / 2) / APP_WIDTH
+                row[FEATURE_Y] = (y + e.h / 2) / APP_HEIGHT
+                if prev is None:
+                    row[FEATURE_VX] = 0.0
+                    row[FEATURE_VY] = 0.0
+                else:
+                    row[FEATURE_VX] = (x - prev[0]) / elapsed
+                    row[FEATURE_VY] = (y - prev[1]) / elapsed
+                row[FEATURE_HP] = getattr(e, "hp", None) or getattr(e, "current_hp", 0)
+                row[FEATURE_DELAY] = getattr(e, "delay", 0)
+                slot += 1
+            obs[slot:end] = 0.0
+            slot = end
+
+        self._curr_pos = self._prev_pos
+        self._prev_pos = curr_pos
+        return obs
+
+    def _write_bullets(self, pool: BulletPool, start: int, end: int) -> None:
+        """발사체 풀의 살아 있는 발사체를 [start, end) 슬롯에 기록합니다."""
+        rows = self.obs[start:end]
+        n = pool.count
+        live = np.flatnonzero(pool.alive[:n])[: end - start]
+        k = len(live)
+        size = pool.size
+        moving = pool.delay[live] == 0
+        rows[:k, FEATURE_PRESENT] = 1.0
+        rows[:k, FEATURE_TYPE] = EntityType.ENEMY_SHOT
+        rows[:k, FEATURE_X] = (pool.x[live] + size / 2) / APP_WIDTH
+        rows[:k, FEATURE_Y] = (pool.y[live] + size / 2) / APP_HEIGHT
+        rows[:k, FEATURE_VX] = np.where(moving, pool.vx[live], 0.0)
+        rows[:k, FEATURE_VY] = np.where(moving, pool.vy[live], 0.0)
+        rows[:k, FEATURE_HP] = 0.0
+        rows[:k, FEATURE_DELAY] = pool.delay[live]
+        rows[k:] = 0.0
@@ -0,0 +1,199 @@
+"""
+보상 신호 모듈
+
+게임 상태를 매 프레임 비교하는 대신, 상태가 바뀌는 지점(`GameVars.add_score`,
+`GameVars.subtract_life`/`add_life`, `Player.take_damage`, `Game.go_to_next_stage`,
+게임 오버 전환, 마지막 스테이지 클리어)에서 `Game.reward_listener`로 이벤트를 받아
+누적합니다.
+리스너가 없으면(None) 각 지점은 속성 확인 한 번만 하므로 일반 플레이에는 영향이 없습니다.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class RewardEvents:
+    """
+    마지막 `RewardAccumulator.collect()` 이후 발생한 이벤트 집계.
+
+    속성:
+        score (int): 증가한 점수 (최대 점수에 걸리면 실제로 오른 만큼만)
+        damage (int): 받은 데미지 합계 (즉사 충돌은 포함하지 않음)
+        deaths (int): 잃은 목숨 수
+        lives_gained (int): 파워업으로 얻은 목숨 수
+        stages_cleared (int): 클리어한 스테이지 수
+        game_over (bool): 게임 오버가 되었는지 여부
+        game_complete (bool): 마지막 스테이지를 클리어했는지 여부
+            (게임은 곧바로 새 게임으로 다시 시작됨)
+        frames (int): 진행한 프레임 수
+    """
+
+    score: int = 0
+    damage: int = 0
+    deaths: int = 0
+    lives_gained: int = 0
+    stages_cleared: int = 0
+    game_over: bool = False
+    game_complete: bool = False
+    frames: int = 0
+
+    def clear(self) -> None:
+        self.score = 0
+        self.damage = 0
+        self.deaths = 0
+        self.lives_gained = 0
+        self.stages_cleared = 0
+        self.game_over = False
+        self.game_complete = False
+        self.frames = 0
+
+
+@dataclass
+class RewardConfig:
+    """
+    이벤트별 보상 가중치. 기본값은 점수 증가량만 보상으로 씁니다.
+
+    속성:
+        score_scale (float): 점수 1점당 보상 (기본값: 1.0)
+        damage_penalty (float): 데미지 1당 보상 (기본값: 0.0)
+        death_penalty (float): 목숨을 하나 잃을 때의 보상 (기본값: 0.0)
+        life_bonus (float): 목숨을 하나 얻을 때의 보상 (기본값: 0.0)
+        stage_clear_bonus (float): 스테이지를 클리어할 때의 보상 (기본값: 0.0)
+        game_over_penalty (float): 게임 오버가 될 때의 보상 (기본값: 0.0)
+        game_complete_bonus (float): 마지막 스테이지를 클리어할 때의 보상 (기본값: 0.0)
+        frame_reward (float): 진행한 프레임당 보상 (생존 보상, 기본값: 0.0)
+        terminate_on_death (bool): 목숨을 잃으면 에피소드를 종료할지 여부 (기본값: False)
+    """
+
+    score_scale: float = 1.0
+    damage_penalty: float = 0.0
+    death_penalty: float = 0.0
+    life_bonus: float = 0.0
+    stage_clear_bonus: float = 0.0
+    game_over_penalty: float = 0.0
+    game_complete_bonus: float = 0.0
+    frame_reward: float = 0.0
+    terminate_on_death: bool = False
+
+    def reward(self, events: RewardEvents) -> float:
+        """
+        이벤트 집계를 보상 값으로 바꿉니다.
+
+        매개변수:
+            events (RewardEvents): 이벤트 집계
+
+        반환값:
+            float: 가중치를 적용한 보상 합계
+        """
+        reward = (
+            self.score_scale * events.score
+            + self.damage_penalty * events.damage
+            + self.death_penalty * events.deaths
+            + self.life_bonus * events.lives_gained
+            + self.stage_clear_bonus * events.stages_cleared
+            + self.frame_reward * events.frames
+        )
+        if events.game_over:
+            reward += self.game_over_penalty
+        if events.game_complete:
+            reward += self.game_complete_bonus
+        return float(reward)
+
+    def terminated(self, events: RewardEvents) -> bool:
+        return (
+            events.game_over
+            or events.game_complete
+            or (self.terminate_on_death and events.deaths > 0)
+        )
+
+
+class RewardAccumulator:
+    """
+    게임 이벤트를 받아 보상을 누적하는 리스너.
+
+    `attach(game)`하면 `game.reward_listener`로 등록되어 `on_*` 메소드가 호출되고,
+    `collect()`가 그동안의 보상과 종료 여부를 돌려준 뒤 집계를 비웁니다.
+
+    속성:
+        config (RewardConfig): 보상 가중치와 종료 조건
+        reward_fn (Callable[[RewardEvents], float]): 이벤트 집계를 보상으로 바꾸는 함수
+            (기본값: `config.reward`)
+        events (RewardEvents): 현재까지의 이벤트 집계
+    """
+
+    def __init__(
+        self,
+        config: Optional[RewardConfig] = None,
+        reward_fn: Optional[Callable[[RewardEvents], float]] = None,
+    ) -> None:
+        """
+        누적기 초기화.
+
+        매개변수:
+            config (Optional[RewardConfig]): 보상 가중치 (None이면 점수만 보상)
+            reward_fn (Optional[Callable]): 보상 함수 (None이면 `config.reward`)
+        """
+        self.config = config if config is not None else RewardConfig()
+        self.reward_fn = reward_fn if reward_fn is not None else self.config.reward
+        self.events = RewardEvents()
+        self._game = None
+        # 마지막 집계 시점의 `Game.total_frames` (`frame_count`는 새 게임에서 0으로 돌아감)
+        self._start_frame = 0
+
+    def attach(self, game) -> None:
+        """게임의 보상 리스너로 등록하고 집계를 비웁니다."""
+        self._game = game
+        game.reward_listener = self
+        self.reset()
+
+    def detach(self) -> None:
+        """등록을 해제합니다. (게임은 다시 이벤트를 보내지 않음)"""
+        if self._game is not None and self._game.reward_listener is self:
+            self._game.reward_listener = None
+        self._game = None
+
+    def reset(self) -> None:
+        """집계를 비웁니다. 새 에피소드를 시작한 직후에 호출합니다."""
+        self.events.clear()
+        self._start_frame = self._game.total_frames if self._game is not None else 0
+
+    def collect(self):
+        """
+        마지막 호출 이후의 보상과 종료 여부를 계산하고 집계를 비웁니다.
+
+        반환값:
+            (보상, terminated)
+        """
+        events = self.events
+        if self._game is not None:
+            total_frames = self._game.total_frames
+            events.frames = total_frames - self._start_frame
+            self._start_frame = total_frames
+        reward = self.reward_fn(events)
+        terminated = self.config.terminated(events)
+        events.clear()
+        return reward, terminated
+
+    # 게임에서 호출하는 이벤트 메소드
+
+    def on_score(self, amount: int) -> None:
+        self.events.score += amount
+
+    def on_damage(self, amount: int) -> None:
+        self.events.damage += amount
+
+    def on_life_lost(self) -> None:
+        self.events.deaths += 1
+
+    def on_life_gained(self) -> None:
+        self.events.lives_gained += 1
+
+    def on_stage_cleared(self) -> None:
+        self.events.stages_cleared += 1
+
+    def on_game_over(self) -> None:
+        self.events.game_over = True
+
+    def on_game_complete(self) -> None:
+        self.events.game_complete = True
@@ -0,0 +1,133 @@
+from game_vars import GameVars
+from rl.reward import RewardAccumulator, RewardConfig, RewardEvents
+
+
+class FakeGame:
+    """보상 누적기가 읽는 `Game` 속성만 가진 테스트용 게임."""
+
+    def __init__(self):
+        self.reward_listener = None
+        self.frame_count = 0
+        self.total_frames = 0
+        self.game_vars = GameVars(self)
+
+    def advance(self, frames):
+        """`Game.update`처럼 두 프레임 카운터를 진행합니다."""
+        self.frame_count += frames
+        self.total_frames += frames
+
+    def start_new_game(self):
+        """`Game.start_new_game`처럼 프레임 카운터만 0으로 되돌립니다."""
+        self.frame_count = 0
+        self.game_vars.new_game()
+
+
+def test_reward_config_weights():
+    """
+    RewardConfig 보상 계산 테스트
+
+    목적: 이벤트별 가중치가 모두 보상에 반영되는지 검증
+    """
+    config = RewardConfig(
+        score_scale=0.5,
+        damage_penalty=-1.0,
+        death_penalty=-10.0,
+        life_bonus=5.0,
+        stage_clear_bonus=20.0,
+        game_over_penalty=-100.0,
+        game_complete_bonus=1000.0,
+        frame_reward=0.01,
+    )
+    events = RewardEvents(
+        score=100,
+        damage=2,
+        deaths=1,
+        lives_gained=1,
+        stages_cleared=1,
+        game_over=True,
+        game_complete=True,
+        frames=100,
+    )
+    expected = 50.0 - 2.0 - 10.0 + 5.0 + 20.0 - 100.0 + 1000.0 + 1.0
+    assert abs(config.reward(events) - expected) < 1e-9
+
+
+def test_accumulator_collects_game_vars_events():
+    """
+    GameVars 이벤트 누적 테스트
+
+    목적: GameVars의 점수/목숨 변경이 리스너를 통해 집계되고 collect() 후 비워지는지 검증
+    """
+    game = FakeGame()
+    rewards = RewardAccumulator(RewardConfig(death_penalty=-10.0))
+    rewards.attach(game)
+    assert game.reward_listener is rewards
+
+    game.game_vars.add_score(300)
+    game.game_vars.subtract_life()
+    reward, terminated = rewards.collect()
+    assert reward == 290.0
+    assert not terminated
+
+    reward, terminated = rewards.collect()
+    assert reward == 0.0
+
+    rewards.detach()
+    assert game.reward_listener is None
+
+
+def test_frames_survive_frame_count_reset():
+    """
+    새 게임 시작 시 프레임 집계 테스트
+
+    목적: 게임이 다시 시작되어 `frame_count`가 0으로 돌아가도 진행한 프레임 수가
+    음수가 되지 않고 실제 진행한 만큼 집계되는지 검증
+    """
+    game = FakeGame()
+    rewards = RewardAccumulator(RewardConfig(score_scale=0.0, frame_reward=0.01))
+    rewards.attach(game)
+
+    game.advance(5000)
+    game.start_new_game()
+    game.advance(1)
+    reward, _ = rewards.collect()
+    assert abs(reward - 50.01) < 1e-9
+
+    game.advance(10)
+    reward, _ = rewards.collect()
+    assert abs(reward - 0.1) < 1e-9
+
+
+def test_game_complete_is_terminal():
+    """
+    게임 완료 종료 테스트
+
+    목적: 마지막 스테이지 클리어(on_game_complete)가 종료로 처리되는지 검증
+    """
+    game = FakeGame()
+    rewards = RewardAccumulator(RewardConfig(game_complete_bonus=100.0))
+    rewards.attach(game)
+
+    rewards.on_stage_cleared()
+    rewards.on_game_complete()
+    reward, terminated = rewards.collect()
+    assert reward == 100.0
+    assert terminated
+
+    _, terminated = rewards.collect()
+    assert not terminated
+
+
+def test_terminate_on_death():
+    """
+    목숨 손실 종료 테스트
+
+    목적: terminate_on_death 설정일 때만 목숨을 잃으면 종료되는지 검증
+    """
+    for terminate_on_death in (False, True):
+        game = FakeGame()
+        rewards = RewardAccumulator(RewardConfig(terminate_on_death=terminate_on_death))
+        rewards.attach(game)
+        game.game_vars.subtract_life()
+        _, terminated = rewards.collect()
+        assert terminated == terminate_on_death
@@ -1,3 +1,4 @@
+import argparse
 import pyxel as px
 import platform
 import traceback
@@ -5,16 +6,23 @@ import sys # For stderr
 
 from main import App
 from rl.agents import RandomAgent
+from render_policy import RenderPolicy, RENDER_MODES, RENDER_ALWAYS
 
 # from config.app.constants import APP_FPS # Example: if needed, ensure path is correct
 
 IS_WEB = platform.system() == "Emscripten"
 
-def run_with_agent():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game driven by an agent.")
+    parser.add_argument("--render", choices=RENDER_MODES, default=RENDER_ALWAYS, help="which frames to draw")
+    parser.add_argument("--render-interval", type=int, default=1, help="draw every N frames (with --render every_n)")
+    return parser.parse_args(argv)
+
+def run_with_agent(render_policy=None):
     try:
         agent_action_space = list(range(9))
         random_agent = RandomAgent(action_space=agent_action_space)
-        App(agent=random_agent)
+        App(agent=random_agent, render_policy=render_policy)
     except Exception as e:
         error_message = f"Error in run_with_agent: {type(e).__name__}: {e}\n{traceback.format_exc()}"
         # Pyxel/Pyodide will typically print Python exceptions to the browser console.
@@ -22,4 +30,5 @@ def run_with_agent():
         print(error_message, file=sys.stderr)
 
 if __name__ == "__main__":
-    run_with_agent() 
\ No newline at end of file
+    args = parse_args([] if IS_WEB else None)
+    run_with_agent(RenderPolicy(args.render, args.render_interval)) 
\ No newline at end of file
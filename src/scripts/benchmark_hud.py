@@ -0,0 +1,91 @@
+"""
+HUD 그리기 벤치마크
+
+스테이지 1의 HUD를 반복해서 그리며 한 번에 걸리는 시간을 측정합니다.
+
+- 문자열 캐시: HUD의 문자열을 화면에 `draw_text`로 그릴 때, 캐시를 쓰지 않는 폰트
+  (문자마다 blt)와 캐시(`GlyphRunCache`)를 쓰는 폰트를 비교합니다.
+- HUD 이미지: `Hud.draw`를 매 프레임 `GameVars`가 바뀌는 경우(HUD 이미지를 매번 다시
+  그림)와 바뀌지 않는 경우(HUD 이미지 blt만)로 나누어 측정합니다.
+
+사용법 (src 디렉토리에서):
+    python -m scripts.benchmark_hud [반복 횟수]
+"""
+
+import gc
+import sys
+import time
+
+from config.player import max_weapons, weapon_names
+from rl.env.game_simulator import GameSimulator
+from hud import BOTTOM_BAR_Y, Hud
+from monospace_bitmap_font import MonospaceBitmapFont, text_cache
+
+DEFAULT_ITERATIONS = 20000
+
+
+def hud_text_runs(game_vars):
+    """HUD가 화면에 그리는 문자열 목록 (x, y, 문자열)을 반환합니다."""
+    y = BOTTOM_BAR_Y
+    runs = [
+        (24, 0, "1UP"),
+        (16, 8, f"{game_vars.score:06}"),
+        (96, 0, "HI-SCORE"),
+        (104, 8, f"{game_vars.hi_score:06}"),
+        (176, 0, "ARM"),
+        (176, 8, weapon_names[game_vars.current_weapon]),
+        (224, 8, f"{game_vars.lives}"),
+        (16, y, "ARM"),
+        (16, y + 8, "LVL"),
+    ]
+    runs.extend((56 + 64 * i + 16, y, weapon_names[i]) for i in range(max_weapons))
+    return runs
+
+
+def measure_text(game_vars, font, iterations: int) -> float:
+    """HUD 문자열을 `iterations`번 그리고 한 번당 걸린 시간(마이크로초)을 반환합니다."""
+    runs = hud_text_runs(game_vars)
+    draw_text = font.draw_text
+    for x, y, text in runs:  # 캐시 채우기
+        draw_text(x, y, text)
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for x, y, text in runs:
+            draw_text(x, y, text)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def measure_hud(game_vars, iterations: int, changing: bool) -> float:
+    """HUD를 `iterations`번 그리고 한 번당 걸린 시간(마이크로초)을 반환합니다."""
+    hud = Hud(game_vars, MonospaceBitmapFont())
+    hud.draw()  # HUD 이미지 채우기
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if changing:
+            game_vars.mark_changed()
+        hud.draw()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+    sim = GameSimulator()
+    sim.reset()
+    game_vars = sim.game.game_vars
+
+    text_cache.clear()
+    uncached = measure_text(game_vars, MonospaceBitmapFont(use_cache=False), iterations)
+    cached = measure_text(game_vars, MonospaceBitmapFont(), iterations)
+    changing = measure_hud(game_vars, iterations, changing=True)
+    static = measure_hud(game_vars, iterations, changing=False)
+    print(f"HUD text (per-glyph blt):                {uncached:.1f} us")
+    print(f"HUD text (text cache):                   {cached:.1f} us ({uncached / cached:.2f}x)")
+    print(f"Hud.draw (GameVars changed every frame): {changing:.1f} us")
+    print(f"Hud.draw (GameVars unchanged):           {static:.1f} us ({changing / static:.2f}x)")
+    sim.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+스프라이트 메모리/처리량 벤치마크
+
+스프라이트 인스턴스 크기, 생성 속도, 스테이지 1 전체 진행(보스까지) 처리량과
+메모리 사용량을 측정합니다. 스프라이트 구조를 바꿀 때 변경 전후 트리에서 각각
+실행해 비교합니다.
+
+사용법 (src 디렉토리에서):
+    python -m scripts.benchmark_sprites [프레임 수]
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from rl.env.game_simulator import GameSimulator
+from explosion import Explosion
+from player_shot import PlayerShot
+from powerup import Powerup
+from enemy_a import EnemyA
+from enemy_k import EnemyK
+
+# 스테이지 1 스크롤이 끝나고 보스전까지 포함하는 프레임 수
+DEFAULT_FRAMES = 6000
+CREATE_COUNT = 100_000
+
+
+def instance_size(obj) -> int:
+    """인스턴스 자체 크기와 (있다면) __dict__ 크기의 합을 반환합니다."""
+    size = sys.getsizeof(obj)
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        size += sys.getsizeof(d)
+    return size
+
+
+def measure_sizes(state) -> None:
+    samples = {
+        "Explosion": Explosion(state, 0, 0, 1),
+        "PlayerShot": PlayerShot(state, 0, 0, 0, 0, 4, 0),
+        "Powerup": Powerup(state, 1, 0, 0),
+        "EnemyA": EnemyA(state, 0, 0),
+        "EnemyK": EnemyK(state, 0, 0),
+        "Player": state.player,
+    }
+    print("instance size (bytes):")
+    for name, obj in samples.items():
+        print(f"  {name:<10} {instance_size(obj):>5}")
+
+
+def measure_creation(state) -> None:
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(CREATE_COUNT):
+        Explosion(state, 0, 0, 1)
+    elapsed = time.perf_counter() - start
+    print(f"Explosion create: {CREATE_COUNT / elapsed / 1e6:.2f} M/s")
+
+    e = Explosion(state, 0, 0, 1)
+    start = time.perf_counter()
+    for _ in range(CREATE_COUNT):
+        e.x = e.x + e.w
+        e.y = e.y + e.h
+    elapsed = time.perf_counter() - start
+    print(f"attribute read/write: {CREATE_COUNT * 6 / elapsed / 1e6:.1f} M ops/s")
+
+
+def run_stage(sim: GameSimulator, num_frames: int) -> float:
+    """무적 플레이어로 고정 시드 무작위 행동을 실행하고 걸린 시간을 반환합니다."""
+    rng = random.Random(0)
+    sim.reset()
+    action = 0
+    start = time.perf_counter()
+    for frame in range(num_frames):
+        if frame % 15 == 0:
+            action = rng.randrange(9)
+        sim.game.state.player.forced_invincible = True
+        sim.step(action)
+    return time.perf_counter() - start
+
+
+def measure_stage_run(sim: GameSimulator, num_frames: int) -> None:
+    gc.collect()
+    elapsed = run_stage(sim, num_frames)
+    print(
+        f"stage run: {num_frames} frames in {elapsed:.2f}s "
+        f"({num_frames / elapsed:.0f} frames/s)"
+    )
+
+    # 할당 추적은 실행을 크게 느리게 하므로 처리량과 따로 측정합니다.
+    tracemalloc.start()
+    run_stage(sim, num_frames)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"stage run traced peak: {peak / 1024:.0f} KiB")
+
+
+def main() -> None:
+    num_frames = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FRAMES
+    sim = GameSimulator()
+    state = sim.reset()
+    measure_sizes(state)
+    measure_creation(state)
+    measure_stage_run(sim, num_frames)
+    sim.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""
+스테이지 에셋 캐시 모듈
+
+스테이지 맵(TMX)에서 게임 중에 반복해서 계산하던 데이터를 한 번만 만들어 둡니다.
+
+- 적 등장 일정: 적 배치 레이어에서 등장 타일(`ENEMY_SPAWN_TILE_INDEX_Y`)만 골라
+  열(column) → ((타일 x, 행), ...) 딕셔너리로 정리합니다. 스크롤할 때마다 새로 드러난
+  열의 모든 행을 `pget`으로 확인하는 대신 딕셔너리 조회 한 번으로 끝납니다.
+- 충돌 맵: 타일 레이어에서 단단한 타일(`SOLID_TILE_START_ROW` 이상)인 칸을 (행, 열)
+  bool 배열로 만듭니다. 점 하나는 바이트 조회로, 발사체 여러 개는 배열 연산 한 번으로
+  배경 충돌을 확인할 수 있습니다.
+- 타일맵: TMX의 모든 레이어를 pyxel `Tilemap`으로 한 번만 만들어 두고, 스테이지에
+  들어갈 때는 `px.tilemaps`에 바꿔 끼우기만 합니다. (`load_tilemaps`)
+
+결과는 프로세스 안에서는 맵 파일별로 메모리에 두고, 디스크에는 TMX 파일 내용의
+해시를 키로 `CACHE_DIR/stage_assets`에 저장합니다(레이어 배열 포함). 맵을 고치면
+해시가 바뀌므로 오래된 캐시를 쓰는 일은 없고, 캐시가 있으면 TMX(XML)를 파싱하지
+않습니다.
+
+NumPy가 없는 환경(웹 빌드)에서는 레이어와 충돌 맵을 Python 목록으로 만들고 디스크
+캐시는 쓰지 않습니다. 게임이 쓰는 `spawn_schedule`, `solid_bytes`, 타일맵은 두 경로가
+같습니다. (배열 일괄 조회용 `solid`만 None)
+"""
+
+import hashlib
+import os
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Dict, Tuple
+
+import pyxel as px
+
+try:
+    import numpy as np
+except ImportError:  # 웹 빌드 등 NumPy가 없는 환경에서는 Python 목록으로 계산합니다.
+    np = None
+
+from config.paths import ASSETS_DIR, CACHE_DIR
+from enemy_spawn import ENEMY_SPAWN_TILE_INDEX_Y
+
+STAGE_ASSET_CACHE_DIR = CACHE_DIR / "stage_assets"
+
+# 캐시 형식이 바뀌면 올립니다. (해시에 포함되므로 예전 캐시 파일은 쓰이지 않음)
+STAGE_ASSET_CACHE_VERSION = 3
+
+TILES_LAYER = 0
+ENEMIES_LAYER = 1
+
+# 타일셋 이미지에서 이 행(타일 y)부터 아래의 타일은 단단함 (배경 충돌)
+SOLID_TILE_START_ROW = 176 // 8
+
+# build_tilemap에서 쓰는 16진수 숫자 문자 코드
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8) if np is not None else None
+
+# 열 → ((타일 x, 행), ...)
+SpawnSchedule = Dict[int, Tuple[Tuple[int, int], ...]]
+
+
+def read_tmx_layers(path) -> list:
+    """
+    TMX 파일의 레이어를 pyxel 타일 좌표 배열로 읽습니다.
+
+    `px.Tilemap.from_tmx`와 같은 규칙으로, 타일 번호(gid)를 타일셋 이미지의
+    (타일 x, 타일 y)로 바꾸고 빈 칸(gid 0)은 (0, 0)으로 둡니다.
+
+    매개변수:
+        path: TMX 파일 경로
+
+    반환값:
+        list: 레이어별 (높이, 너비, 2) uint8 배열 ([..., 0]=타일 x, [..., 1]=타일 y).
+            NumPy가 없으면 레이어별 행 목록 (행마다 (타일 x, 타일 y) 튜플 목록)
+    """
+    root = ET.parse(path).getroot()
+    tileset = root.find("tileset")
+    first_gid = int(tileset.get("firstgid"))
+    columns = int(tileset.get("columns"))
+
+    layers = []
+    for layer in root.findall("layer"):
+        width = int(layer.get("width"))
+        height = int(layer.get("height"))
+        if np is None:
+            values = [int(v) for v in layer.find("data").text.replace("\n", "").split(",")]
+            tiles = [
+                [
+                    divmod(gid - first_gid, columns)[::-1] if gid > 0 else (0, 0)
+                    for gid in values[row * width:(row + 1) * width]
+                ]
+                for row in range(height)
+            ]
+            layers.append(tiles)
+            continue
+        gids = np.array(
+            layer.find("data").text.replace("\n", "").split(","), dtype=np.int32
+        ).reshape(height, width)
+        index = np.where(gids > 0, gids - first_gid, 0)
+        tiles = np.empty((height, width, 2), dtype=np.uint8)
+        tiles[..., 0] = index % columns
+        tiles[..., 1] = index // columns
+        layers.append(tiles)
+    return layers
+
+
+def compile_spawn_schedule(enemy_tiles) -> SpawnSchedule:
+    """
+    적 배치 레이어를 열별 적 등장 일정으로 정리합니다.
+
+    매개변수:
+        enemy_tiles: 적 배치 레이어 (`read_tmx_layers`가 반환한 레이어 하나)
+
+    반환값:
+        SpawnSchedule: 열 → ((타일 x, 행), ...) (열과 행은 오름차순)
+    """
+    if np is None:
+        schedule: Dict[int, list] = {}
+        width = len(enemy_tiles[0]) if enemy_tiles else 0
+        for col in range(width):
+            for row, tiles in enumerate(enemy_tiles):
+                tile_x, tile_y = tiles[col]
+                if tile_y == ENEMY_SPAWN_TILE_INDEX_Y:
+                    schedule.setdefault(col, []).append((tile_x, row))
+        return {col: tuple(spawns) for col, spawns in schedule.items()}
+    rows, cols = np.nonzero(enemy_tiles[..., 1] == ENEMY_SPAWN_TILE_INDEX_Y)
+    order = np.lexsort((rows, cols))
+    schedule: Dict[int, list] = {}
+    for col, row in zip(cols[order].tolist(), rows[order].tolist()):
+        schedule.setdefault(col, []).append((int(enemy_tiles[row, col, 0]), row))
+    return {col: tuple(spawns) for col, spawns in schedule.items()}
+
+
+def compile_solid_map(tiles):
+    """
+    타일 레이어에서 단단한 칸을 찾습니다.
+
+    매개변수:
+        tiles: 타일 레이어 (`read_tmx_layers`가 반환한 레이어 하나)
+
+    반환값:
+        (높이, 너비) bool 배열 (단단한 칸이 True, NumPy가 없으면 행별 bool 목록)
+    """
+    if np is None:
+        return [[tile_y >= SOLID_TILE_START_ROW for _, tile_y in row] for row in tiles]
+    return tiles[..., 1] >= SOLID_TILE_START_ROW
+
+
+def build_tilemap(tiles, image_index: int = 0):
+    """
+    타일 좌표 배열로 pyxel `Tilemap`을 만듭니다. (`px.Tilemap.from_tmx`와 같은 결과)
+
+    매개변수:
+        tiles: (높이, 너비, 2) 타일 좌표 배열 (`read_tmx_layers`가 반환한 레이어 하나)
+        image_index (int): 타일셋 이미지 뱅크 번호 (기본값: 0)
+
+    반환값:
+        px.Tilemap: 새 타일맵
+    """
+    # `Tilemap.set`이 받는 행 문자열("xxyy xxyy ...", 16진수)을 만듭니다.
+    if np is None:
+        height, width = len(tiles), len(tiles[0]) if tiles else 0
+        rows = [" ".join(f"{x:02x}{y:02x}" for x, y in row) for row in tiles]
+    else:
+        height, width = tiles.shape[:2]
+        text = np.full((height, width, 5), ord(" "), dtype=np.uint8)
+        text[..., 0:4:2] = _HEX_DIGITS[tiles >> 4]
+        text[..., 1:4:2] = _HEX_DIGITS[tiles & 0xF]
+        rows = [row.tobytes()[:-1].decode("ascii") for row in text.reshape(height, -1)]
+    tilemap = px.Tilemap(width, height, image_index)
+    tilemap.set(0, 0, rows)
+    return tilemap
+
+
+def _schedule_to_arrays(schedule: SpawnSchedule) -> Dict[str, "np.ndarray"]:
+    entries = [
+        (col, tile_x, row)
+        for col, spawns in schedule.items()
+        for tile_x, row in spawns
+    ]
+    table = np.array(entries, dtype=np.int32).reshape(-1, 3)
+    return {"spawn_table": table}
+
+
+def _schedule_from_arrays(arrays) -> SpawnSchedule:
+    schedule: Dict[int, list] = {}
+    for col, tile_x, row in arrays["spawn_table"].tolist():
+        schedule.setdefault(col, []).append((tile_x, row))
+    return {col: tuple(spawns) for col, spawns in schedule.items()}
+
+
+class StageAssets:
+    """
+    스테이지 맵 하나에서 미리 계산한 데이터.
+
+    레이어가 하나뿐인 맵(엔딩 화면 등)은 적 등장 일정이 비어 있습니다.
+    충돌 맵은 배열(`solid`, 일괄 조회용)과 같은 내용의 바이트열(`solid_bytes`,
+    `ty * solid_width + tx` 위치의 1/0, 점 하나 조회용)로 둘 다 가지고 있습니다.
+    NumPy가 없으면 `solid`는 None이고 레이어는 Python 목록입니다.
+
+    같은 맵의 `StageAssets`는 프로세스 안에서 하나만 만들어 공유하므로 내용을
+    직접 바꾸지 마세요. pickle하면 맵 파일 이름만 저장되고, 복원할 때 캐시에서 다시
+    가져옵니다.
+
+    속성:
+        map_file (str): 맵 파일 이름 (`assets/` 기준)
+        digest (str): 맵 파일 내용과 캐시 버전의 해시
+        layers (tuple): 레이어별 (높이, 너비, 2) 타일 좌표 배열
+        spawn_schedule (SpawnSchedule): 열별 적 등장 일정
+        solid (Optional[np.ndarray]): (행, 열) 단단한 칸 여부 (bool, NumPy가 없으면 None)
+        solid_bytes (bytes): `solid`를 행 우선으로 펼친 바이트열
+        solid_width (int): 충돌 맵 열 수
+        solid_height (int): 충돌 맵 행 수
+    """
+
+    __slots__ = (
+        "map_file",
+        "digest",
+        "layers",
+        "spawn_schedule",
+        "solid",
+        "solid_bytes",
+        "solid_width",
+        "solid_height",
+        "_tilemaps",
+    )
+
+    def __init__(
+        self,
+        map_file: str,
+        digest: str,
+        layers: list,
+        spawn_schedule: SpawnSchedule,
+        solid,
+    ) -> None:
+        self.map_file = map_file
+        self.digest = digest
+        self.spawn_schedule = spawn_schedule
+        self._tilemaps = None
+        if np is None:
+            self.layers = tuple(layers)
+            self.solid = None
+            self.solid_bytes = bytes(cell for row in solid for cell in row)
+            self.solid_height = len(solid)
+            self.solid_width = len(solid[0]) if solid else 0
+            return
+        for tiles in layers:
+            tiles.setflags(write=False)
+        self.layers = tuple(layers)
+        solid.setflags(write=False)
+        self.solid = solid
+        self.solid_bytes = solid.tobytes()
+        self.solid_height, self.solid_width = solid.shape
+
+    def tilemaps(self) -> tuple:
+        """레이어별 pyxel `Tilemap`을 반환합니다. (처음 호출할 때 한 번만 만듦)"""
+        if self._tilemaps is None:
+            self._tilemaps = tuple(build_tilemap(tiles) for tiles in self.layers)
+        return self._tilemaps
+
+    def __reduce__(self):
+        return get_stage_assets, (self.map_file,)
+
+
+# 맵 파일 이름 → StageAssets
+_stage_assets: Dict[str, StageAssets] = {}
+
+# 현재 px.tilemaps에 들어 있는 맵 파일 (pyxel 타일맵은 프로세스 전역)
+_loaded_map_file = None
+
+
+def _file_digest(data: bytes) -> str:
+    h = hashlib.blake2b(data, digest_size=16)
+    h.update(STAGE_ASSET_CACHE_VERSION.to_bytes(4, "little"))
+    return h.hexdigest()
+
+
+def _load_disk_cache(path):
+    try:
+        with np.load(path) as arrays:
+            return {name: arrays[name] for name in arrays.files}
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def _save_disk_cache(path, arrays) -> None:
+    """캐시를 저장합니다. 쓸 수 없는 환경(읽기 전용, 웹)에서는 조용히 넘어갑니다."""
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_stage_assets(map_file: str) -> StageAssets:
+    """
+    맵 파일의 `StageAssets`를 반환합니다.
+
+    메모리 캐시에 없으면 디스크 캐시를 찾고, 그것도 없으면 TMX를 읽어 계산한 뒤
+    디스크 캐시에 저장합니다. (NumPy가 없으면 디스크 캐시를 쓰지 않음)
+
+    매개변수:
+        map_file (str): 맵 파일 이름 (`assets/` 기준, 예: "stage_1.tmx", "title.tmx")
+
+    반환값:
+        StageAssets: 미리 계산한 스테이지 데이터
+    """
+    assets = _stage_assets.get(map_file)
+    if assets is not None:
+        return assets
+
+    map_path = ASSETS_DIR / map_file
+    digest = _file_digest(map_path.read_bytes())
+    cache_path = STAGE_ASSET_CACHE_DIR / f"{map_path.stem}-{digest}.npz"
+
+    # NumPy가 없으면 디스크 캐시(npz) 없이 매번 TMX에서 계산합니다.
+    arrays = _load_disk_cache(cache_path) if np is not None else None
+    if arrays is not None:
+        layers = [arrays[f"layer_{i}"] for i in range(int(arrays["num_layers"]))]
+        schedule = _schedule_from_arrays(arrays)
+        solid_width = int(arrays["solid_width"])
+        solid = np.unpackbits(arrays["solid"], axis=1, count=solid_width).astype(bool)
+    else:
+        layers = read_tmx_layers(map_path)
+        if len(layers) > ENEMIES_LAYER:
+            schedule = compile_spawn_schedule(layers[ENEMIES_LAYER])
+        else:
+            schedule = {}
+        solid = compile_solid_map(layers[TILES_LAYER])
+        if np is not None:
+            arrays = _schedule_to_arrays(schedule)
+            arrays["solid"] = np.packbits(solid, axis=1)
+            arrays["solid_width"] = np.array(solid.shape[1])
+            arrays["num_layers"] = np.array(len(layers))
+            for i, tiles in enumerate(layers):
+                arrays[f"layer_{i}"] = tiles
+            _save_disk_cache(cache_path, arrays)
+
+    assets = StageAssets(map_file, digest, layers, schedule, solid)
+    _stage_assets[map_file] = assets
+    return assets
+
+
+def load_tilemaps(map_file: str) -> None:
+    """
+    맵 파일의 레이어를 `px.tilemaps[0]`, `px.tilemaps[1]`, ...에 넣습니다.
+
+    캐시해 둔 `Tilemap`을 바꿔 끼우기만 하며(TMX를 다시 파싱하지 않음), 이미 같은 맵이
+    들어 있으면 아무것도 하지 않습니다. 캐시한 타일맵을 `px.tilemaps`와 공유하므로
+    `px.tilemaps[i].pset()` 등으로 내용을 바꾸지 마세요.
+
+    매개변수:
+        map_file (str): 맵 파일 이름 (`assets/` 기준)
+    """
+    global _loaded_map_file
+    if _loaded_map_file == map_file:
+        return
+    for index, tilemap in enumerate(get_stage_assets(map_file).tilemaps()):
+        px.tilemaps[index] = tilemap
+    _loaded_map_file = map_file
+
+
+def clear_stage_asset_cache() -> None:
+    """메모리 캐시를 비웁니다. (디스크 캐시는 그대로 둠)"""
+    global _loaded_map_file
+    _stage_assets.clear()
+    _loaded_map_file = None
@@ -1,13 +1,10 @@
 import pyxel as px
 
-from enemy_spawn import ENEMY_SPAWN_TILE_INDEX_Y
 import enemy_spawn
+import stage_assets
+from stage_assets import SOLID_TILE_START_ROW
 from components.entity_types import EntityType
 from config.sound import SoundConfig
-from audio import AudioManager
-
-# 오디오 매니저 인스턴스 생성
-audio_manager = AudioManager()
 
 VIEW_WIDTH = 256
 VIEW_HEIGHT = 160
@@ -19,8 +16,6 @@ MAP_HEIGHT_TILES = MAP_HEIGHT // 8
 TILES_TM_INDEX = 0
 ENEMIES_TM_INDEX = 1
 
-SOLID_TILE_START_ROW = 176 // 8
-
 SCROLL_X_STOP_STAGE_MUSIC = 208 * 8
 SCROLL_X_START_BOSS_MUSIC = 223 * 8
 
@@ -41,38 +36,86 @@ class StageBackground:
         self.vortex_scroll_x = 0
         self.vortex_scroll_x_speed = 8
 
-        px.tilemaps[TILES_TM_INDEX] = px.Tilemap.from_tmx(
-            "assets/" + map_file, TILES_TM_INDEX
-        )
-        px.tilemaps[ENEMIES_TM_INDEX] = px.Tilemap.from_tmx(
-            "assets/" + map_file, ENEMIES_TM_INDEX
-        )
+        self.map_file = map_file
+        self.load_tilemaps()
+        self.assets = stage_assets.get_stage_assets(map_file)
+        # 열 → ((타일 x, 행), ...). 공유 캐시이므로 고칠 때는 새 딕셔너리로 바꿔 끼웁니다.
+        self.spawn_schedule = self.assets.spawn_schedule
 
         self.last_col_checked = 0
 
         self.music_gain = SoundConfig.SOUND_CHANNEL_GAIN_DEFAULT
 
+    def load_tilemaps(self):
+        """
+        스테이지 맵(TMX)의 타일/적 배치 레이어를 pyxel 타일맵에 불러옵니다.
+
+        `stage_assets`에 캐시해 둔 타일맵을 바꿔 끼우므로, 같은 맵을 다시 불러올 때
+        (재시작, 게임 오버 후 새 게임) TMX를 다시 파싱하지 않습니다.
+        """
+        stage_assets.load_tilemaps(self.map_file)
+
     def get_tile(self, tile_x, tile_y):
         return px.tilemaps[TILES_TM_INDEX].pget(tile_x, tile_y)
 
     def is_point_colliding(self, x, y):
         y -= 16  # offset screen pixels due to hud
-        return self.get_tile(x // 8, y // 8)[1] >= SOLID_TILE_START_ROW
+        tile_x = int(x // 8)
+        tile_y = int(y // 8)
+        assets = self.assets
+        # 맵 밖은 빈 타일 (pget과 같은 규칙)
+        if 0 <= tile_x < assets.solid_width and 0 <= tile_y < assets.solid_height:
+            return assets.solid_bytes[tile_y * assets.solid_width + tile_x] != 0
+        return False
+
+    def points_colliding(self, xs, ys):
+        """
+        여러 점의 배경 충돌을 한 번에 확인합니다. (`is_point_colliding`과 같은 규칙)
+
+        매개변수:
+            xs (np.ndarray): 화면 x좌표 배열
+            ys (np.ndarray): 화면 y좌표 배열
+
+        반환값:
+            np.ndarray: 점별 충돌 여부 (bool)
+        """
+        # NumPy 발사체 풀에서만 호출하므로 NumPy는 여기서 가져옵니다. (웹 빌드에는 없음)
+        import numpy as np
+
+        solid = self.assets.solid
+        tile_x = np.floor_divide(xs, 8).astype(np.int64)
+        tile_y = np.floor_divide(np.subtract(ys, 16), 8).astype(np.int64)
+        h, w = solid.shape
+        inside = (tile_x >= 0) & (tile_x < w) & (tile_y >= 0) & (tile_y < h)
+        hit = np.zeros(inside.shape, dtype=bool)
+        hit[inside] = solid[tile_y[inside], tile_x[inside]]
+        return hit
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # 고치지 않은 등장 일정은 스냅샷에 넣지 않고 복원할 때 에셋 캐시에서 다시 연결합니다.
+        if state["spawn_schedule"] is self.assets.spawn_schedule:
+            state["spawn_schedule"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.spawn_schedule is None:
+            self.spawn_schedule = self.assets.spawn_schedule
 
     def check_next_enemy_spawn(self):
         col = (self.scroll_x + VIEW_WIDTH) // 8
         if col > self.last_col_checked:
             self.last_col_checked = col
-            for row in range(MAP_HEIGHT_TILES):
-                tile = px.tilemaps[ENEMIES_TM_INDEX].pget(col, row)
-                if tile[1] == ENEMY_SPAWN_TILE_INDEX_Y:
+            spawns = self.spawn_schedule.get(col)
+            if spawns:
+                for tile_x, row in spawns:
                     enemy_spawn.create(
                         self.state_stage,
-                        tile[0] << 3,
+                        tile_x << 3,
                         col * 8 - self.scroll_x,
                         16 + row * 8,
                     )
-                    row += 1  # skip down as one below wont be another enemy
 
     def update(self):
         if self.scroll_x < self.map_width - VIEW_WIDTH:
@@ -87,9 +130,9 @@ class StageBackground:
             self.scroll_x >= SCROLL_X_STOP_STAGE_MUSIC
             and self.scroll_x < SCROLL_X_START_BOSS_MUSIC
         ):
-            self.music_gain = audio_manager.fade_out_music(3)
+            self.music_gain = self.state_stage.game.audio.fade_out_music(3)
         elif self.scroll_x == SCROLL_X_START_BOSS_MUSIC:
-            audio_manager.reset_music_gain(3)
+            self.state_stage.game.audio.reset_music_gain(3)
             self.state_stage.play_boss_music()
 
         self.check_next_enemy_spawn()
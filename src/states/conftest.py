@@ -0,0 +1,12 @@
+"""
+states 테스트 설정
+
+`states.game_state` 패키지는 import할 때 pyxel(SDL)을 불러오고 테스트는 헤드리스
+시뮬레이터를 쓰므로, 이를 쓸 수 없는 환경에서는 `game_state/test_*.py`를 수집하지 않습니다.
+"""
+
+try:
+    import gymnasium  # noqa: F401
+    import pyxel  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["game_state/test_*.py"]
@@ -3,7 +3,7 @@ import pyxel as px
 import input as input
 from hud import Hud
 from config.music import special_music_files
-from audio import AudioManager
+import stage_assets
 
 # 화면 너비
 VIEW_WIDTH = 256
@@ -44,15 +44,13 @@ class GameStateComplete:
         self.hud = Hud(game.game_vars, self.font)
 
         # 배경 타일맵 로드
-        px.tilemaps[BG_TM_INDEX] = px.Tilemap.from_tmx(
-            "assets/" + TITLE_SCREEN_MAP_FILE, BG_TM_INDEX
-        )
+        stage_assets.load_tilemaps(TITLE_SCREEN_MAP_FILE)
 
         # 배경 스크롤 초기값 설정
         self.scroll_x = 0
 
         # 음악 로드 및 재생
-        self.audio_manager = AudioManager()
+        self.audio_manager = game.audio
         self.music = self.audio_manager.load_music(special_music_files["game_complete"])
         self.audio_manager.play_music(self.music, True, num_channels=3)
 
@@ -5,9 +5,11 @@ import pyxel as px
 from config.stage.stage_num import FINAL_STAGE
 from config.music import special_music_files, stage_music_mapping
 from components.player import Player
+from components.bullet_pool import BulletPool
 from components.sprite import (
     sprites_update,
     sprites_draw,
+    sprites_clear,
     sprite_lists_collide,
     sprite_collide_list,
 )
@@ -16,10 +18,7 @@ from explosion import Explosion
 from powerup import Powerup
 from stage_background import StageBackground
 import input as input
-from audio import AudioManager
-
-# 오디오 매니저 인스턴스 생성
-audio_manager = AudioManager()
+from states.game_state import stage_snapshot
 
 class State(Enum):
     """스테이지 상태 열거형."""
@@ -59,7 +58,7 @@ class GameStateStage:
 
         # 적 및 관련 객체 초기화
         self.enemies = []
-        self.enemy_shots = []
+        self.enemy_shots = BulletPool(self)  # 적 발사체는 배열 기반 풀에 저장
         self.bosses = []
 
         # 폭발 효과 리스트 초기화
@@ -83,12 +82,30 @@ class GameStateStage:
         self.check_stage_clear = False
 
         # 음악 로드 및 재생
-        self.music = audio_manager.load_music(stage_music_mapping[self.game.game_vars.stage_num])
-        audio_manager.play_music(self.music, num_channels=3)
+        self.music = self.game.audio.load_music(stage_music_mapping[self.game.game_vars.stage_num])
+        self.game.audio.play_music(self.music, num_channels=3)
+
+    def snapshot(self) -> bytes:
+        """
+        현재 진행 상태를 바이너리 스냅샷으로 저장합니다. (`stage_snapshot` 참고)
+
+        반환값:
+            bytes: `restore()`에 넘길 스냅샷 데이터
+        """
+        return stage_snapshot.snapshot_stage(self)
+
+    def restore(self, data: bytes) -> None:
+        """
+        `snapshot()`으로 저장한 진행 상태로 되돌립니다.
+
+        매개변수:
+            data (bytes): 스냅샷 데이터
+        """
+        stage_snapshot.restore_stage(self, data)
 
     def on_exit(self):
         """스테이지 상태 종료 시 처리."""
-        audio_manager.stop_music()
+        self.game.audio.stop_music()
 
     def end_of_vortex_stage(self):
         if self.state == State.PLAY:
@@ -100,10 +117,10 @@ class GameStateStage:
             e.destroy()
         self.switch_state(State.STAGE_CLEAR)
         if self.game.game_vars.stage_num < FINAL_STAGE:
-            self.music = audio_manager.load_music(special_music_files["stage_clear"])
-            audio_manager.play_music(self.music, False, num_channels=3, theTick=620)
+            self.music = self.game.audio.load_music(special_music_files["stage_clear"])
+            self.game.audio.play_music(self.music, False, num_channels=3, theTick=620)
         else:
-            audio_manager.stop_music()
+            self.game.audio.stop_music()
 
     def respawn_player(self):
         self.player = Player(self)
@@ -122,7 +139,7 @@ class GameStateStage:
         self.powerups.append(p)
 
     def add_explosion(self, x, y, delay):
-        self.explosions.append(Explosion(self, x, y, delay))
+        self.explosions.append(Explosion.acquire(self, x, y, delay))
 
     def trigger_bomb(self):
         self.enemy_shots.clear()
@@ -144,6 +161,9 @@ class GameStateStage:
     def add_enemy_shot(self, s):
         self.enemy_shots.append(s)
 
+    def spawn_enemy_shot(self, x, y, dx, dy, delay=0):
+        self.enemy_shots.spawn(x, y, dx, dy, delay)
+
     def update_play(self):
         """게임 플레이 상태를 업데이트합니다."""
         self.player.update()
@@ -171,12 +191,14 @@ class GameStateStage:
                 self.switch_state(State.PLAYER_SPAWNED)
             else:
                 self.switch_state(State.GAME_OVER)
-                self.music = audio_manager.load_music(special_music_files["game_over"])
-                audio_manager.play_music(self.music, False, num_channels=3)
+                if self.game.reward_listener is not None:
+                    self.game.reward_listener.on_game_over()
+                self.music = self.game.audio.load_music(special_music_files["game_over"])
+                self.game.audio.play_music(self.music, False, num_channels=3)
 
     def play_boss_music(self):
-        self.music = audio_manager.load_music(special_music_files["boss"])
-        audio_manager.play_music(self.music, True, num_channels=3)
+        self.music = self.game.audio.load_music(special_music_files["boss"])
+        self.game.audio.play_music(self.music, True, num_channels=3)
 
     def update_game_over(self):
         print("[GAME_PY_DEBUG] Game over, restarting game automatically.")
@@ -188,7 +210,7 @@ class GameStateStage:
             self.switch_state(State.PLAY)
 
     def update_stage_clear(self):
-        if self.state_time >= STAGE_CLEAR_FRAMES and not audio_manager.is_music_playing():
+        if self.state_time >= STAGE_CLEAR_FRAMES and not self.game.audio.is_music_playing():
             self.game.go_to_next_stage()
 
     def update(self):
@@ -221,7 +243,7 @@ class GameStateStage:
         sprites_update(self.player_shots)
         sprites_update(self.enemies)
         sprites_update(self.bosses)
-        sprites_update(self.enemy_shots)
+        self.enemy_shots.update()
 
         if self.check_stage_clear:
             self.check_stage_clear = False
@@ -231,7 +253,7 @@ class GameStateStage:
         sprite_lists_collide(self.player_shots, self.enemies)
         sprite_lists_collide(self.player_shots, self.bosses)
         sprite_collide_list(self.player, self.powerups)
-        sprite_collide_list(self.player, self.enemy_shots)
+        self.enemy_shots.collide_sprite(self.player)
         sprite_collide_list(self.player, self.enemies)
         sprite_collide_list(self.player, self.bosses)
 
@@ -239,7 +261,7 @@ class GameStateStage:
 
         if self.state == State.PLAY and self.player.remove:
             self.switch_state(State.PLAYER_DEAD)
-            self.player_shots.clear()
+            sprites_clear(self.player_shots)
 
     def draw(self):
         """스테이지 상태 그리기."""
@@ -253,7 +275,7 @@ class GameStateStage:
         sprites_draw(self.enemies)
         sprites_draw(self.bosses)
         sprites_draw(self.explosions)
-        sprites_draw(self.enemy_shots)
+        self.enemy_shots.draw()
 
         self.hud.draw()
 
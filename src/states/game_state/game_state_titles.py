@@ -6,7 +6,7 @@ import pyxel as px
 import input as input
 from hud import Hud
 from config.app import APP_VERSION
-from audio import AudioManager
+import stage_assets
 
 # 화면 너비 (픽셀 단위)
 VIEW_WIDTH = 256
@@ -23,9 +23,6 @@ BG_TM_INDEX = 0
 # 전경 타일맵 인덱스 (내부 식별자)
 FG_TM_INDEX = 1
 
-# 오디오 매니저 인스턴스 생성
-audio_manager = AudioManager()
-
 class GameStateTitles:
     """
     타이틀 화면 상태를 나타내는 클래스.
@@ -56,12 +53,8 @@ class GameStateTitles:
 
         # 배경 및 전경 타일맵 로딩
         # Tiled로 작성한 타일맵을 로드하여 pyxel에서 사용
-        px.tilemaps[BG_TM_INDEX] = px.Tilemap.from_tmx(
-            "assets/" + TILEMAP_FILE, BG_TM_INDEX
-        )
-        px.tilemaps[FG_TM_INDEX] = px.Tilemap.from_tmx(
-            "assets/" + TILEMAP_FILE, FG_TM_INDEX
-        )
+        # (레이어 순서대로 BG_TM_INDEX, FG_TM_INDEX에 들어감)
+        stage_assets.load_tilemaps(TILEMAP_FILE)
 
         # 배경 스크롤 초기 위치 설정
         self.scroll_x = 0  # 스크롤 시작 위치 (왼쪽)
@@ -85,15 +78,15 @@ class GameStateTitles:
         self.selected_index = 0
 
         # 음악 로딩 및 재생 시작
-        self.music = audio_manager.load_music(MUSIC_FILE)
-        audio_manager.play_music(self.music)
+        self.music = self.game.audio.load_music(MUSIC_FILE)
+        self.game.audio.play_music(self.music)
 
     def on_exit(self):
         """타이틀 화면 종료 시 처리
 
         pyxel의 사운드 재생을 중지합니다.
         """
-        audio_manager.stop_music()
+        self.game.audio.stop_music()
 
     def update(self):
         """
@@ -0,0 +1,133 @@
+"""
+스테이지 스냅샷 모듈
+
+`GameStateStage`의 진행 상태(플레이어, 모든 스프라이트 목록, 적 발사체 풀, 배경 스크롤,
+`GameVars`, `Powerup` 사이클 카운터, 게임 난수/프레임 카운터, 오디오 백엔드 상태)를
+pickle 바이너리로
+저장하고 되돌립니다. 탐색형 에이전트의 분기 롤아웃이나 "만약" 평가에 사용합니다.
+
+게임, 입력, 폰트, HUD처럼 진행 상태가 아닌 객체는 값으로 저장하지 않고 persistent id로
+표시해 두었다가, 복원할 때 현재 객체를 다시 연결합니다. 음악(`audio.Music`)은 파일
+이름으로 저장되어 `music_registry`의 같은 곡으로 돌아옵니다. 그래서 복원은
+`GameStateStage.__init__`(TMX 파싱, 음악 로드)을 다시 실행하지 않습니다.
+
+오디오 백엔드 상태(`game.audio`의 속성)도 함께 저장합니다. `NullAudio`는 음악 종료
+프레임과 게인을 게임 프레임으로 계산하고, 스테이지 클리어 등은 `is_music_playing()`을
+기다리므로 이 상태가 있어야 복원 후 같은 프레임에 진행됩니다. pyxel 오디오의 실제
+재생 위치는 되돌리지 않습니다.
+"""
+
+import io
+import pickle
+from array import array
+from typing import Any, Dict
+
+from powerup import Powerup
+
+SNAPSHOT_VERSION = 2
+
+
+def _external_objects(stage) -> Dict[str, Any]:
+    """값 대신 이름으로 저장할 객체 (이름 → 현재 객체)."""
+    externals = {
+        "stage": stage,
+        "game": stage.game,
+        "game_vars": stage.game.game_vars,
+        "input": stage.input,
+        "font": stage.font,
+        "hud": stage.hud,
+    }
+    return {name: obj for name, obj in externals.items() if obj is not None}
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file, externals: Dict[str, Any]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._external_ids = {id(obj): name for name, obj in externals.items()}
+
+    def persistent_id(self, obj):
+        return self._external_ids.get(id(obj))
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, externals: Dict[str, Any]) -> None:
+        super().__init__(file)
+        self._externals = externals
+
+    def persistent_load(self, pid):
+        try:
+            return self._externals[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Unknown external object in snapshot: {pid!r}")
+
+
+def _pack_rng_state(state):
+    """`random.Random` 상태의 Mersenne Twister 배열(625개 정수)을 바이트로 묶습니다."""
+    version, internal, gauss_next = state
+    return version, array("I", internal).tobytes(), gauss_next
+
+
+def _unpack_rng_state(packed):
+    version, internal, gauss_next = packed
+    words = array("I")
+    words.frombytes(internal)
+    return version, tuple(words), gauss_next
+
+
+def snapshot_stage(stage) -> bytes:
+    """
+    스테이지 진행 상태를 바이너리로 저장합니다.
+
+    매개변수:
+        stage (GameStateStage): 저장할 스테이지 상태
+
+    반환값:
+        bytes: 스냅샷 데이터
+    """
+    game = stage.game
+    # version은 되돌리지 않고 복원 시 새로 증가시킵니다. (HUD가 이전 값을 다시 쓰지 않도록)
+    game_vars = {
+        k: v for k, v in vars(game.game_vars).items() if k not in ("game", "version")
+    }
+    payload = (
+        SNAPSHOT_VERSION,
+        stage.__dict__,
+        game_vars,
+        (Powerup.type_cycle_index, Powerup.type_cycle_gap_cnt),
+        _pack_rng_state(game.rng.getstate()),
+        game.frame_count,
+        {k: v for k, v in vars(game.audio).items() if k != "_game"},
+    )
+    buffer = io.BytesIO()
+    _SnapshotPickler(buffer, _external_objects(stage)).dump(payload)
+    return buffer.getvalue()
+
+
+def restore_stage(stage, data: bytes) -> None:
+    """
+    스냅샷을 스테이지 상태에 그대로 되돌립니다.
+
+    같은 `Game`의 `GameStateStage`라면 스냅샷을 만든 객체가 아니어도 됩니다.
+    다른 스테이지 맵이 불러와져 있으면 타일맵만 바꿔 끼웁니다.
+
+    매개변수:
+        stage (GameStateStage): 복원할 스테이지 상태 (현재 게임의 상태)
+        data (bytes): `snapshot_stage`로 만든 스냅샷 데이터
+    """
+    unpickler = _SnapshotUnpickler(io.BytesIO(data), _external_objects(stage))
+    payload = unpickler.load()
+    if payload[0] != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {payload[0]}.")
+    _, stage_dict, game_vars, cycle, rng_state, frame_count, audio_state = payload
+
+    stage.__dict__.update(stage_dict)
+    game = stage.game
+    game.game_vars.__dict__.update(game_vars)
+    game.game_vars.mark_changed()
+    Powerup.type_cycle_index, Powerup.type_cycle_gap_cnt = cycle
+    game.rng.setstate(_unpack_rng_state(rng_state))
+    game.frame_count = frame_count
+    game.audio.__dict__.update(audio_state)
+
+    # 다른 맵이 불러와져 있을 때만 타일맵을 바꿔 끼웁니다.
+    stage.background.load_tilemaps()
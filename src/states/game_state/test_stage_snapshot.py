@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from input import NUM_AGENT_ACTIONS
+from rl.env.game_simulator import GameSimulator
+from rl.env.replay import state_fingerprint
+
+
+@pytest.fixture
+def simulator():
+    sim = GameSimulator()
+    yield sim
+    sim.close()
+
+
+def _run_until_stage_changes(sim, actions):
+    """현재 스테이지 상태 객체가 바뀔 때까지 진행하고 (프레임 수, 지문)을 반환합니다."""
+    stage = sim.game.state
+    for frames, action in enumerate(actions, 1):
+        sim.step(action)
+        if sim.game.state is not stage:
+            return frames, state_fingerprint(sim.game)
+    raise AssertionError("Stage did not change within the given actions.")
+
+
+def test_restore_after_stage_clear_branch(simulator):
+    """
+    스테이지 클리어 분기 복원 테스트
+
+    목적: 스테이지 클리어 대기 중에 저장한 스냅샷을 다음 스테이지로 넘어간 뒤 복원해도,
+    같은 입력으로 같은 프레임에 같은 상태로 다음 스테이지에 도착하는지 검증
+    (음악 종료를 기다리므로 오디오 백엔드 상태와 재생 중인 곡도 함께 복원되어야 함)
+    """
+    simulator.reset(seed=3)
+    stage = simulator.game.state
+    stage.stage_clear_init()
+    music_file = stage.music.file
+    snapshot = stage.snapshot()
+
+    rng = random.Random(0)
+    actions = [rng.choice([None] + list(range(NUM_AGENT_ACTIONS))) for _ in range(2000)]
+    first = _run_until_stage_changes(simulator, actions)
+    assert simulator.game.state.music.file != music_file
+
+    # 다음 스테이지(다른 음악이 반복 재생 중)에서 복원
+    restored = simulator.game.state
+    restored.restore(snapshot)
+    assert restored.music.file == music_file
+    assert _run_until_stage_changes(simulator, actions) == first
+
+
+def test_restore_mid_stage(simulator):
+    """스테이지 진행 중 스냅샷을 복원하고 같은 입력을 넣으면 같은 상태가 되는지 테스트"""
+    simulator.reset(seed=5)
+    rng = random.Random(1)
+    actions = [rng.randrange(NUM_AGENT_ACTIONS) for _ in range(1200)]
+    for action in actions[:600]:
+        simulator.step(action)
+    snapshot = simulator.game.state.snapshot()
+
+    for action in actions[600:]:
+        simulator.step(action)
+    expected = state_fingerprint(simulator.game)
+
+    simulator.game.state.restore(snapshot)
+    for action in actions[600:]:
+        simulator.step(action)
+    assert state_fingerprint(simulator.game) == expected